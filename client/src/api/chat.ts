@@ -1,5 +1,5 @@
 import { api } from './client';
-import type { ChatMessage } from '../types';
+import type { ChatHistoryPage } from '../types';
 
 export interface ChatRequest {
   message: string;
@@ -10,11 +10,13 @@ export const chatApi = {
   stream: (message: string, sessionId?: string) =>
     api.stream('/chat/stream', { message, session_id: sessionId }),
 
-  getHistory: (sessionId?: string) => {
-    const endpoint = sessionId
-      ? `/chat/history?session_id=${sessionId}`
-      : '/chat/history';
-    return api.get<ChatMessage[]>(endpoint);
+  getHistory: (params?: { session_id?: string; before_id?: number; limit?: number }) => {
+    const searchParams = new URLSearchParams();
+    if (params?.session_id) searchParams.append('session_id', params.session_id);
+    if (params?.before_id) searchParams.append('before_id', params.before_id.toString());
+    if (params?.limit) searchParams.append('limit', params.limit.toString());
+    const queryString = searchParams.toString();
+    return api.get<ChatHistoryPage>(`/chat/history${queryString ? `?${queryString}` : ''}`);
   },
 
   clearHistory: (sessionId: string) =>
@@ -102,11 +102,17 @@ export interface EquipmentListItem {
 }
 
 export interface ChatMessage {
+  id?: number;
   role: 'user' | 'model';
   content: string;
   timestamp?: Date;
 }
 
+export interface ChatHistoryPage {
+  items: ChatMessage[];
+  next_before_id: number | null;
+}
+
 export enum NavigationTab {
   Dashboard = 'dashboard',
   Inventory = 'inventory',
@@ -0,0 +1,24 @@
+"""add is_pooled to llm api keys
+
+Revision ID: 3e8b51c0d7a4
+Revises: 9d41c6e8b2f7
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e8b51c0d7a4'
+down_revision = '9d41c6e8b2f7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('llm_api_keys', sa.Column('is_pooled', sa.Boolean(), nullable=False, server_default=sa.false()))
+
+
+def downgrade() -> None:
+    op.drop_column('llm_api_keys', 'is_pooled')
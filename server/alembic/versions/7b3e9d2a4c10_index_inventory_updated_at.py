@@ -0,0 +1,27 @@
+"""index updated_at on inventory tables for the sync change feed
+
+Revision ID: 7b3e9d2a4c10
+Revises: 1c4f7a6c8c2e
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7b3e9d2a4c10'
+down_revision = '1c4f7a6c8c2e'
+branch_labels = None
+depends_on = None
+
+TABLES = ['device_items', 'vm_items', 'locations', 'equipment']
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(op.f(f'ix_{table}_updated_at'), table, ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(op.f(f'ix_{table}_updated_at'), table_name=table)
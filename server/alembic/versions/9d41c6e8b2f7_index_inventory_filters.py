@@ -0,0 +1,37 @@
+"""index device and VM list filter columns
+
+Revision ID: 9d41c6e8b2f7
+Revises: 7b3e9d2a4c10
+Create Date: 2026-10-19 11:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '9d41c6e8b2f7'
+down_revision = '7b3e9d2a4c10'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('device_items', 'hostname'),
+    ('device_items', 'ip_address'),
+    ('device_items', 'category'),
+    ('device_items', 'location_id'),
+    ('device_items', 'metric_group_id'),
+    ('device_items', 'status'),
+    ('vm_items', 'ip_address'),
+    ('vm_items', 'location_id'),
+    ('vm_items', 'metric_group_id'),
+]
+
+
+def upgrade() -> None:
+    for table, column in INDEXES:
+        op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+
+
+def downgrade() -> None:
+    for table, column in INDEXES:
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
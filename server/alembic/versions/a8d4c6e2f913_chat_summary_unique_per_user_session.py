@@ -0,0 +1,40 @@
+"""make chat session summaries unique per (user_id, session_id)
+
+Revision ID: a8d4c6e2f913
+Revises: e3c9a7d15b62
+Create Date: 2026-10-20 12:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8d4c6e2f913'
+down_revision = 'e3c9a7d15b62'
+branch_labels = None
+depends_on = None
+
+TABLE = 'chat_session_summaries'
+
+
+def _table_exists() -> bool:
+    # The table comes from init_db; a database that never started has nothing to change
+    context = op.get_context()
+    return context.as_sql or sa.inspect(op.get_bind()).has_table(TABLE)
+
+
+def upgrade() -> None:
+    if not _table_exists():
+        return
+    op.drop_index('ix_chat_session_summaries_session_id', table_name=TABLE)
+    with op.batch_alter_table(TABLE) as batch_op:
+        batch_op.create_unique_constraint('uq_chat_session_summaries_user_session', ['user_id', 'session_id'])
+
+
+def downgrade() -> None:
+    if not _table_exists():
+        return
+    with op.batch_alter_table(TABLE) as batch_op:
+        batch_op.drop_constraint('uq_chat_session_summaries_user_session', type_='unique')
+    op.create_index('ix_chat_session_summaries_session_id', TABLE, ['session_id'], unique=True)
@@ -0,0 +1,24 @@
+"""add prompt_version to monitoring uploads
+
+Revision ID: b62f0e9a1d35
+Revises: 3e8b51c0d7a4
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b62f0e9a1d35'
+down_revision = '3e8b51c0d7a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('monitoring_uploads', sa.Column('prompt_version', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('monitoring_uploads', 'prompt_version')
@@ -0,0 +1,32 @@
+"""index metric samples and alerts for chat tool queries
+
+Revision ID: c7a3e1f9d284
+Revises: b62f0e9a1d35
+Create Date: 2026-10-19 20:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7a3e1f9d284'
+down_revision = 'b62f0e9a1d35'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_metric_samples_device_key_time', 'metric_samples', ['device_item_id', 'metric_key', 'captured_at']),
+    ('ix_metric_samples_vm_key_time', 'metric_samples', ['vm_id', 'metric_key', 'captured_at']),
+    ('ix_metric_samples_key_time', 'metric_samples', ['metric_key', 'captured_at']),
+    ('ix_alerts_status_detected_at', 'alerts', ['status', 'detected_at']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for name, table, _ in INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,25 @@
+"""index chat history by user, session and time
+
+Revision ID: d5b8f2a61c47
+Revises: c7a3e1f9d284
+Create Date: 2026-10-19 22:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5b8f2a61c47'
+down_revision = 'c7a3e1f9d284'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_chat_history_user_session_time', 'chat_history', ['user_id', 'session_id', 'timestamp'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_history_user_session_time', table_name='chat_history')
@@ -0,0 +1,35 @@
+"""text_pattern_ops indexes for the ip_prefix list filter (PostgreSQL only)
+
+Revision ID: e3c9a7d15b62
+Revises: d5b8f2a61c47
+Create Date: 2026-10-20 10:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3c9a7d15b62'
+down_revision = 'd5b8f2a61c47'
+branch_labels = None
+depends_on = None
+
+TABLES = ['device_items', 'vm_items']
+
+
+def upgrade() -> None:
+    # Elsewhere (SQLite) the existing ix_<table>_ip_address index is all there is to use
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        op.create_index(
+            f'ix_{table}_ip_address_pattern', table, ['ip_address'], unique=False,
+            postgresql_ops={'ip_address': 'text_pattern_ops'},
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+    for table in TABLES:
+        op.drop_index(f'ix_{table}_ip_address_pattern', table_name=table)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Dict, Tuple
 
 
 class Settings(BaseSettings):
@@ -16,6 +17,82 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""
     ANTHROPIC_MODEL: str = "claude-3-5-sonnet-latest"
 
+    # Metric extraction output: provider-native JSON schema mode (services/extraction_schema.py)
+    LLM_STRUCTURED_OUTPUT: bool = True
+    LLM_EXTRACTION_MAX_TOKENS: int = 8192  # large dashboards produce long metric arrays
+
+    # Per-provider circuit breakers for metric extraction (utils/circuit_breaker.py)
+    LLM_BREAKER_WINDOW: int = 20
+    LLM_BREAKER_MIN_CALLS: int = 5
+    LLM_BREAKER_FAILURE_RATE: float = 0.5
+    LLM_BREAKER_SLOW_CALL_MS: float = 30000
+    LLM_BREAKER_OPEN_SECONDS: float = 60
+
+    # Per-key request rate and adaptive concurrency (utils/rate_limiter.py)
+    LLM_RATE_LIMIT_RPM: float = 60
+    LLM_RATE_LIMIT_BURST: int = 10
+    LLM_RATE_LIMIT_WORKERS: int = 1  # processes sharing the keys; each gets RPM and burst divided by this
+    LLM_CONCURRENCY_INITIAL: int = 4
+    LLM_CONCURRENCY_MAX: int = 16
+    LLM_RATE_LIMIT_WAIT_SECONDS: float = 60  # give up on a key (fail over) after waiting this long
+    LLM_RATE_LIMIT_RETRIES: int = 2  # retries on 429/overload before failing over
+
+    # Hedged extraction (utils/hedging.py): duplicate a slow call to the next provider
+    LLM_HEDGE_ENABLED: bool = False
+    LLM_HEDGE_PERCENTILE: float = 0.9
+    LLM_HEDGE_MIN_SAMPLES: int = 20
+    LLM_HEDGE_DEFAULT_DELAY_MS: float = 15000  # until enough latencies are recorded
+    LLM_HEDGE_MIN_DELAY_MS: float = 2000
+    LLM_HEDGE_BUDGET_PERCENT: float = 10
+    LLM_HEDGE_MAX_WORKERS: int = 8
+
+    # Model cascade (utils/cascade.py): a cheap model first, escalate doubtful results
+    LLM_CASCADE_ENABLED: bool = False
+    LLM_CASCADE_GEMINI_MODEL: str = "gemini-2.0-flash-lite"
+    LLM_CASCADE_OPENAI_MODEL: str = "gpt-4o-mini"
+    LLM_CASCADE_ANTHROPIC_MODEL: str = "claude-3-5-haiku-latest"
+    LLM_CASCADE_MIN_CONFIDENCE: float = 0.75  # overall and mean per-metric confidence
+    LLM_CASCADE_MAX_NULL_FRACTION: float = 0.34  # share of metrics read as null
+    LLM_CASCADE_STRONG_COST_RATIO: float = 10  # strong-model call cost in fast-call units, for reporting
+
+    # Offline provider stand-in (services/replay_service.py); LLM_PROVIDER=replay selects it
+    LLM_REPLAY_DIR: str = ""  # default: UPLOAD_DIR/llm_replay
+    LLM_REPLAY_RECORD: bool = False  # save live provider results for later replay
+    LLM_REPLAY_MISS: str = "synthetic"  # synthetic | error, for screenshots without a recording
+    LLM_REPLAY_LATENCY_MEDIAN_MS: float = 0
+    LLM_REPLAY_LATENCY_SIGMA: float = 0.5  # log-normal spread
+    LLM_REPLAY_ERROR_RATE: float = 0.0
+    LLM_REPLAY_ERROR_STATUSES: str = "429,503,500"
+    LLM_REPLAY_TOKEN_MS: float = 0  # delay between streamed chat tokens
+
+    # Chat assistant (routers/chat.py), streamed through the provider's async client
+    CHAT_PROVIDER: str = "gemini"
+    CHAT_MAX_TOKENS: int = 2048
+    # Context records picked per question from the local index (services/retrieval_index.py)
+    CHAT_RETRIEVAL_TOP_K: int = 12
+    CHAT_RETRIEVAL_SNIPPET_CHARS: int = 300  # per record in the prompt; the full text is indexed
+    CHAT_RETRIEVAL_ALERT_DAYS: int = 7  # resolved alerts stay searchable this long
+    CHAT_RETRIEVAL_REBUILD_SECONDS: int = 600  # full rebuild, picks up other workers' writes
+    # Read-only tools the chat model may call for live metrics and alerts (services/chat_tools.py)
+    CHAT_TOOLS_ENABLED: bool = True
+    CHAT_TOOL_MAX_ROUNDS: int = 4  # model turns that may call tools before it must answer
+    CHAT_TOOL_MAX_ROWS: int = 50  # per call
+    # Conversation memory (services/chat_memory.py): recent turns verbatim, older ones in a rolling summary
+    CHAT_HISTORY_TURNS: int = 6  # user/model exchanges sent verbatim
+    CHAT_SUMMARY_FOLD_TURNS: int = 4  # fold into the summary once this many more have piled up
+    CHAT_SUMMARY_MAX_CHARS: int = 1500
+    CHAT_SUMMARY_MESSAGE_CHARS: int = 1000  # per message sent to the summarizer
+
+    # Blocking work started from the event loop (utils/blocking.py)
+    BLOCKING_POOL_SIZE: int = 8  # chat context, tool queries, summary writes
+    EXTRACTION_POOL_SIZE: int = 4  # upload extraction, kept off the chat pool
+
+    # Per-call ledger (utils/llm_ledger.py)
+    LLM_LEDGER_ENABLED: bool = True
+    LLM_CALL_RETENTION_DAYS: int = 90
+    # USD per million input/output tokens by model-name prefix, merged over the built-in table
+    LLM_PRICES_PER_MTOK: Dict[str, Tuple[float, float]] = {}
+
     # Default to wide-open CORS in dev; override in .env for prod
     CORS_ORIGINS: list[str] = ["*"]
 
@@ -27,6 +104,44 @@ class Settings(BaseSettings):
 
     MONITORING_RETENTION_DAYS: int = 30
 
+    # Screenshot preprocessing before vision-model calls (services/image_preprocessing.py)
+    IMAGE_PREPROCESSING_ENABLED: bool = True
+    IMAGE_MAX_SIDE: int = 0  # 0 = per-provider default
+    IMAGE_FORMAT: str = "WEBP"  # WEBP | JPEG | PNG
+    IMAGE_QUALITY: int = 90
+    IMAGE_TRIM_BORDERS: bool = False
+
+    # Known dashboard layouts are read with local OCR before trying the LLM (services/template_extraction.py)
+    TEMPLATE_EXTRACTION_ENABLED: bool = True
+    TESSERACT_CMD: str = ""  # path to the tesseract binary if it is not on PATH
+
+    # Tall dashboards are split into strips extracted in parallel (services/image_tiling.py)
+    IMAGE_TILING_ENABLED: bool = False
+    IMAGE_TILE_MIN_HEIGHT: int = 1600
+    IMAGE_TILE_HEIGHT: int = 1000
+    IMAGE_TILE_OVERLAP: int = 120
+    IMAGE_TILE_HEADER_PX: int = 0  # repeat this many top pixels (table header) on every strip
+    IMAGE_TILE_CONCURRENCY: int = 4
+
+    # Serialized list responses kept in memory per worker (see utils/response_cache.py)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+
+    # Delete tombstones kept for the /sync change feed; older cursors get a full snapshot
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    # updated_at/deleted_at are stamped at flush, not commit: each poll re-reads this far behind the
+    # cursor so a transaction that committed late is still delivered (clients dedupe by id)
+    SYNC_SAFETY_LAG_SECONDS: int = 120
+
+    # Periodic jobs (utils/scheduler.py): only the lease holder runs them
+    SCHEDULER_ENABLED: bool = True
+    SCHEDULER_TICK_SECONDS: int = 30
+    SCHEDULER_LEASE_SECONDS: int = 90
+    SCHEDULER_RUN_HISTORY_DAYS: int = 30
+
+    # Responses smaller than this (bytes) are sent uncompressed
+    GZIP_MINIMUM_SIZE: int = 1024
+    GZIP_COMPRESS_LEVEL: int = 6
+
     SMTP_HOST: str = ""
     SMTP_PORT: int = 587
     SMTP_USER: str = ""
@@ -27,5 +27,5 @@ def get_db():
 
 
 def init_db():
-    from .models import user, equipment, manual, attachment, chat_history, location, device_item, vm_item, monitoring_upload, metric_definition, metric_group, metric_group_member, metric_sample, llm_api_key, llm_settings, alert_rule, alert, alert_update, team, user_team, alert_assignment
+    from .models import user, equipment, manual, attachment, chat_history, chat_session_summary, location, device_item, vm_item, monitoring_upload, metric_definition, metric_group, metric_group_member, metric_sample, llm_api_key, llm_settings, alert_rule, alert, alert_update, team, user_team, alert_assignment, resource_version, deleted_record, seed_version, scheduler_lease, scheduled_job, job_run, dashboard_template, llm_call
     Base.metadata.create_all(bind=engine)
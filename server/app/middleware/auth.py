@@ -5,7 +5,9 @@ from ..models.user import User
 from ..utils.security import decode_token
 
 
-async def get_current_user(
+# A plain def: FastAPI runs it in the threadpool, so the user lookup never
+# waits on the database from inside the event loop.
+def get_current_user(
     request: Request,
     db: Session = Depends(get_db)
 ) -> User:
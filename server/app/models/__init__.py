@@ -3,6 +3,7 @@ from .equipment import Equipment
 from .manual import ManualContent
 from .attachment import Attachment
 from .chat_history import ChatHistory
+from .chat_session_summary import ChatSessionSummary
 from .location import Location
 from .device_item import DeviceItem
 from .vm_item import VmItem
@@ -19,5 +20,13 @@ from .alert_update import AlertUpdate
 from .team import Team
 from .user_team import UserTeam
 from .alert_assignment import AlertAssignment
+from .resource_version import ResourceVersion
+from .deleted_record import DeletedRecord
+from .seed_version import SeedVersion
+from .scheduler_lease import SchedulerLease
+from .scheduled_job import ScheduledJob
+from .job_run import JobRun
+from .dashboard_template import DashboardTemplate
+from .llm_call import LlmCall
 
-__all__ = ["User", "Equipment", "ManualContent", "Attachment", "ChatHistory", "Location", "DeviceItem", "VmItem", "MonitoringUpload", "MetricDefinition", "MetricGroup", "MetricGroupMember", "MetricSample", "LlmApiKey", "LlmSettings", "AlertRule", "Alert", "AlertUpdate", "Team", "UserTeam", "AlertAssignment"]
+__all__ = ["User", "Equipment", "ManualContent", "Attachment", "ChatHistory", "ChatSessionSummary", "Location", "DeviceItem", "VmItem", "MonitoringUpload", "MetricDefinition", "MetricGroup", "MetricGroupMember", "MetricSample", "LlmApiKey", "LlmSettings", "AlertRule", "Alert", "AlertUpdate", "Team", "UserTeam", "AlertAssignment", "ResourceVersion", "DeletedRecord", "SeedVersion", "SchedulerLease", "ScheduledJob", "JobRun", "DashboardTemplate", "LlmCall"]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -6,6 +6,9 @@ from ..database import Base
 
 class Alert(Base):
     __tablename__ = "alerts"
+    __table_args__ = (
+        Index("ix_alerts_status_detected_at", "status", "detected_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     device_item_id = Column(Integer, ForeignKey("device_items.id"), nullable=True)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint
+from datetime import datetime
+from ..database import Base
+
+
+class ChatSessionSummary(Base):
+    """Rolling summary of the chat messages that fell out of the verbatim window (services/chat_memory.py)."""
+
+    __tablename__ = "chat_session_summaries"
+    # Session ids come from the client, so two users may share one.
+    __table_args__ = (UniqueConstraint("user_id", "session_id", name="uq_chat_session_summaries_user_session"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    session_id = Column(String, nullable=False)
+    summary = Column(Text, nullable=False, default="")
+    summarized_through_id = Column(Integer, nullable=False, default=0)  # last chat_history.id folded in
+    prompt_version = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, JSON, ForeignKey
+from datetime import datetime
+from ..database import Base
+
+
+class DashboardTemplate(Base):
+    __tablename__ = "dashboard_templates"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, nullable=False, unique=True)
+    match_label = Column(String, nullable=True, index=True)  # MonitoringUpload.dashboard_label, case-insensitive
+    match_grafana_url = Column(String, nullable=True, index=True)  # grafana_url of the device/VM
+    width = Column(Integer, nullable=False)  # reference screenshot size the regions were taken from
+    height = Column(Integer, nullable=False)
+    # [{"ip_address": "10.0.1.11", "key": "cpu_util", "unit": "%", "box": [x0, y0, x1, y1]}], box in 0..1 fractions
+    regions = Column(JSON, nullable=False, default=list)
+    is_enabled = Column(Boolean, nullable=False, default=True)
+    hits = Column(Integer, nullable=False, default=0)  # uploads read without the LLM
+    fallbacks = Column(Integer, nullable=False, default=0)  # validation failed, LLM used instead
+    source_upload_id = Column(Integer, ForeignKey("monitoring_uploads.id"), nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
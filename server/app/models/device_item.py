@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, Index, ForeignKey, DateTime, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -6,17 +6,23 @@ from ..database import Base
 
 class DeviceItem(Base):
     __tablename__ = "device_items"
+    __table_args__ = (
+        # ip_prefix list filter (LIKE 'x%'): the plain index only serves LIKE under the C collation
+        Index(
+            "ix_device_items_ip_address_pattern", "ip_address", postgresql_ops={"ip_address": "text_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # Basic Info
     device_name = Column(String, nullable=False)  # e.g., "Core Router 1"
-    hostname = Column(String, nullable=True)  # e.g., "FSL-DC-PUN-COR-RTR-01"
-    ip_address = Column(String, nullable=True)  # e.g., "10.0.11.11"
+    hostname = Column(String, nullable=True, index=True)  # e.g., "FSL-DC-PUN-COR-RTR-01"
+    ip_address = Column(String, nullable=True, index=True)  # e.g., "10.0.11.11"
     serial_number = Column(String, nullable=True)  # e.g., "957JL24"
 
     # Category - links to infrastructure type
-    category = Column(String, nullable=False)  # Network, Compute, Storage, Security, Backup
+    category = Column(String, nullable=False, index=True)  # Network, Compute, Storage, Security, Backup
 
     # Model Info - can be linked to Equipment or manual entry
     equipment_id = Column(Integer, ForeignKey("equipment.id"), nullable=True)
@@ -24,10 +30,10 @@ class DeviceItem(Base):
     version = Column(String, nullable=True)  # Firmware/OS version
 
     # Location
-    location_id = Column(Integer, ForeignKey("locations.id"), nullable=True)
+    location_id = Column(Integer, ForeignKey("locations.id"), nullable=True, index=True)
 
     grafana_url = Column(String, nullable=True)
-    metric_group_id = Column(Integer, ForeignKey("metric_groups.id"), nullable=True)
+    metric_group_id = Column(Integer, ForeignKey("metric_groups.id"), nullable=True, index=True)
 
     # Credentials (stored securely - consider encryption in production)
     username = Column(String, nullable=True)
@@ -36,10 +42,10 @@ class DeviceItem(Base):
     # Additional Info
     description = Column(Text, nullable=True)
     rack_position = Column(String, nullable=True)  # e.g., "Rack 1, U10-U12"
-    status = Column(String, default="Active")  # Active, Inactive, Maintenance, Decommissioned
+    status = Column(String, default="Active", index=True)  # Active, Inactive, Maintenance, Decommissioned
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     # Relationships
     equipment = relationship("Equipment", backref="device_items")
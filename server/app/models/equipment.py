@@ -36,7 +36,7 @@ class Equipment(Base):
     contact_number = Column(String, nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     manual = relationship("ManualContent", back_populates="equipment", uselist=False, cascade="all, delete-orphan")
     attachments = relationship("Attachment", back_populates="equipment", cascade="all, delete-orphan")
@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text
+from datetime import datetime
+from ..database import Base
+
+
+class JobRun(Base):
+    __tablename__ = "job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String, nullable=False, index=True)
+    worker = Column(String, nullable=False)
+    started_at = Column(DateTime, default=datetime.utcnow, index=True)
+    finished_at = Column(DateTime, nullable=True)
+    duration_ms = Column(Float, nullable=True)
+    status = Column(String, nullable=False, default="running")  # running | ok | error
+    error = Column(Text, nullable=True)
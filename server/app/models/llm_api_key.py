@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, Boolean
 from ..database import Base
 
 
@@ -10,4 +10,5 @@ class LlmApiKey(Base):
     provider = Column(String, nullable=False, index=True)
     label = Column(String, nullable=True)
     api_key = Column(String, nullable=False)
+    is_pooled = Column(Boolean, nullable=False, default=False)  # spread load with the provider's other pooled keys
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float, ForeignKey
+from datetime import datetime
+from ..database import Base
+
+
+class LlmCall(Base):
+    """One provider call made for an extraction (utils/llm_ledger.py)."""
+
+    __tablename__ = "llm_calls"
+
+    id = Column(Integer, primary_key=True, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    purpose = Column(String, nullable=False, default="metrics_extraction")
+    provider = Column(String, nullable=False, index=True)
+    model = Column(String, nullable=True, index=True)
+    key_ref = Column(String, nullable=True)  # breaker name, e.g. llm_key:3 or env:gemini
+    tier = Column(String, nullable=True)  # fast | strong (model cascade)
+    prompt_version = Column(String, nullable=True)
+    upload_id = Column(Integer, ForeignKey("monitoring_uploads.id"), nullable=True, index=True)
+    input_tokens = Column(Integer, nullable=True)
+    output_tokens = Column(Integer, nullable=True)
+    cached_input_tokens = Column(Integer, nullable=True)
+    latency_ms = Column(Float, nullable=True)
+    retries = Column(Integer, nullable=False, default=0)
+    outcome = Column(String, nullable=False)  # ok | partial | unparsed | rate_limited | throttled | error
+    error_type = Column(String, nullable=True)  # http_429, exception class name, ...
+    cost_usd = Column(Float, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -6,6 +6,12 @@ from ..database import Base
 
 class MetricSample(Base):
     __tablename__ = "metric_samples"
+    __table_args__ = (
+        # Latest sample per asset and key, and per-key windows (alert engine, chat tools)
+        Index("ix_metric_samples_device_key_time", "device_item_id", "metric_key", "captured_at"),
+        Index("ix_metric_samples_vm_key_time", "vm_id", "metric_key", "captured_at"),
+        Index("ix_metric_samples_key_time", "metric_key", "captured_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     device_item_id = Column(Integer, ForeignKey("device_items.id"), nullable=True)
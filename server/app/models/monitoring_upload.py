@@ -22,6 +22,7 @@ class MonitoringUpload(Base):
     parse_status = Column(String, default="pending")
     parse_confidence = Column(Float, nullable=True)
     parse_error = Column(Text, nullable=True)
+    prompt_version = Column(String, nullable=True)  # services/prompt_registry.py RenderedPrompt.version
     created_at = Column(DateTime, default=datetime.utcnow)
 
     device_item = relationship("DeviceItem", back_populates="monitoring_uploads")
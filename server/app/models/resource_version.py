@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from ..database import Base
+
+
+class ResourceVersion(Base):
+    __tablename__ = "resource_versions"
+
+    resource = Column(String, primary_key=True)  # table name, e.g. "device_items"
+    version = Column(Integer, nullable=False, default=0)  # bumped on every committed write
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime, Float
+from ..database import Base
+
+
+class ScheduledJob(Base):
+    __tablename__ = "scheduled_jobs"
+
+    name = Column(String, primary_key=True)
+    next_run_at = Column(DateTime, nullable=False)
+    last_run_at = Column(DateTime, nullable=True)
+    last_status = Column(String, nullable=True)  # ok | error
+    last_duration_ms = Column(Float, nullable=True)
+    run_count = Column(Integer, nullable=False, default=0)
+    failure_count = Column(Integer, nullable=False, default=0)
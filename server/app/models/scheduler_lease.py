@@ -0,0 +1,10 @@
+from sqlalchemy import Column, String, DateTime
+from ..database import Base
+
+
+class SchedulerLease(Base):
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, primary_key=True)  # e.g. "scheduler"
+    holder = Column(String, nullable=False)  # worker id: host:pid:nonce
+    expires_at = Column(DateTime, nullable=False)
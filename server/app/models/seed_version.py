@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from datetime import datetime
+from ..database import Base
+
+
+class SeedVersion(Base):
+    __tablename__ = "seed_versions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    fingerprint = Column(String, unique=True, nullable=False)  # sha256 of the seed data files
+    applied_at = Column(DateTime, default=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Index, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..database import Base
@@ -6,13 +6,19 @@ from ..database import Base
 
 class VmItem(Base):
     __tablename__ = "vm_items"
+    __table_args__ = (
+        # ip_prefix list filter (LIKE 'x%'): the plain index only serves LIKE under the C collation
+        Index(
+            "ix_vm_items_ip_address_pattern", "ip_address", postgresql_ops={"ip_address": "text_pattern_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
     vendor = Column(String, nullable=True)
     project = Column(String, nullable=True)
     tier = Column(String, nullable=True)
-    ip_address = Column(String, nullable=True)
+    ip_address = Column(String, nullable=True, index=True)
     hostname = Column(String, nullable=True)
     role = Column(String, nullable=True)
     os = Column(String, nullable=True)
@@ -21,12 +27,12 @@ class VmItem(Base):
     memory_gb = Column(String, nullable=True)
     host_ip = Column(String, nullable=True)
     vcpu = Column(String, nullable=True)
-    location_id = Column(Integer, ForeignKey("locations.id"), nullable=True)
+    location_id = Column(Integer, ForeignKey("locations.id"), nullable=True, index=True)
     grafana_url = Column(String, nullable=True)
-    metric_group_id = Column(Integer, ForeignKey("metric_groups.id"), nullable=True)
+    metric_group_id = Column(Integer, ForeignKey("metric_groups.id"), nullable=True, index=True)
 
     created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     location = relationship("Location", backref="vm_items")
     metric_group = relationship("MetricGroup", back_populates="vm_items")
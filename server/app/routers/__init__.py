@@ -11,6 +11,10 @@ from .metrics import router as metrics_router
 from .alerts import router as alerts_router
 from .teams import router as teams_router
 from .llm_config import router as llm_config_router
+from .sync import router as sync_router
+from .scheduler import router as scheduler_router
+from .dashboard_templates import router as dashboard_templates_router
+from .llm_calls import router as llm_calls_router
 
 __all__ = [
     "auth_router",
@@ -26,4 +30,8 @@ __all__ = [
     "alerts_router",
     "teams_router",
     "llm_config_router",
+    "sync_router",
+    "scheduler_router",
+    "dashboard_templates_router",
+    "llm_calls_router",
 ]
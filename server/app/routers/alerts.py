@@ -16,13 +16,15 @@ from ..schemas.alerts import (
 )
 from ..middleware.auth import get_current_user, require_admin
 from ..models.user import User
+from ..utils.responses import SchemaJSONResponse
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
 @router.get("/", response_model=List[AlertResponse])
 async def list_alerts(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(Alert).order_by(Alert.detected_at.desc()).limit(200).all()
+    alerts = db.query(Alert).order_by(Alert.detected_at.desc()).limit(200).all()
+    return SchemaJSONResponse(alerts, List[AlertResponse])
 
 
 @router.get("/rules", response_model=List[AlertRuleResponse])
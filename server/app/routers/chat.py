@@ -1,90 +1,108 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 import uuid
 from datetime import datetime
-from ..database import get_db
+from ..database import get_db, SessionLocal
 from ..models.user import User
-from ..models.equipment import Equipment
 from ..models.chat_history import ChatHistory
-from ..schemas.chat import ChatRequest, ChatMessage
+from ..models.chat_session_summary import ChatSessionSummary
+from ..models.metric_definition import MetricDefinition
+from ..schemas.chat import ChatRequest, ChatMessage, ChatHistoryPage
 from ..middleware.auth import get_current_user
-from ..services.gemini_service import GeminiService
+from ..services.llm_providers import create_provider
+from ..services.chat_memory import load_memory, update_summary
+from ..services.chat_tools import ChatToolbox, build_tools
+from ..services.prompt_registry import chat_prompt
+from ..services.retrieval_index import chat_context
+from ..utils.blocking import run_blocking
 from ..config import get_settings
 
 settings = get_settings()
 router = APIRouter(prefix="/chat", tags=["chat"])
 
 
+def _load_context(user_id: int, session_id: str, message: str):
+    """Prompt with the records matching the question and the session summary, chat tools and
+    the recent messages; runs on the blocking pool."""
+    db = SessionLocal()
+    try:
+        summary, history_messages = load_memory(db, user_id, session_id)
+        # Follow-ups ("and its firmware?") name their subject in the previous question
+        previous = next((m["content"] for m in reversed(history_messages) if m["role"] == "user"), "")
+        records, counts = chat_context(db, f"{message}\n{previous}")
+        prompt = chat_prompt(records, counts, settings.CHAT_RETRIEVAL_SNIPPET_CHARS, summary=summary)
+        tools = None
+        if settings.CHAT_TOOLS_ENABLED:
+            tools = ChatToolbox(build_tools([key for (key,) in db.query(MetricDefinition.key).order_by(MetricDefinition.id)]))
+        return prompt, tools, history_messages
+    finally:
+        db.close()
+
+
+def _save_message(user_id: int, session_id: str, role: str, content: str):
+    db = SessionLocal()
+    try:
+        db.add(ChatHistory(
+            user_id=user_id,
+            session_id=session_id,
+            role=role,
+            content=content,
+            timestamp=datetime.utcnow()
+        ))
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _persist_reply(user_id: int, session_id: str, reply: List[str]):
+    """Save the streamed reply, then fold old turns into the summary; runs after the response."""
+    if reply:
+        await run_blocking(_save_message, user_id, session_id, "model", "".join(reply))
+        await update_summary(user_id, session_id)
+
+
 @router.post("/stream")
 async def chat_stream(
     request: ChatRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    # Get current inventory for context
-    equipment_list = db.query(Equipment).all()
-    inventory_context = [
-        {
-            "id": eq.id,
-            "name": eq.name,
-            "vendor": eq.vendor,
-            "model": eq.model,
-            "area": eq.area,
-            "type": eq.type
-        }
-        for eq in equipment_list
-    ]
+    # Database work goes to the blocking pool: a SQLite commit waiting on the
+    # write lock would otherwise stall every stream on this event loop.
+    user_id = current_user.id
+    # get_db closes after the response, i.e. after the stream; give the
+    # connection the auth lookup checked out back to the pool now.
+    db.close()
 
     # Generate or use existing session ID
     session_id = request.session_id or str(uuid.uuid4())
 
-    # Get chat history for this session
-    history = db.query(ChatHistory).filter(
-        ChatHistory.session_id == session_id
-    ).order_by(ChatHistory.timestamp).all()
-
-    history_messages = [
-        {"role": msg.role, "content": msg.content}
-        for msg in history
-    ]
+    prompt, tools, history_messages = await run_blocking(_load_context, user_id, session_id, request.message)
 
     # Save user message
-    user_message = ChatHistory(
-        user_id=current_user.id,
-        session_id=session_id,
-        role="user",
-        content=request.message,
-        timestamp=datetime.utcnow()
-    )
-    db.add(user_message)
-    db.commit()
+    await run_blocking(_save_message, user_id, session_id, "user", request.message)
 
-    async def generate():
-        gemini = GeminiService()
-        full_response = ""
+    # The reply is saved by a background task once the response ends, also when
+    # the client disconnects mid-stream; the generator itself never writes.
+    reply: List[str] = []
+    background_tasks.add_task(_persist_reply, user_id, session_id, reply)
 
+    async def generate():
         try:
-            async for chunk in gemini.chat_stream(
+            # The first call imports the provider SDK
+            provider = await run_blocking(create_provider, settings.CHAT_PROVIDER)
+            async for chunk in provider.chat_stream(
                 message=request.message,
-                inventory=inventory_context,
+                prompt=prompt,
+                tools=tools,
                 history=history_messages
             ):
-                full_response += chunk
+                reply.append(chunk)
                 yield chunk
 
-            # Save model response after streaming completes
-            model_message = ChatHistory(
-                user_id=current_user.id,
-                session_id=session_id,
-                role="model",
-                content=full_response,
-                timestamp=datetime.utcnow()
-            )
-            db.add(model_message)
-            db.commit()
-
         except Exception as e:
             yield f"Error: {str(e)}"
 
@@ -92,32 +110,44 @@ async def chat_stream(
         generate(),
         media_type="text/plain",
         headers={
-            "X-Session-Id": session_id
+            "X-Session-Id": session_id,
+            # Keep GZipMiddleware from buffering the token stream
+            "Content-Encoding": "identity",
         }
     )
 
 
-@router.get("/history", response_model=List[ChatMessage])
+@router.get("/history", response_model=ChatHistoryPage)
 async def get_chat_history(
-    session_id: str = None,
+    session_id: Optional[str] = None,
+    before_id: Optional[int] = Query(None, description="next_before_id of the previous page"),
+    limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
+    """Newest messages first by page, each page in chronological order; follow next_before_id for older ones."""
     query = db.query(ChatHistory).filter(ChatHistory.user_id == current_user.id)
 
     if session_id:
         query = query.filter(ChatHistory.session_id == session_id)
-
-    messages = query.order_by(ChatHistory.timestamp).all()
-
-    return [
-        ChatMessage(
-            role=msg.role,
-            content=msg.content,
-            timestamp=msg.timestamp
-        )
-        for msg in messages
-    ]
+    if before_id:
+        query = query.filter(ChatHistory.id < before_id)
+
+    messages = query.order_by(ChatHistory.id.desc()).limit(limit + 1).all()
+    page = messages[:limit]
+
+    return ChatHistoryPage(
+        items=[
+            ChatMessage(
+                id=msg.id,
+                role=msg.role,
+                content=msg.content,
+                timestamp=msg.timestamp
+            )
+            for msg in reversed(page)
+        ],
+        next_before_id=page[-1].id if len(messages) > limit else None,
+    )
 
 
 @router.delete("/history/{session_id}")
@@ -130,5 +160,9 @@ async def clear_chat_history(
         ChatHistory.session_id == session_id,
         ChatHistory.user_id == current_user.id
     ).delete()
+    db.query(ChatSessionSummary).filter(
+        ChatSessionSummary.session_id == session_id,
+        ChatSessionSummary.user_id == current_user.id
+    ).delete()
     db.commit()
     return {"message": "Chat history cleared"}
@@ -0,0 +1,112 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List
+from ..database import get_db
+from ..models.user import User
+from ..models.dashboard_template import DashboardTemplate
+from ..models.monitoring_upload import MonitoringUpload
+from ..schemas.dashboard_template import (
+    DashboardTemplateCreate,
+    DashboardTemplateUpdate,
+    DashboardTemplateLearn,
+    DashboardTemplateResponse,
+)
+from ..middleware.auth import require_admin
+from ..services.template_extraction import learn_regions, TemplateLearningError
+
+router = APIRouter(prefix="/dashboard-templates", tags=["dashboard-templates"])
+
+
+def _ensure_unique_name(db: Session, name: str, template_id: int = None):
+    query = db.query(DashboardTemplate).filter(DashboardTemplate.name == name)
+    if template_id is not None:
+        query = query.filter(DashboardTemplate.id != template_id)
+    if query.first():
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Template name already exists")
+
+
+def _get_template(db: Session, template_id: int) -> DashboardTemplate:
+    template = db.query(DashboardTemplate).filter(DashboardTemplate.id == template_id).first()
+    if not template:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Template not found")
+    return template
+
+
+@router.get("/", response_model=List[DashboardTemplateResponse])
+async def list_templates(db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
+    return db.query(DashboardTemplate).order_by(DashboardTemplate.name).all()
+
+
+@router.post("/", response_model=DashboardTemplateResponse)
+async def create_template(
+    data: DashboardTemplateCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    _ensure_unique_name(db, data.name)
+    template = DashboardTemplate(**data.model_dump())
+    db.add(template)
+    db.commit()
+    db.refresh(template)
+    return template
+
+
+@router.post("/learn/{upload_id}", response_model=DashboardTemplateResponse)
+async def learn_template(
+    upload_id: int,
+    data: DashboardTemplateLearn,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """Build a template from a confirmed upload by locating its values on the screenshot."""
+    upload = db.query(MonitoringUpload).filter(MonitoringUpload.id == upload_id).first()
+    if not upload:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Upload not found")
+    if data.metrics is None and upload.parse_status != "ok":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Upload must be confirmed first")
+    _ensure_unique_name(db, data.name)
+
+    metrics = [m.model_dump() for m in data.metrics] if data.metrics is not None else (upload.extracted_metrics or [])
+    try:
+        geometry = learn_regions(upload.file_path, metrics)
+    except TemplateLearningError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    asset = upload.device_item or upload.vm_item
+    template = DashboardTemplate(
+        name=data.name,
+        match_label=data.match_label or upload.dashboard_label,
+        match_grafana_url=data.match_grafana_url or (asset.grafana_url if asset else None),
+        source_upload_id=upload.id,
+        **geometry,
+    )
+    db.add(template)
+    db.commit()
+    db.refresh(template)
+    return template
+
+
+@router.put("/{template_id}", response_model=DashboardTemplateResponse)
+async def update_template(
+    template_id: int,
+    data: DashboardTemplateUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    template = _get_template(db, template_id)
+    update_data = data.model_dump(exclude_unset=True)
+    if "name" in update_data:
+        _ensure_unique_name(db, update_data["name"], template_id)
+    for field, value in update_data.items():
+        setattr(template, field, value)
+    db.commit()
+    db.refresh(template)
+    return template
+
+
+@router.delete("/{template_id}")
+async def delete_template(template_id: int, db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
+    template = _get_template(db, template_id)
+    db.delete(template)
+    db.commit()
+    return {"message": "Template deleted"}
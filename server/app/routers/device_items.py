@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, UploadFile, File
 from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+from sqlalchemy import case
 from ..database import get_db
 from ..models.user import User
 from ..models.device_item import DeviceItem
@@ -12,60 +13,76 @@ from ..schemas.device_item import (
     DeviceItemResponse,
     DeviceItemListResponse,
 )
+from ..schemas.inventory_import import InventoryImportResponse
 from ..middleware.auth import get_current_user, require_admin
+from ..services.inventory_import import DEVICE_IMPORT, ImportFormatError, import_inventory
+from ..config import get_settings
+from ..utils.response_cache import response_cache
+from ..utils.list_query import ListQuery, ListParams
 
+settings = get_settings()
 router = APIRouter(prefix="/device-items", tags=["device-items"])
 
 
+DEVICE_LIST_QUERY = ListQuery(
+    DeviceItem,
+    {
+        "id": DeviceItem.id,
+        "device_name": DeviceItem.device_name,
+        "hostname": DeviceItem.hostname,
+        "ip_address": DeviceItem.ip_address,
+        "serial_number": DeviceItem.serial_number,
+        "category": DeviceItem.category,
+        # Model from equipment if linked, otherwise the direct model field
+        "model": case(
+            (Equipment.id.isnot(None), Equipment.vendor + " " + Equipment.model),
+            else_=DeviceItem.model
+        ),
+        "version": DeviceItem.version,
+        "status": DeviceItem.status,
+        "location_name": Location.name,
+        "equipment_name": Equipment.name,
+        "grafana_url": DeviceItem.grafana_url,
+        "metric_group_id": DeviceItem.metric_group_id,
+    },
+    joins=[
+        (Location, DeviceItem.location_id == Location.id),
+        (Equipment, DeviceItem.equipment_id == Equipment.id),
+    ],
+    search=["device_name", "hostname", "ip_address", "serial_number"],
+)
+
+
 @router.get("/", response_model=List[DeviceItemListResponse])
 async def list_device_items(
+    request: Request,
     category: Optional[str] = Query(None, description="Filter by category"),
     location_id: Optional[int] = Query(None, description="Filter by location"),
     status: Optional[str] = Query(None, description="Filter by status"),
+    metric_group_id: Optional[int] = Query(None, description="Filter by metric group"),
+    ip_prefix: Optional[str] = Query(None, description="Filter by IP address prefix, e.g. 10.4."),
+    params: ListParams = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get all device items with optional filters."""
-    query = db.query(DeviceItem).options(
-        joinedload(DeviceItem.location),
-        joinedload(DeviceItem.equipment)
-    )
-
+    """Get device items with optional filters, sorting, keyset paging and field selection."""
+    filters = []
     if category:
-        query = query.filter(DeviceItem.category == category)
+        filters.append(DeviceItem.category == category)
     if location_id:
-        query = query.filter(DeviceItem.location_id == location_id)
+        filters.append(DeviceItem.location_id == location_id)
     if status:
-        query = query.filter(DeviceItem.status == status)
-
-    items = query.all()
-
-    result = []
-    for item in items:
-        # Get model from equipment if linked, otherwise use direct model field
-        model = item.model
-        equipment_name = None
-        if item.equipment:
-            model = f"{item.equipment.vendor} {item.equipment.model}"
-            equipment_name = item.equipment.name
-
-        result.append({
-            "id": item.id,
-            "device_name": item.device_name,
-            "hostname": item.hostname,
-            "ip_address": item.ip_address,
-            "serial_number": item.serial_number,
-            "category": item.category,
-            "model": model,
-            "version": item.version,
-            "status": item.status,
-            "location_name": item.location.name if item.location else None,
-            "equipment_name": equipment_name,
-            "grafana_url": item.grafana_url,
-            "metric_group_id": item.metric_group_id,
-        })
-
-    return result
+        filters.append(DeviceItem.status == status)
+    if metric_group_id:
+        filters.append(DeviceItem.metric_group_id == metric_group_id)
+    if ip_prefix:
+        filters.append(DeviceItem.ip_address.startswith(ip_prefix, autoescape=True))
+
+    schema = List[Dict[str, Any]] if params.fields else List[DeviceItemListResponse]
+    return response_cache.respond(
+        request, db, ["device_items", "locations", "equipment"], schema,
+        lambda: DEVICE_LIST_QUERY.fetch(db, params, filters)
+    )
 
 
 @router.get("/categories")
@@ -163,17 +180,40 @@ async def create_device_items_bulk(
 
     db.commit()
 
-    # Refresh and reload with relationships
-    result = []
-    for item in created_items:
-        db.refresh(item)
-        item = db.query(DeviceItem).options(
-            joinedload(DeviceItem.location),
-            joinedload(DeviceItem.equipment)
-        ).filter(DeviceItem.id == item.id).first()
-        result.append(item)
-
-    return result
+    # Reload with relationships in one query
+    ids = [item.id for item in created_items]
+    items = db.query(DeviceItem).options(
+        joinedload(DeviceItem.location),
+        joinedload(DeviceItem.equipment)
+    ).filter(DeviceItem.id.in_(ids)).all()
+    by_id = {item.id: item for item in items}
+
+    return [by_id[item_id] for item_id in ids]
+
+
+@router.post("/import", response_model=InventoryImportResponse)
+async def import_device_items(
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """Create or update device items from a CSV/XLSX sheet (admin only).
+
+    Rows are matched on serial number, hostname + IP, hostname or IP. A
+    ``location_code`` column may be used instead of ``location_id``.
+    """
+    if file.size and file.size > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="File too large"
+        )
+    try:
+        return import_inventory(db, DEVICE_IMPORT, file.filename, file.file)
+    except ImportFormatError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
 @router.put("/{item_id}", response_model=DeviceItemResponse)
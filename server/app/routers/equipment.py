@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from typing import List
 from ..database import get_db
@@ -14,49 +15,53 @@ from ..schemas.equipment import (
 )
 from ..schemas.manual import ManualContentCreate
 from ..middleware.auth import get_current_user, require_admin
+from ..utils.response_cache import response_cache
 
 router = APIRouter(prefix="/equipment", tags=["equipment"])
 
+DOC_TYPES = ['pdf', 'docx', 'web']
+VIDEO_TYPES = ['video', 'youtube']
+
 
 @router.get("/", response_model=List[EquipmentListResponse])
 async def list_equipment(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    equipment_list = db.query(Equipment).all()
-    result = []
-
-    for eq in equipment_list:
-        # Get published attachments for this equipment
-        published_attachments = [att for att in eq.attachments if att.is_published]
-
-        doc_count = sum(1 for att in published_attachments if att.type in ['pdf', 'docx', 'web'])
-        video_count = sum(1 for att in published_attachments if att.type in ['video', 'youtube'])
-
-        # Get last updated date from most recent attachment
-        last_updated = None
-        if published_attachments:
-            last_updated = max(att.upload_date for att in published_attachments)
-
-        result.append({
-            "id": eq.id,
-            "name": eq.name,
-            "area": eq.area,
-            "type": eq.type,
-            "vendor": eq.vendor,
-            "model": eq.model,
-            "quantity": eq.quantity,
-            "sop_status": eq.sop_status,
-            "email": eq.email,
-            "phone": eq.phone,
-            "account_type": eq.account_type or "AUTO",
-            "security_level": eq.security_level or "LOW",
-            "doc_count": doc_count,
-            "video_count": video_count,
-            "last_updated": last_updated,
-        })
-
-    return result
+    def load():
+        # Published attachment counts per equipment, aggregated in the database
+        # so the listing is a single query regardless of inventory size.
+        stats = db.query(
+            Attachment.equipment_id.label("equipment_id"),
+            func.sum(case((Attachment.type.in_(DOC_TYPES), 1), else_=0)).label("doc_count"),
+            func.sum(case((Attachment.type.in_(VIDEO_TYPES), 1), else_=0)).label("video_count"),
+            func.max(Attachment.upload_date).label("last_updated"),
+        ).filter(
+            Attachment.is_published == True
+        ).group_by(Attachment.equipment_id).subquery()
+
+        rows = db.query(
+            Equipment.id,
+            Equipment.name,
+            Equipment.area,
+            Equipment.type,
+            Equipment.vendor,
+            Equipment.model,
+            Equipment.quantity,
+            Equipment.sop_status,
+            Equipment.email,
+            Equipment.phone,
+            func.coalesce(Equipment.account_type, "AUTO").label("account_type"),
+            func.coalesce(Equipment.security_level, "LOW").label("security_level"),
+            func.coalesce(stats.c.doc_count, 0).label("doc_count"),
+            func.coalesce(stats.c.video_count, 0).label("video_count"),
+            stats.c.last_updated,
+        ).outerjoin(stats, stats.c.equipment_id == Equipment.id).all()
+
+        return [dict(row._mapping) for row in rows]
+
+    return response_cache.respond(request, db, ["equipment", "attachments"], List[EquipmentListResponse], load)
 
 
 @router.get("/{equipment_id}", response_model=EquipmentResponse)
@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
+from ..database import get_db
+from ..models.user import User
+from ..models.llm_call import LlmCall
+from ..schemas.llm_call import LlmCallResponse, LlmUsageSummary, LlmModelUsage, LlmDailyCost, LlmErrorCount
+from ..middleware.auth import require_admin
+from ..utils.hedging import percentile
+from ..utils.responses import SchemaJSONResponse
+
+router = APIRouter(prefix="/llm-calls", tags=["llm-calls"])
+
+
+@router.get("/", response_model=List[LlmCallResponse])
+async def list_calls(
+    provider: Optional[str] = Query(None),
+    model: Optional[str] = Query(None),
+    outcome: Optional[str] = Query(None),
+    upload_id: Optional[int] = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    query = db.query(LlmCall)
+    if provider:
+        query = query.filter(LlmCall.provider == provider)
+    if model:
+        query = query.filter(LlmCall.model == model)
+    if outcome:
+        query = query.filter(LlmCall.outcome == outcome)
+    if upload_id:
+        query = query.filter(LlmCall.upload_id == upload_id)
+    calls = query.order_by(LlmCall.created_at.desc(), LlmCall.id.desc()).limit(limit).all()
+    return SchemaJSONResponse(calls, List[LlmCallResponse])
+
+
+@router.get("/summary", response_model=LlmUsageSummary)
+async def usage_summary(
+    days: int = Query(7, ge=1, le=90),
+    purpose: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    """Latency percentiles, token use, success rate and cost per provider/model, cost per day and errors by type."""
+    since = datetime.utcnow() - timedelta(days=days)
+    window = [LlmCall.created_at >= since]
+    if purpose:
+        window.append(LlmCall.purpose == purpose)
+
+    groups: Dict[Tuple[str, Optional[str]], List] = {}
+    rows = db.query(
+        LlmCall.provider, LlmCall.model, LlmCall.outcome, LlmCall.latency_ms,
+        LlmCall.input_tokens, LlmCall.output_tokens, LlmCall.cost_usd,
+    ).filter(*window)
+    for row in rows:
+        groups.setdefault((row.provider, row.model), []).append(row)
+
+    by_model = []
+    for (provider, model), calls in sorted(groups.items(), key=lambda item: -len(item[1])):
+        ok = [c for c in calls if c.outcome in ("ok", "partial")]
+        latencies = [c.latency_ms for c in ok if c.latency_ms is not None]
+        input_tokens = [c.input_tokens for c in calls if c.input_tokens is not None]
+        output_tokens = [c.output_tokens for c in calls if c.output_tokens is not None]
+        cost = sum(c.cost_usd or 0 for c in calls)
+        by_model.append(LlmModelUsage(
+            provider=provider,
+            model=model,
+            calls=len(calls),
+            ok_rate=len(ok) / len(calls),
+            p50_latency_ms=percentile(latencies, 0.5),
+            p95_latency_ms=percentile(latencies, 0.95),
+            avg_input_tokens=(sum(input_tokens) / len(input_tokens)) if input_tokens else None,
+            avg_output_tokens=(sum(output_tokens) / len(output_tokens)) if output_tokens else None,
+            cost_usd=cost,
+            cost_per_ok_call=(cost / len(ok)) if ok else None,
+        ))
+
+    day = func.date(LlmCall.created_at)
+    cost_by_day = [
+        LlmDailyCost(day=row.day, calls=row.calls, cost_usd=row.cost or 0.0)
+        for row in db.query(
+            day.label("day"), func.count(LlmCall.id).label("calls"), func.sum(LlmCall.cost_usd).label("cost")
+        ).filter(*window).group_by(day).order_by(day)
+    ]
+
+    errors = [
+        LlmErrorCount(provider=row.provider, error_type=row.error_type, outcome=row.outcome, count=row.count)
+        for row in db.query(
+            LlmCall.provider, LlmCall.error_type, LlmCall.outcome, func.count(LlmCall.id).label("count")
+        ).filter(*window, LlmCall.outcome.notin_(["ok", "partial"]))
+        .group_by(LlmCall.provider, LlmCall.error_type, LlmCall.outcome)
+        .order_by(func.count(LlmCall.id).desc())
+    ]
+
+    return LlmUsageSummary(
+        since=since,
+        calls=sum(m.calls for m in by_model),
+        cost_usd=sum(m.cost_usd for m in by_model),
+        by_model=by_model,
+        cost_by_day=cost_by_day,
+        errors=errors,
+    )
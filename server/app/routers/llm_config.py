@@ -6,8 +6,13 @@ from ..database import get_db
 from ..models.user import User
 from ..models.llm_api_key import LlmApiKey
 from ..models.llm_settings import LlmSettings
-from ..schemas.llm_config import LlmApiKeyCreate, LlmApiKeySummary, LlmConfigResponse, LlmSelectRequest, LlmApiKeyUpdate
+from ..schemas.llm_config import LlmApiKeyCreate, LlmApiKeySummary, LlmConfigResponse, LlmSelectRequest, LlmApiKeyUpdate, LlmProviderHealth, LlmHedgingStats, LlmCascadeStats
 from ..middleware.auth import get_current_user
+from ..services.metrics_extraction_service import MetricsExtractionService, KeyPool
+from ..utils.circuit_breaker import CircuitBreaker, peek_breaker
+from ..utils.cascade import cascade_stats
+from ..utils.hedging import hedge_stats
+from ..utils.rate_limiter import peek_limiter
 
 router = APIRouter(prefix="/llm-config", tags=["llm-config"])
 
@@ -45,7 +50,8 @@ async def get_llm_config(
             label=key.label,
             masked_key=mask_key(key.api_key),
             created_at=key.created_at,
-            is_selected=selected_key_id == key.id
+            is_selected=selected_key_id == key.id,
+            is_pooled=bool(key.is_pooled)
         ))
 
     return LlmConfigResponse(
@@ -68,7 +74,7 @@ async def add_llm_key(
     if not payload.api_key:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="API key required")
 
-    record = LlmApiKey(provider=provider, label=payload.label, api_key=payload.api_key)
+    record = LlmApiKey(provider=provider, label=payload.label, api_key=payload.api_key, is_pooled=payload.is_pooled)
     db.add(record)
     db.commit()
     db.refresh(record)
@@ -147,6 +153,49 @@ async def update_llm_key(
         key.api_key = payload.api_key.strip()
     if payload.label is not None:
         key.label = payload.label.strip() or None
+    if payload.is_pooled is not None:
+        key.is_pooled = payload.is_pooled
 
     db.commit()
     return await get_llm_config(db=db, current_user=current_user)
+
+
+@router.get("/health", response_model=List[LlmProviderHealth])
+async def get_provider_health(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Breaker and rate-limiter state of each provider in the failover chain (this worker only)."""
+    require_admin(current_user)
+    labels = {f"llm_key:{k.id}": (k.id, k.label) for k in db.query(LlmApiKey)}
+    health = []
+    for position, entry in enumerate(MetricsExtractionService().chain):
+        for slot in entry.members:
+            breaker = peek_breaker(slot.breaker_name) or CircuitBreaker(slot.breaker_name)
+            limiter = peek_limiter(slot.breaker_name)
+            key_id, label = labels.get(slot.breaker_name, (None, None))
+            health.append(LlmProviderHealth(
+                breaker=slot.breaker_name,
+                key_id=key_id,
+                provider=slot.provider,
+                label=label,
+                position=position,
+                pooled=isinstance(entry, KeyPool),
+                **breaker.snapshot(),
+                **(limiter.snapshot() if limiter else {})
+            ))
+    return health
+
+
+@router.get("/hedging", response_model=LlmHedgingStats)
+async def get_hedging_stats(current_user: User = Depends(get_current_user)):
+    """Hedge rate and p50/p99 with hedging vs. the first provider alone (this worker only)."""
+    require_admin(current_user)
+    return LlmHedgingStats(**hedge_stats.snapshot())
+
+
+@router.get("/cascade", response_model=LlmCascadeStats)
+async def get_cascade_stats(current_user: User = Depends(get_current_user)):
+    """Per-tier calls, escalation reasons, latency and relative cost (this worker only)."""
+    require_admin(current_user)
+    return LlmCascadeStats(**cascade_stats.snapshot())
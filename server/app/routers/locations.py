@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
 from typing import List
 from ..database import get_db
@@ -6,18 +6,22 @@ from ..models.user import User
 from ..models.location import Location
 from ..schemas.location import LocationCreate, LocationUpdate, LocationResponse
 from ..middleware.auth import get_current_user, require_admin
+from ..utils.response_cache import response_cache
 
 router = APIRouter(prefix="/locations", tags=["locations"])
 
 
 @router.get("/", response_model=List[LocationResponse])
 async def list_locations(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all locations."""
-    locations = db.query(Location).filter(Location.is_active == True).all()
-    return locations
+    return response_cache.respond(
+        request, db, ["locations"], List[LocationResponse],
+        lambda: db.query(Location).filter(Location.is_active == True).all()
+    )
 
 
 @router.get("/{location_id}", response_model=LocationResponse)
@@ -6,7 +6,7 @@ from ..models.equipment import Equipment
 from ..models.manual import ManualContent
 from ..schemas.manual import ManualContentResponse
 from ..middleware.auth import require_admin
-from ..services.gemini_service import GeminiService
+from ..services.llm_providers import create_provider
 
 router = APIRouter(prefix="/manuals", tags=["manuals"])
 
@@ -24,7 +24,7 @@ async def generate_manual(
             detail="Equipment not found"
         )
 
-    gemini = GeminiService()
+    gemini = create_provider("gemini")
 
     try:
         # Generate manual content using Gemini AI
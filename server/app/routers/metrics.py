@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..database import get_db
@@ -19,13 +19,18 @@ from ..schemas.metrics import (
 )
 from ..middleware.auth import get_current_user, require_admin
 from ..models.user import User
+from ..utils.response_cache import response_cache
+from ..utils.responses import SchemaJSONResponse
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
 
 @router.get("/definitions", response_model=List[MetricDefinitionResponse])
-async def list_definitions(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(MetricDefinition).all()
+async def list_definitions(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return response_cache.respond(
+        request, db, ["metric_definitions"], List[MetricDefinitionResponse],
+        lambda: db.query(MetricDefinition).all()
+    )
 
 
 @router.post("/definitions", response_model=MetricDefinitionResponse)
@@ -41,8 +46,11 @@ async def create_definition(data: MetricDefinitionCreate, db: Session = Depends(
 
 
 @router.get("/groups", response_model=List[MetricGroupResponse])
-async def list_groups(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(MetricGroup).all()
+async def list_groups(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return response_cache.respond(
+        request, db, ["metric_groups"], List[MetricGroupResponse],
+        lambda: db.query(MetricGroup).all()
+    )
 
 
 @router.post("/groups", response_model=MetricGroupResponse)
@@ -109,4 +117,5 @@ async def list_samples(
         query = query.filter(MetricSample.vm_id == vm_id)
     if metric_key:
         query = query.filter(MetricSample.metric_key == metric_key)
-    return query.order_by(MetricSample.captured_at.desc()).limit(500).all()
+    samples = query.order_by(MetricSample.captured_at.desc()).limit(500).all()
+    return SchemaJSONResponse(samples, List[MetricSampleResponse])
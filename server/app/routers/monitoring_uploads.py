@@ -13,8 +13,13 @@ from ..models.device_item import DeviceItem
 from ..models.vm_item import VmItem
 from ..schemas.monitoring_upload import MonitoringUploadResponse, MonitoringConfirmRequest, MonitoringUploadListResponse
 from ..middleware.auth import get_current_user
+from ..models.dashboard_template import DashboardTemplate
 from ..services.metrics_extraction_service import MetricsExtractionService
+from ..services.template_extraction import find_template, extract_with_template
+from ..services.prompt_registry import extraction_prompt
 from ..services.alert_engine import evaluate_sample
+from ..utils.responses import SchemaJSONResponse
+from ..utils.blocking import run_extraction
 from ..config import get_settings
 
 settings = get_settings()
@@ -28,12 +33,27 @@ def process_upload(upload_id: int):
         if not upload:
             return
 
-        extraction = MetricsExtractionService().extract_from_image(upload.file_path)
+        extraction = None
+        template = find_template(db, upload) if settings.TEMPLATE_EXTRACTION_ENABLED else None
+        if template:
+            extraction = extract_with_template(template, upload.file_path)
+            counter = DashboardTemplate.hits if extraction else DashboardTemplate.fallbacks
+            db.query(DashboardTemplate).filter(DashboardTemplate.id == template.id).update(
+                {counter: counter + 1}, synchronize_session=False
+            )
+        if extraction is None:
+            prompt = extraction_prompt(db, upload)
+            extraction = MetricsExtractionService(upload_id=upload.id).extract_from_image(
+                upload.file_path, prompt=prompt
+            )
+            upload.prompt_version = prompt.version
+        else:
+            upload.prompt_version = None
         metrics = extraction.get("metrics", [])
         upload.raw_text = extraction.get("raw_text")
         upload.parse_status = "ready" if extraction.get("status", "ok") == "ok" else "error"
         upload.parse_confidence = extraction.get("confidence")
-        upload.parse_error = extraction.get("error")
+        upload.parse_error = extraction.get("error") or extraction.get("warning")
         upload.extracted_metrics = metrics
         if extraction.get("capture_time"):
             upload.capture_time = extraction.get("capture_time")
@@ -96,10 +116,14 @@ async def upload_monitoring_screenshot(
     db.add(upload)
     db.commit()
     db.refresh(upload)
+    response = MonitoringUploadResponse.model_validate(upload)
+    # get_db closes only after the background task; return the connection before extraction needs its own.
+    db.close()
 
-    background_tasks.add_task(process_upload, upload.id)
+    # Extraction blocks on provider calls and rate-limiter waits; keep it off Starlette's shared threadpool.
+    background_tasks.add_task(run_extraction, process_upload, response.id)
 
-    return upload
+    return response
 
 
 @router.get("/", response_model=MonitoringUploadListResponse)
@@ -119,7 +143,10 @@ async def list_uploads(
     total = query.count()
     offset = (page - 1) * limit
     items = query.order_by(MonitoringUpload.created_at.desc()).offset(offset).limit(limit).all()
-    return {"items": items, "total": total, "page": page, "limit": limit}
+    return SchemaJSONResponse(
+        {"items": items, "total": total, "page": page, "limit": limit},
+        MonitoringUploadListResponse,
+    )
 
 
 @router.get("/{upload_id}", response_model=MonitoringUploadResponse)
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from ..database import get_db
+from ..models.user import User
+from ..models.job_run import JobRun
+from ..models.scheduled_job import ScheduledJob
+from ..models.scheduler_lease import SchedulerLease
+from ..schemas.scheduler import SchedulerStatusResponse, ScheduledJobResponse, JobRunResponse
+from ..middleware.auth import require_admin
+from ..utils.scheduler import scheduler, LEADER_LEASE
+
+router = APIRouter(prefix="/scheduler", tags=["scheduler"])
+
+
+@router.get("/jobs", response_model=SchedulerStatusResponse)
+async def list_jobs(db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
+    lease = db.get(SchedulerLease, LEADER_LEASE)
+    rows = {row.name: row for row in db.query(ScheduledJob)}
+    jobs = []
+    for job in scheduler.jobs.values():
+        row = rows.get(job.name)
+        jobs.append(ScheduledJobResponse(
+            name=job.name,
+            schedule=job.schedule,
+            next_run_at=row.next_run_at if row else None,
+            last_run_at=row.last_run_at if row else None,
+            last_status=row.last_status if row else None,
+            last_duration_ms=row.last_duration_ms if row else None,
+            run_count=row.run_count if row else 0,
+            failure_count=row.failure_count if row else 0,
+        ))
+    return SchedulerStatusResponse(
+        worker=scheduler.worker_id,
+        leader=lease.holder if lease else None,
+        leader_expires_at=lease.expires_at if lease else None,
+        jobs=jobs,
+    )
+
+
+@router.get("/runs", response_model=List[JobRunResponse])
+async def list_runs(
+    job_name: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin)
+):
+    query = db.query(JobRun)
+    if job_name:
+        query = query.filter(JobRun.job_name == job_name)
+    return query.order_by(JobRun.started_at.desc()).limit(limit).all()
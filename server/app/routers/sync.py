@@ -0,0 +1,89 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from ..database import get_db
+from ..models.user import User
+from ..models.device_item import DeviceItem
+from ..models.vm_item import VmItem
+from ..models.location import Location
+from ..models.equipment import Equipment
+from ..models.deleted_record import DeletedRecord
+from ..schemas.sync import SyncChangesResponse
+from ..middleware.auth import get_current_user
+from ..config import get_settings
+
+settings = get_settings()
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+SYNC_MODELS = {
+    "device_items": DeviceItem,
+    "vm_items": VmItem,
+    "locations": Location,
+    "equipment": Equipment,
+}
+
+@router.get("/changes", response_model=SyncChangesResponse)
+async def get_changes(
+    since: Optional[str] = Query(None, description="Cursor returned by the previous call; omit for a full snapshot"),
+    resources: Optional[str] = Query(None, description="Comma-separated subset of device_items, vm_items, locations, equipment"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Rows created, updated or deleted since the cursor, for keeping a client-side replica.
+
+    Consecutive responses overlap by SYNC_SAFETY_LAG_SECONDS: apply upserts
+    and deletes by id, and expect to see some of them twice.
+    """
+    names = [r.strip() for r in resources.split(",") if r.strip()] if resources else list(SYNC_MODELS)
+    unknown = [n for n in names if n not in SYNC_MODELS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown resources: {', '.join(unknown)}"
+        )
+
+    since_dt = None
+    if since:
+        try:
+            since_dt = datetime.fromisoformat(since.replace("Z", "+00:00"))
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+        if since_dt.tzinfo is not None:
+            # Timestamps are stored as naive UTC
+            since_dt = since_dt.astimezone(timezone.utc).replace(tzinfo=None)
+
+    # The next cursor is taken before reading, so nothing written during this
+    # call falls between two polls; it is returned even when nothing changed.
+    now = datetime.utcnow()
+
+    # Tombstones older than the retention window are purged, so an older cursor
+    # could miss deletes: fall back to a full snapshot.
+    horizon = now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    full = since_dt is None or since_dt < horizon
+
+    # Rows are stamped when flushed but become visible when committed, so a
+    # transaction can commit after a cursor was issued with an older stamp.
+    # Re-read SYNC_SAFETY_LAG_SECONDS behind the cursor; upserts and deletes
+    # are idempotent, so the overlap is harmless to a replica keyed by id.
+    window_start = since_dt - timedelta(seconds=settings.SYNC_SAFETY_LAG_SECONDS) if since_dt else None
+
+    result = {"full": full}
+    for name in names:
+        model = SYNC_MODELS[name]
+        query = db.query(model)
+        if not full:
+            query = query.filter(model.updated_at > window_start)
+        rows = query.order_by(model.updated_at).all()
+
+        deleted = []
+        if not full:
+            deleted = [record_id for (record_id,) in db.query(DeletedRecord.record_id).filter(
+                DeletedRecord.resource == name,
+                DeletedRecord.deleted_at > window_start
+            )]
+
+        result[name] = {"upserted": rows, "deleted": deleted}
+
+    result["cursor"] = now.isoformat()
+    return result
@@ -1,18 +1,54 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, UploadFile, File
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, Dict, List, Optional
 from ..database import get_db
 from ..models.vm_item import VmItem
 from ..schemas.vm_item import VmItemCreate, VmItemUpdate, VmItemResponse
+from ..schemas.inventory_import import InventoryImportResponse
 from ..middleware.auth import get_current_user, require_admin
+from ..services.inventory_import import VM_IMPORT, ImportFormatError, import_inventory
+from ..config import get_settings
 from ..models.user import User
+from ..utils.response_cache import response_cache
+from ..utils.list_query import ListQuery, ListParams
 
+settings = get_settings()
 router = APIRouter(prefix="/vm-items", tags=["vm-items"])
 
 
+VM_LIST_QUERY = ListQuery(
+    VmItem,
+    {name: getattr(VmItem, name) for name in VmItemResponse.model_fields},
+    search=["name", "hostname", "ip_address", "project", "role"],
+)
+
+
 @router.get("/", response_model=List[VmItemResponse])
-async def list_vms(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return db.query(VmItem).all()
+async def list_vms(
+    request: Request,
+    location_id: Optional[int] = Query(None),
+    metric_group_id: Optional[int] = Query(None),
+    project: Optional[str] = Query(None),
+    tier: Optional[str] = Query(None),
+    ip_prefix: Optional[str] = Query(None, description="Filter by IP address prefix, e.g. 10.4."),
+    params: ListParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    filters = []
+    if location_id:
+        filters.append(VmItem.location_id == location_id)
+    if metric_group_id:
+        filters.append(VmItem.metric_group_id == metric_group_id)
+    if project:
+        filters.append(VmItem.project == project)
+    if tier:
+        filters.append(VmItem.tier == tier)
+    if ip_prefix:
+        filters.append(VmItem.ip_address.startswith(ip_prefix, autoescape=True))
+
+    schema = List[Dict[str, Any]] if params.fields else List[VmItemResponse]
+    return response_cache.respond(request, db, ["vm_items"], schema, lambda: VM_LIST_QUERY.fetch(db, params, filters))
 
 
 @router.get("/{vm_id}", response_model=VmItemResponse)
@@ -32,6 +68,17 @@ async def create_vm(data: VmItemCreate, db: Session = Depends(get_db), current_u
     return vm
 
 
+@router.post("/import", response_model=InventoryImportResponse)
+async def import_vms(file: UploadFile = File(...), db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
+    """Create or update VMs from a CSV/XLSX sheet, matched on hostname + IP, IP, hostname or name."""
+    if file.size and file.size > settings.MAX_UPLOAD_SIZE:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large")
+    try:
+        return import_inventory(db, VM_IMPORT, file.filename, file.file)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
 @router.put("/{vm_id}", response_model=VmItemResponse)
 async def update_vm(vm_id: int, data: VmItemUpdate, db: Session = Depends(get_db), current_user: User = Depends(require_admin)):
     vm = db.query(VmItem).filter(VmItem.id == vm_id).first()
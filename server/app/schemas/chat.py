@@ -1,9 +1,10 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 
 class ChatMessage(BaseModel):
+    id: Optional[int] = None
     role: str  # user, model
     content: str
     timestamp: Optional[datetime] = None
@@ -12,3 +13,8 @@ class ChatMessage(BaseModel):
 class ChatRequest(BaseModel):
     message: str
     session_id: Optional[str] = None
+
+
+class ChatHistoryPage(BaseModel):
+    items: List[ChatMessage]
+    next_before_id: Optional[int] = None  # pass as before_id for older messages; None on the last page
@@ -0,0 +1,55 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, List
+from .monitoring_upload import MonitoringMetricEdit
+
+
+class TemplateRegion(BaseModel):
+    ip_address: Optional[str] = None
+    key: str
+    unit: Optional[str] = None
+    box: List[float] = Field(..., min_length=4, max_length=4)  # x0, y0, x1, y1 as 0..1 fractions
+
+
+class DashboardTemplateCreate(BaseModel):
+    name: str
+    match_label: Optional[str] = None
+    match_grafana_url: Optional[str] = None
+    width: int = Field(..., gt=0)
+    height: int = Field(..., gt=0)
+    regions: List[TemplateRegion]
+    is_enabled: bool = True
+
+
+class DashboardTemplateUpdate(BaseModel):
+    name: Optional[str] = None
+    match_label: Optional[str] = None
+    match_grafana_url: Optional[str] = None
+    regions: Optional[List[TemplateRegion]] = None
+    is_enabled: Optional[bool] = None
+
+
+class DashboardTemplateLearn(BaseModel):
+    name: str
+    match_label: Optional[str] = None  # defaults to the upload's dashboard_label
+    match_grafana_url: Optional[str] = None
+    metrics: Optional[List[MonitoringMetricEdit]] = None  # confirmed values; defaults to the upload's extracted metrics
+
+
+class DashboardTemplateResponse(BaseModel):
+    id: int
+    name: str
+    match_label: Optional[str] = None
+    match_grafana_url: Optional[str] = None
+    width: int
+    height: int
+    regions: List[TemplateRegion]
+    is_enabled: bool
+    hits: int
+    fallbacks: int
+    source_upload_id: Optional[int] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class ImportRowError(BaseModel):
+    row: int  # spreadsheet row number, header is row 1
+    error: str
+
+
+class InventoryImportResponse(BaseModel):
+    total: int
+    created: int
+    updated: int
+    unchanged: int
+    errors: List[ImportRowError] = []
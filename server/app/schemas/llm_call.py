@@ -0,0 +1,61 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from typing import Optional, List
+
+
+class LlmCallResponse(BaseModel):
+    id: int
+    created_at: datetime
+    purpose: str
+    provider: str
+    model: Optional[str] = None
+    key_ref: Optional[str] = None
+    tier: Optional[str] = None
+    prompt_version: Optional[str] = None
+    upload_id: Optional[int] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    cached_input_tokens: Optional[int] = None
+    latency_ms: Optional[float] = None
+    retries: int
+    outcome: str
+    error_type: Optional[str] = None
+    cost_usd: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+
+class LlmModelUsage(BaseModel):
+    provider: str
+    model: Optional[str] = None
+    calls: int
+    ok_rate: float
+    p50_latency_ms: Optional[float] = None
+    p95_latency_ms: Optional[float] = None
+    avg_input_tokens: Optional[float] = None
+    avg_output_tokens: Optional[float] = None
+    cost_usd: float
+    cost_per_ok_call: Optional[float] = None
+
+
+class LlmDailyCost(BaseModel):
+    day: date
+    calls: int
+    cost_usd: float
+
+
+class LlmErrorCount(BaseModel):
+    provider: str
+    error_type: Optional[str] = None
+    outcome: str
+    count: int
+
+
+class LlmUsageSummary(BaseModel):
+    since: datetime
+    calls: int
+    cost_usd: float
+    by_model: List[LlmModelUsage]
+    cost_by_day: List[LlmDailyCost]
+    errors: List[LlmErrorCount]
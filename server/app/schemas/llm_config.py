@@ -1,12 +1,13 @@
 from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 
 class LlmApiKeyCreate(BaseModel):
     provider: str
     api_key: str
     label: Optional[str] = None
+    is_pooled: bool = False
 
 
 class LlmApiKeySummary(BaseModel):
@@ -16,6 +17,7 @@ class LlmApiKeySummary(BaseModel):
     masked_key: str
     created_at: datetime
     is_selected: bool
+    is_pooled: bool = False
 
 
 class LlmConfigResponse(BaseModel):
@@ -24,6 +26,26 @@ class LlmConfigResponse(BaseModel):
     keys: List[LlmApiKeySummary]
 
 
+class LlmProviderHealth(BaseModel):
+    breaker: str  # "llm_key:<id>" or "env:<provider>"
+    key_id: Optional[int] = None
+    provider: str
+    label: Optional[str] = None
+    position: int  # order in the failover chain
+    pooled: bool = False
+    state: str  # closed | open | half_open
+    calls: int
+    failure_rate: float
+    avg_latency_ms: Optional[float] = None
+    retry_in_seconds: Optional[float] = None
+    last_error: Optional[str] = None
+    concurrency_limit: Optional[int] = None
+    in_flight: int = 0
+    requests: int = 0
+    throttled: int = 0  # 429/overload responses seen
+    paused_for_seconds: Optional[float] = None  # honouring Retry-After
+
+
 class LlmSelectRequest(BaseModel):
     key_id: int
 
@@ -31,3 +53,34 @@ class LlmSelectRequest(BaseModel):
 class LlmApiKeyUpdate(BaseModel):
     api_key: Optional[str] = None
     label: Optional[str] = None
+    is_pooled: Optional[bool] = None
+
+
+class LlmHedgingStats(BaseModel):
+    enabled: bool
+    requests: int
+    hedges: int
+    hedge_wins: int
+    hedge_rate: float
+    budget_percent: float
+    observed_p50_ms: Optional[float] = None
+    observed_p99_ms: Optional[float] = None
+    primary_p50_ms: Optional[float] = None  # what the first provider alone would have taken
+    primary_p99_ms: Optional[float] = None
+
+
+class LlmCascadeStats(BaseModel):
+    enabled: bool
+    requests: int
+    fast_calls: int
+    strong_calls: int
+    accepted_fast: int
+    accepted_strong: int
+    escalations: Dict[str, int]  # reason -> count
+    escalation_rate: float
+    cost_per_request: Optional[float] = None  # in fast-call units
+    strong_only_cost_per_request: float
+    fast_p50_ms: Optional[float] = None
+    strong_p50_ms: Optional[float] = None
+    total_p50_ms: Optional[float] = None
+    total_p99_ms: Optional[float] = None
@@ -19,6 +19,7 @@ class MonitoringUploadResponse(BaseModel):
     parse_status: str
     parse_confidence: Optional[float] = None
     parse_error: Optional[str] = None
+    prompt_version: Optional[str] = None
     created_at: datetime
 
     class Config:
@@ -0,0 +1,35 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+
+
+class ScheduledJobResponse(BaseModel):
+    name: str
+    schedule: str
+    next_run_at: Optional[datetime] = None
+    last_run_at: Optional[datetime] = None
+    last_status: Optional[str] = None
+    last_duration_ms: Optional[float] = None
+    run_count: int = 0
+    failure_count: int = 0
+
+
+class SchedulerStatusResponse(BaseModel):
+    worker: str
+    leader: Optional[str] = None
+    leader_expires_at: Optional[datetime] = None
+    jobs: List[ScheduledJobResponse]
+
+
+class JobRunResponse(BaseModel):
+    id: int
+    job_name: str
+    worker: str
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_ms: Optional[float] = None
+    status: str
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
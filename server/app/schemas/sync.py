@@ -0,0 +1,76 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional, List
+from .location import LocationResponse
+from .vm_item import VmItemResponse
+
+
+class DeviceItemSyncRow(BaseModel):
+    id: int
+    device_name: str
+    hostname: Optional[str] = None
+    ip_address: Optional[str] = None
+    serial_number: Optional[str] = None
+    category: str
+    equipment_id: Optional[int] = None
+    model: Optional[str] = None
+    version: Optional[str] = None
+    location_id: Optional[int] = None
+    grafana_url: Optional[str] = None
+    metric_group_id: Optional[int] = None
+    rack_position: Optional[str] = None
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class EquipmentSyncRow(BaseModel):
+    id: int
+    name: str
+    area: str
+    type: str
+    vendor: str
+    model: str
+    quantity: str
+    sop_status: str
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    account_type: Optional[str] = None
+    security_level: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class DeviceItemChanges(BaseModel):
+    upserted: List[DeviceItemSyncRow] = []
+    deleted: List[int] = []
+
+
+class VmItemChanges(BaseModel):
+    upserted: List[VmItemResponse] = []
+    deleted: List[int] = []
+
+
+class LocationChanges(BaseModel):
+    upserted: List[LocationResponse] = []
+    deleted: List[int] = []
+
+
+class EquipmentChanges(BaseModel):
+    upserted: List[EquipmentSyncRow] = []
+    deleted: List[int] = []
+
+
+class SyncChangesResponse(BaseModel):
+    cursor: str
+    full: bool  # True when the client must replace its replica instead of merging
+    device_items: Optional[DeviceItemChanges] = None
+    vm_items: Optional[VmItemChanges] = None
+    locations: Optional[LocationChanges] = None
+    equipment: Optional[EquipmentChanges] = None
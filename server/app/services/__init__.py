@@ -1,3 +1,10 @@
-from .gemini_service import GeminiService
+from .llm_providers import create_provider, get_provider_class
 
-__all__ = ["GeminiService"]
+__all__ = ["GeminiService", "create_provider", "get_provider_class"]
+
+
+def __getattr__(name):
+    # Keep `from app.services import GeminiService` working without importing it eagerly.
+    if name == "GeminiService":
+        return get_provider_class("gemini")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
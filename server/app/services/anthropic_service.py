@@ -1,10 +1,17 @@
-from typing import Dict, Any
+from typing import AsyncGenerator, Dict, Any, List
 import base64
-import json
-import mimetypes
-import re
 
 from ..config import get_settings
+from .llm_providers import provider_error_details
+from .extraction_schema import (
+    EXTRACTION_SCHEMA,
+    EXTRACTION_TOOL_NAME,
+    normalize_extraction,
+    parse_extraction,
+)
+from .image_preprocessing import prepare_image
+from .prompt_registry import RenderedPrompt, chat_turns, extraction_prompt
+from .chat_tools import ChatToolbox, result_json
 
 settings = get_settings()
 
@@ -15,47 +22,119 @@ from typing import Optional
 class AnthropicService:
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
         from anthropic import Anthropic
-        self.client = Anthropic(api_key=api_key or settings.ANTHROPIC_API_KEY)
+        self.api_key = api_key or settings.ANTHROPIC_API_KEY
+        self.client = Anthropic(api_key=self.api_key)
         self.model_name = model_name or settings.ANTHROPIC_MODEL
+        self._async_client = None
 
-    def extract_metrics_from_image(self, file_path: str) -> Dict[str, Any]:
-        prompt = """
-        Extract metrics from this monitoring dashboard screenshot.
-        If multiple hosts/VMs are present, return a COMPLETE row per host/VM IP with all metric keys.
-        For each IP, always include cpu_util, ram_util, disk_util, net_in, net_out (use null if not visible).
-        Return JSON ONLY in this format:
-        {
-          "metrics": [
-            {"ip_address": "10.0.1.11", "key": "cpu_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "ram_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "disk_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "net_in", "value": null, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "net_out", "value": null, "unit": "%", "confidence": 0.0}
-          ],
-          "raw_text": "...",
-          "confidence": 0.0,
-          "status": "ok",
-          "capture_time": null
-        }
-        Use keys cpu_util, ram_util, disk_util, net_in, net_out only.
-        If a metric is not visible for an IP, set value to null (do not guess).
+    @property
+    def async_client(self):
+        """AsyncAnthropic for callers on the event loop; created on first use."""
+        if self._async_client is None:
+            from anthropic import AsyncAnthropic
+            self._async_client = AsyncAnthropic(api_key=self.api_key)
+        return self._async_client
+
+    async def chat_stream(
+        self,
+        message: str,
+        prompt: RenderedPrompt,
+        history: List[Dict[str, str]],
+        tools: Optional[ChatToolbox] = None
+    ) -> AsyncGenerator[str, None]:
+        """Stream a chat answer; ``prompt`` is the rendered chat_assistant prompt.
+
+        With ``tools``, tool_use blocks are run and answered with tool_result
+        blocks, for up to CHAT_TOOL_MAX_ROUNDS rounds.
         """
+        messages = [
+            {"role": "assistant" if turn["role"] == "model" else "user", "content": turn["content"]}
+            for turn in chat_turns(history, message)
+        ]
         try:
-            mime_type, _ = mimetypes.guess_type(file_path)
-            mime_type = mime_type or "image/png"
-            with open(file_path, "rb") as f:
-                image_bytes = f.read()
+            for round_number in range(settings.CHAT_TOOL_MAX_ROUNDS + 1):
+                options = {}
+                if tools is not None:
+                    options["tools"] = [
+                        {"name": d["name"], "description": d["description"], "input_schema": d["parameters"]}
+                        for d in tools.definitions
+                    ]
+                    if round_number == settings.CHAT_TOOL_MAX_ROUNDS:
+                        options["tool_choice"] = {"type": "none"}
+                async with self.async_client.messages.stream(
+                    model=self.model_name,
+                    max_tokens=settings.CHAT_MAX_TOKENS,
+                    system=[
+                        {"type": "text", "text": prompt.system, "cache_control": {"type": "ephemeral"}},
+                        {"type": "text", "text": prompt.user},
+                    ],
+                    messages=messages,
+                    **options,
+                ) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+                    final = await stream.get_final_message()
+                tool_uses = [block for block in final.content if block.type == "tool_use"]
+                if not tool_uses:
+                    return
+                messages.append({
+                    "role": "assistant",
+                    "content": [
+                        {"type": "text", "text": block.text} if block.type == "text"
+                        else {"type": "tool_use", "id": block.id, "name": block.name, "input": block.input}
+                        for block in final.content
+                        if block.type == "tool_use" or (block.type == "text" and block.text)
+                    ],
+                })
+                results = []
+                for block in tool_uses:
+                    result = await tools.call(block.name, block.input)
+                    results.append({"type": "tool_result", "tool_use_id": block.id, "content": result_json(result)})
+                messages.append({"role": "user", "content": results})
+        except Exception as e:
+            yield f"I apologize, but I encountered an error: {str(e)}. Please try again."
 
-            image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+    async def summarize(self, prompt: RenderedPrompt) -> str:
+        """Plain completion for the chat_summary prompt; errors propagate."""
+        response = await self.async_client.messages.create(
+            model=self.model_name,
+            max_tokens=settings.CHAT_SUMMARY_MAX_CHARS // 2,
+            system=prompt.system,
+            messages=[{"role": "user", "content": prompt.user}],
+        )
+        return "".join(block.text for block in response.content if block.type == "text").strip()
+
+    def _tool_options(self) -> Dict[str, Any]:
+        """Force the answer through a tool whose input schema is the extraction schema."""
+        if not settings.LLM_STRUCTURED_OUTPUT:
+            return {}
+        return {
+            "tools": [{
+                "name": EXTRACTION_TOOL_NAME,
+                "description": "Record the metrics read from the dashboard screenshot.",
+                "input_schema": EXTRACTION_SCHEMA,
+            }],
+            "tool_choice": {"type": "tool", "name": EXTRACTION_TOOL_NAME},
+        }
+
+    def extract_metrics_from_image(self, file_path: str, prompt: Optional[RenderedPrompt] = None) -> Dict[str, Any]:
+        prompt = prompt or extraction_prompt()
+        try:
+            image = prepare_image(file_path, provider="claude")
+            mime_type = image.mime_type
+            image_b64 = base64.b64encode(image.data).decode("utf-8")
             response = self.client.messages.create(
                 model=self.model_name,
-                max_tokens=1024,
+                max_tokens=settings.LLM_EXTRACTION_MAX_TOKENS,
                 temperature=0,
+                **self._tool_options(),
+                # Tools and system are the static prefix; the breakpoint caches both.
+                system=[{"type": "text", "text": prompt.system, "cache_control": {"type": "ephemeral"}}],
                 messages=[
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": prompt},
+                            {"type": "text", "text": prompt.user},
                             {
                                 "type": "image",
                                 "source": {
@@ -68,36 +147,22 @@ class AnthropicService:
                     }
                 ],
             )
-            response_text = ""
-            if response.content:
-                first = response.content[0]
-                response_text = getattr(first, "text", "") or ""
-
-            if response_text.startswith("```"):
-                response_text = response_text.split("```", 2)[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-
-            cleaned = response_text.strip()
-            try:
-                data = json.loads(cleaned)
-                return data
-            except Exception:
-                match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
-                if match:
-                    try:
-                        data = json.loads(match.group(0))
-                        return data
-                    except Exception:
-                        pass
-
-            return {
-                "metrics": [],
-                "raw_text": cleaned,
-                "confidence": 0.0,
-                "status": "error",
-                "capture_time": None
+            result = None
+            texts = []
+            for block in response.content or []:
+                if getattr(block, "type", None) == "tool_use" and isinstance(block.input, dict):
+                    warning = "Model output was cut off" if response.stop_reason == "max_tokens" else None
+                    result = normalize_extraction(block.input, warning=warning)
+                    break
+                texts.append(getattr(block, "text", "") or "")
+            result = result or parse_extraction("".join(texts))
+            usage = getattr(response, "usage", None)
+            result["usage"] = {
+                "input_tokens": getattr(usage, "input_tokens", None),
+                "output_tokens": getattr(usage, "output_tokens", None),
+                "cached_input_tokens": getattr(usage, "cache_read_input_tokens", None),
             }
+            return result
         except Exception as e:
             return {
                 "metrics": [],
@@ -105,5 +170,7 @@ class AnthropicService:
                 "confidence": 0.0,
                 "status": "error",
                 "capture_time": None,
-                "error": str(e)
+                "error": str(e),
+                "error_type": type(e).__name__,
+                **provider_error_details(e)
             }
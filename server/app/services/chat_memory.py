@@ -0,0 +1,133 @@
+"""Bounded conversation memory for the chat assistant.
+
+A request sends the session's rolling summary plus the messages not yet
+folded into it: CHAT_HISTORY_TURNS exchanges, and up to
+CHAT_SUMMARY_FOLD_TURNS more while a fold is pending. After a reply is
+saved, ``update_summary`` folds everything older than the window into the
+summary with one provider call that sees only the old summary and the newly
+evicted messages, so a fold costs the same on the fifth turn as on the
+five-hundredth. A failed fold leaves the summary as it was and is retried
+after the next reply.
+"""
+import time
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.chat_history import ChatHistory
+from ..models.chat_session_summary import ChatSessionSummary
+from ..utils.blocking import run_blocking
+from ..utils.llm_ledger import record_llm_call
+from .llm_providers import create_provider, normalize_provider
+from .prompt_registry import chat_summary_prompt
+
+settings = get_settings()
+
+
+def _session_filter(user_id: int, session_id: str):
+    return ChatHistory.user_id == user_id, ChatHistory.session_id == session_id
+
+
+def _summary_row(db: Session, user_id: int, session_id: str):
+    return db.query(
+        ChatSessionSummary.id, ChatSessionSummary.summary, ChatSessionSummary.summarized_through_id
+    ).filter(ChatSessionSummary.session_id == session_id, ChatSessionSummary.user_id == user_id).first()
+
+
+def load_memory(db: Session, user_id: int, session_id: str) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    """The session summary (None before the first fold) and the unfolded messages, oldest first."""
+    row = _summary_row(db, user_id, session_id)
+    through = row.summarized_through_id if row else 0
+    limit = (settings.CHAT_HISTORY_TURNS + settings.CHAT_SUMMARY_FOLD_TURNS) * 2
+    rows = (
+        db.query(ChatHistory.role, ChatHistory.content)
+        .filter(*_session_filter(user_id, session_id), ChatHistory.id > through)
+        .order_by(ChatHistory.timestamp.desc(), ChatHistory.id.desc())
+        .limit(limit)
+        .all()
+    )
+    messages = [{"role": role, "content": content} for role, content in reversed(rows)]
+    return (row.summary or None) if row else None, messages
+
+
+def _pending_fold(user_id: int, session_id: str):
+    """(summary row id, summary, summarized_through_id, messages to fold), or None when the window has room."""
+    db = SessionLocal()
+    try:
+        row = _summary_row(db, user_id, session_id)
+        through = row.summarized_through_id if row else 0
+        rows = (
+            db.query(ChatHistory.id, ChatHistory.role, ChatHistory.content)
+            .filter(*_session_filter(user_id, session_id), ChatHistory.id > through)
+            .order_by(ChatHistory.timestamp, ChatHistory.id)
+            .all()
+        )
+        keep = settings.CHAT_HISTORY_TURNS * 2
+        if len(rows) < keep + settings.CHAT_SUMMARY_FOLD_TURNS * 2:
+            return None
+        return (row.id if row else None), (row.summary if row else ""), through, rows[:len(rows) - keep]
+    finally:
+        db.close()
+
+
+def _save_summary(row_id: Optional[int], user_id: int, session_id: str, through: int, new_through: int,
+                  summary: str, prompt_version: str) -> bool:
+    """Store a fold unless another one got there first (compare-and-set on summarized_through_id)."""
+    db = SessionLocal()
+    try:
+        values = {"summary": summary, "summarized_through_id": new_through, "prompt_version": prompt_version}
+        if row_id is None:
+            db.add(ChatSessionSummary(user_id=user_id, session_id=session_id, **values))
+            db.commit()
+            return True
+        updated = db.query(ChatSessionSummary).filter(
+            ChatSessionSummary.id == row_id, ChatSessionSummary.summarized_through_id == through
+        ).update(values, synchronize_session=False)
+        db.commit()
+        return bool(updated)
+    except IntegrityError:
+        db.rollback()  # a concurrent first fold created the row
+        return False
+    finally:
+        db.close()
+
+
+async def update_summary(user_id: int, session_id: str) -> None:
+    """Fold messages that fell out of the window into the session summary, if enough have."""
+    pending = await run_blocking(_pending_fold, user_id, session_id)
+    if pending is None:
+        return
+    row_id, summary, through, messages = pending
+    prompt = chat_summary_prompt(
+        summary, [{"role": m.role, "content": m.content} for m in messages],
+        settings.CHAT_SUMMARY_MESSAGE_CHARS, settings.CHAT_SUMMARY_MAX_CHARS,
+    )
+    provider_name = normalize_provider(settings.CHAT_PROVIDER)
+    provider, error = None, None
+    started = time.perf_counter()
+    try:
+        provider = await run_blocking(create_provider, provider_name)
+        text = await provider.summarize(prompt)
+    except Exception as e:
+        text, error = "", e
+    await run_blocking(
+        record_llm_call,
+        purpose="chat_summary",
+        provider=provider_name,
+        model=getattr(provider, "model_name", None),
+        prompt_version=prompt.version,
+        latency_ms=(time.perf_counter() - started) * 1000,
+        outcome="error" if error else ("ok" if text else "unparsed"),
+        error_type=type(error).__name__ if error else None,
+    )
+    if error is not None:
+        print(f"Chat summary failed for session {session_id}: {error}")
+        return
+    if text:
+        await run_blocking(
+            _save_summary, row_id, user_id, session_id, through, messages[-1].id,
+            text[:settings.CHAT_SUMMARY_MAX_CHARS], prompt.version,
+        )
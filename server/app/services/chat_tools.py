@@ -0,0 +1,290 @@
+"""Read-only tools the chat model can call to look up live data.
+
+Questions like "which VMs in Pune had CPU over 85% today" are answered from
+small, indexed queries instead of records pasted into the prompt. Every
+tool clamps its row count to CHAT_TOOL_MAX_ROWS and reports when rows were
+left out. Provider services run the call loop: they send
+``ChatToolbox.definitions`` in each provider's tool format, and ``await
+toolbox.call(name, arguments)`` runs the query on the blocking pool with
+its own session.
+"""
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.alert import Alert
+from ..models.device_item import DeviceItem
+from ..models.location import Location
+from ..models.metric_sample import MetricSample
+from ..models.vm_item import VmItem
+from ..utils.blocking import run_blocking
+
+settings = get_settings()
+
+ACTIVE_ALERT_STATUSES = ["open", "ack", "in_progress"]
+
+
+def _limit(value: Optional[int], default: int) -> int:
+    return max(1, min(int(value or default), settings.CHAT_TOOL_MAX_ROWS))
+
+
+def _time(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat(timespec="minutes") if value else None
+
+
+def _location_ids(db: Session, location: Optional[str]) -> Optional[List[int]]:
+    """Ids of locations whose name or code contains ``location``; None when no filter was given."""
+    if not location:
+        return None
+    pattern = f"%{location.strip()}%"
+    return [i for (i,) in db.query(Location.id).filter(or_(Location.name.ilike(pattern), Location.code.ilike(pattern)))]
+
+
+def _device_row(item: DeviceItem) -> Dict[str, Any]:
+    return {
+        "type": "device", "id": item.id, "name": item.device_name, "hostname": item.hostname,
+        "ip_address": item.ip_address, "category": item.category, "status": item.status,
+        "location": item.location.code if item.location else None,
+    }
+
+
+def _vm_row(vm: VmItem) -> Dict[str, Any]:
+    return {
+        "type": "vm", "id": vm.id, "name": vm.name, "hostname": vm.hostname, "ip_address": vm.ip_address,
+        "role": vm.role, "location": vm.location.code if vm.location else None,
+    }
+
+
+def _assets_by_ids(db: Session, device_ids, vm_ids) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    assets = {}
+    if device_ids:
+        for item in db.query(DeviceItem).filter(DeviceItem.id.in_(device_ids)):
+            assets[("device", item.id)] = _device_row(item)
+    if vm_ids:
+        for vm in db.query(VmItem).filter(VmItem.id.in_(vm_ids)):
+            assets[("vm", vm.id)] = _vm_row(vm)
+    return assets
+
+
+def find_assets(db: Session, query: str, limit: Optional[int] = None) -> Dict[str, Any]:
+    """Exact IP or hostname matches first (indexed), then name/hostname substrings."""
+    limit = _limit(limit, 10)
+    text = query.strip()
+    devices = db.query(DeviceItem).filter(or_(DeviceItem.ip_address == text, DeviceItem.hostname == text)).limit(limit).all()
+    vms = db.query(VmItem).filter(or_(VmItem.ip_address == text, VmItem.hostname == text)).limit(limit).all()
+    if not devices and not vms:
+        pattern = f"%{text}%"
+        devices = db.query(DeviceItem).filter(
+            or_(DeviceItem.device_name.ilike(pattern), DeviceItem.hostname.ilike(pattern))
+        ).limit(limit + 1).all()
+        vms = db.query(VmItem).filter(or_(VmItem.name.ilike(pattern), VmItem.hostname.ilike(pattern))).limit(limit + 1).all()
+    rows = [_device_row(d) for d in devices] + [_vm_row(v) for v in vms]
+    return {"assets": rows[:limit], "truncated": len(rows) > limit}
+
+
+def latest_metrics(db: Session, asset: str, metric_keys: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Newest sample of each metric for the asset with this IP, hostname or name."""
+    matches = find_assets(db, asset, limit=5)["assets"]
+    if not matches:
+        return {"error": f"no device or VM matches {asset!r}"}
+    if len(matches) > 1 and not any(asset.strip() in (m["ip_address"], m["hostname"]) for m in matches):
+        return {"error": "several assets match; ask which one", "candidates": matches}
+    target = matches[0]
+    column = MetricSample.device_item_id if target["type"] == "device" else MetricSample.vm_id
+    newest = db.query(
+        MetricSample.metric_key, func.max(MetricSample.captured_at).label("captured_at")
+    ).filter(column == target["id"])
+    if metric_keys:
+        newest = newest.filter(MetricSample.metric_key.in_(metric_keys))
+    newest = newest.group_by(MetricSample.metric_key).subquery()
+    samples = db.query(MetricSample).join(
+        newest,
+        and_(MetricSample.metric_key == newest.c.metric_key, MetricSample.captured_at == newest.c.captured_at),
+    ).filter(column == target["id"]).order_by(MetricSample.metric_key).limit(settings.CHAT_TOOL_MAX_ROWS)
+    return {
+        "asset": target,
+        "metrics": [
+            {"key": s.metric_key, "value": s.value, "unit": s.unit, "captured_at": _time(s.captured_at)}
+            for s in samples
+        ],
+    }
+
+
+def top_metrics(
+    db: Session,
+    metric_key: str,
+    asset_type: Optional[str] = None,
+    location: Optional[str] = None,
+    min_value: Optional[float] = None,
+    since_hours: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Assets ranked by their peak value of one metric over a recent window."""
+    limit = _limit(limit, 10)
+    since = datetime.utcnow() - timedelta(hours=since_hours or 24)
+    peak = func.max(MetricSample.value).label("peak")
+    query = db.query(
+        MetricSample.device_item_id, MetricSample.vm_id, peak, func.max(MetricSample.captured_at).label("last_seen")
+    ).filter(MetricSample.metric_key == metric_key, MetricSample.captured_at >= since)
+    if asset_type == "device":
+        query = query.filter(MetricSample.device_item_id.isnot(None))
+    elif asset_type == "vm":
+        query = query.filter(MetricSample.vm_id.isnot(None))
+    location_ids = _location_ids(db, location)
+    if location_ids is not None:
+        query = query.filter(or_(
+            MetricSample.device_item_id.in_(db.query(DeviceItem.id).filter(DeviceItem.location_id.in_(location_ids))),
+            MetricSample.vm_id.in_(db.query(VmItem.id).filter(VmItem.location_id.in_(location_ids))),
+        ))
+    query = query.group_by(MetricSample.device_item_id, MetricSample.vm_id)
+    if min_value is not None:
+        query = query.having(peak >= min_value)
+    rows = query.order_by(peak.desc()).limit(limit + 1).all()
+    assets = _assets_by_ids(db, [r.device_item_id for r in rows if r.device_item_id], [r.vm_id for r in rows if r.vm_id])
+    results = []
+    for row in rows[:limit]:
+        key = ("device", row.device_item_id) if row.device_item_id else ("vm", row.vm_id)
+        results.append({"asset": assets.get(key), "peak": row.peak, "last_seen": _time(row.last_seen)})
+    return {"metric_key": metric_key, "since": _time(since), "results": results, "truncated": len(rows) > limit}
+
+
+def open_alerts(
+    db: Session, severity: Optional[str] = None, location: Optional[str] = None, limit: Optional[int] = None
+) -> Dict[str, Any]:
+    """Unresolved alerts, newest first."""
+    limit = _limit(limit, 20)
+    query = db.query(Alert).filter(Alert.status.in_(ACTIVE_ALERT_STATUSES))
+    if severity:
+        query = query.filter(Alert.severity == severity)
+    location_ids = _location_ids(db, location)
+    if location_ids is not None:
+        query = query.filter(or_(
+            Alert.device_item_id.in_(db.query(DeviceItem.id).filter(DeviceItem.location_id.in_(location_ids))),
+            Alert.vm_id.in_(db.query(VmItem.id).filter(VmItem.location_id.in_(location_ids))),
+        ))
+    total = query.count()
+    alerts = query.order_by(Alert.detected_at.desc()).limit(limit).all()
+    assets = _assets_by_ids(db, [a.device_item_id for a in alerts if a.device_item_id], [a.vm_id for a in alerts if a.vm_id])
+    return {
+        "total": total,
+        "alerts": [
+            {
+                "id": a.id, "severity": a.severity, "status": a.status, "summary": a.summary,
+                "latest_value": a.latest_value, "detected_at": _time(a.detected_at),
+                "asset": assets.get(("device", a.device_item_id) if a.device_item_id else ("vm", a.vm_id)),
+            }
+            for a in alerts
+        ],
+    }
+
+
+class ChatTool:
+    def __init__(self, name: str, description: str, parameters: Dict[str, Any], handler: Callable[..., Dict[str, Any]]):
+        self.name = name
+        self.description = description
+        self.parameters = parameters
+        self.handler = handler
+
+
+def _object(properties: Dict[str, Any], required: List[str]) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": required}
+
+
+_LIMIT = {"type": "integer", "description": "Maximum rows to return."}
+_LOCATION = {"type": "string", "description": "Site name or code, e.g. Pune or PUN-DC."}
+
+
+def build_tools(metric_keys: List[str]) -> List[ChatTool]:
+    key_help = f"Metric key, one of: {', '.join(metric_keys)}." if metric_keys else "Metric key, e.g. cpu_util."
+    return [
+        ChatTool(
+            "find_assets",
+            "Look up devices and VMs by IP address, hostname or name.",
+            _object({"query": {"type": "string", "description": "IP, hostname or part of a name."}, "limit": _LIMIT}, ["query"]),
+            find_assets,
+        ),
+        ChatTool(
+            "latest_metrics",
+            "Latest reading of each metric for one device or VM.",
+            _object({
+                "asset": {"type": "string", "description": "IP address, hostname or name of the device or VM."},
+                "metric_keys": {"type": "array", "items": {"type": "string"}, "description": "Only these metrics."},
+            }, ["asset"]),
+            latest_metrics,
+        ),
+        ChatTool(
+            "top_metrics",
+            "Devices/VMs ranked by their highest value of a metric in a recent window; "
+            "use min_value for questions like 'CPU over 85%'.",
+            _object({
+                "metric_key": {"type": "string", "description": key_help},
+                "asset_type": {"type": "string", "enum": ["device", "vm"]},
+                "location": _LOCATION,
+                "min_value": {"type": "number"},
+                "since_hours": {"type": "number", "description": "Window length in hours (default 24)."},
+                "limit": _LIMIT,
+            }, ["metric_key"]),
+            top_metrics,
+        ),
+        ChatTool(
+            "open_alerts",
+            "Unresolved alerts, newest first, with the total count.",
+            _object({
+                "severity": {"type": "string", "description": "e.g. warning or critical."},
+                "location": _LOCATION,
+                "limit": _LIMIT,
+            }, []),
+            open_alerts,
+        ),
+    ]
+
+
+def _run_tool(tool: ChatTool, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    db = SessionLocal()
+    try:
+        return tool.handler(db, **arguments)
+    finally:
+        db.close()
+
+
+class ChatToolbox:
+    """The tools offered to one chat request, and a log of the calls made."""
+
+    def __init__(self, tools: List[ChatTool]):
+        self.tools = {tool.name: tool for tool in tools}
+        self.calls: List[Dict[str, Any]] = []
+
+    @property
+    def definitions(self) -> List[Dict[str, Any]]:
+        return [
+            {"name": t.name, "description": t.description, "parameters": t.parameters}
+            for t in self.tools.values()
+        ]
+
+    async def call(self, name: str, arguments) -> Dict[str, Any]:
+        """Run one tool call; failures come back as ``{"error": ...}`` for the model to read."""
+        started = time.perf_counter()
+        tool = self.tools.get(name)
+        try:
+            if isinstance(arguments, str):
+                arguments = json.loads(arguments or "{}")
+            if tool is None:
+                result = {"error": f"unknown tool {name!r}"}
+            else:
+                accepted = tool.parameters["properties"]
+                arguments = {k: v for k, v in (arguments or {}).items() if k in accepted and v is not None}
+                result = await run_blocking(_run_tool, tool, arguments)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        self.calls.append({"name": name, "ms": round((time.perf_counter() - started) * 1000, 1), "error": result.get("error")})
+        return result
+
+
+def result_json(result: Dict[str, Any]) -> str:
+    return json.dumps(result, default=str, separators=(",", ":"))
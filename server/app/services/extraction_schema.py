@@ -0,0 +1,229 @@
+"""Shared output contract for dashboard metric extraction.
+
+The prompt itself lives in services/prompt_registry.py. Every provider asks for the same JSON shape: OpenAI through a strict
+``json_schema`` response format, Anthropic through a forced tool call and
+Gemini through ``response_schema``. Output that still arrives as text (old
+SDKs, truncated responses, prose around the JSON) goes through
+``parse_extraction``, which salvages every complete metric object it can
+find instead of failing the whole upload.
+"""
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+# Used when no metric definitions exist yet.
+METRIC_KEYS = ["cpu_util", "ram_util", "disk_util", "net_in", "net_out"]
+
+# JSON Schema in the subset OpenAI strict mode accepts: every property
+# required, nullability through type lists, no additional properties. Metric
+# keys are not enumerated: the schema is part of the cached prompt prefix, so
+# it stays the same for every metric group and the prompt lists the keys.
+EXTRACTION_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "metrics": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "ip_address": {"type": ["string", "null"]},
+                    "key": {"type": "string", "description": "One of the metric keys listed in the prompt"},
+                    "value": {"type": ["number", "null"]},
+                    "unit": {"type": ["string", "null"]},
+                    "confidence": {"type": "number"},
+                },
+                "required": ["ip_address", "key", "value", "unit", "confidence"],
+                "additionalProperties": False,
+            },
+        },
+        "raw_text": {"type": ["string", "null"]},
+        "confidence": {"type": "number"},
+        "capture_time": {"type": ["string", "null"], "description": "ISO 8601, null if not shown"},
+    },
+    "required": ["metrics", "raw_text", "confidence", "capture_time"],
+    "additionalProperties": False,
+}
+
+EXTRACTION_TOOL_NAME = "record_dashboard_metrics"
+
+
+def gemini_schema(schema: Dict[str, Any] = EXTRACTION_SCHEMA) -> Dict[str, Any]:
+    """The schema in Gemini's OpenAPI dialect: ``nullable`` instead of type lists."""
+    converted: Dict[str, Any] = {}
+    for name, value in schema.items():
+        if name == "additionalProperties":
+            continue
+        if name == "type" and isinstance(value, list):
+            types = [t for t in value if t != "null"]
+            converted["type"] = types[0]
+            if "null" in value:
+                converted["nullable"] = True
+        elif name == "properties":
+            converted[name] = {prop: gemini_schema(sub) for prop, sub in value.items()}
+        elif name == "items":
+            converted[name] = gemini_schema(value)
+        else:
+            converted[name] = value
+    return converted
+
+
+_NUMBER = re.compile(r"(?P<sign>-?)(?P<digits>\d+(?:[.,]\d+)*)(?P<exponent>[eE][-+]?\d+)?")
+_PLAIN = re.compile(r"\d+(?:\.\d+)?")
+_COMMA_GROUPS = re.compile(r"\d{1,3}(?:,\d{3})+(?:\.\d+)?")  # 1,234 / 1,234.5
+_DOT_GROUPS = re.compile(r"\d{1,3}(?:\.\d{3})+,\d+")  # 1.234,5
+_DECIMAL_COMMA = re.compile(r"\d+,\d+")  # 12,5
+
+
+def parse_number(text: str) -> Optional[float]:
+    """First number in ``text``, reading thousands groups, a decimal comma and exponents.
+
+    A comma followed by three-digit groups is a thousands separator ("1,234
+    Mbps" is 1234), otherwise it is the decimal point ("12,5 %"). Anything
+    else (an IP address, say) falls back to the leading plain number.
+    """
+    match = _NUMBER.search(text)
+    if not match:
+        return None
+    digits, exponent = match.group("digits"), match.group("exponent") or ""
+    if _PLAIN.fullmatch(digits):
+        pass
+    elif _COMMA_GROUPS.fullmatch(digits):
+        digits = digits.replace(",", "")
+    elif _DOT_GROUPS.fullmatch(digits):
+        digits = digits.replace(".", "").replace(",", ".")
+    elif _DECIMAL_COMMA.fullmatch(digits):
+        digits = digits.replace(",", ".")
+    else:
+        digits, exponent = _PLAIN.match(digits).group(0), ""
+    return float(match.group("sign") + digits + exponent)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return parse_number(str(value))
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().replace("Z", "+00:00")).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def normalize_extraction(data: Any, warning: Optional[str] = None) -> Dict[str, Any]:
+    """Coerce a decoded response into the result dict the rest of the app expects."""
+    if isinstance(data, list):
+        data = {"metrics": data}
+    if not isinstance(data, dict):
+        data = {}
+    metrics = []
+    for item in data.get("metrics") or []:
+        if not isinstance(item, dict) or not item.get("key"):
+            continue
+        metrics.append({
+            "ip_address": item.get("ip_address"),
+            "key": str(item["key"]).strip(),
+            "value": _to_float(item.get("value")),
+            "unit": item.get("unit"),
+            "confidence": _to_float(item.get("confidence")) or 0.0,
+        })
+    result = {
+        "metrics": metrics,
+        "raw_text": data.get("raw_text"),
+        "confidence": _to_float(data.get("confidence")) or 0.0,
+        "status": "ok",
+        "capture_time": _to_datetime(data.get("capture_time")),
+    }
+    if warning:
+        result["warning"] = warning
+    return result
+
+
+def _strip_fences(text: str) -> str:
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("```", 2)[1]
+        if text.startswith("json"):
+            text = text[4:]
+    return text.strip()
+
+
+def _salvage_array(text: str, start: int) -> Tuple[List[Any], int, Optional[int]]:
+    """Decode array elements one at a time from ``text[start]`` (just after ``[``).
+
+    Returns the complete elements, how many malformed elements were skipped
+    and the index after the closing ``]`` (None when the array never closes,
+    i.e. the output was truncated).
+    """
+    decoder = json.JSONDecoder()
+    items: List[Any] = []
+    skipped = 0
+    pos = start
+    while pos < len(text):
+        while pos < len(text) and text[pos] in " \t\r\n,":
+            pos += 1
+        if pos >= len(text):
+            break
+        if text[pos] == "]":
+            return items, skipped, pos + 1
+        try:
+            item, pos = decoder.raw_decode(text, pos)
+        except ValueError:
+            # Resume at the next object; if there is none this element was the truncated tail.
+            pos = text.find("{", pos + 1)
+            if pos < 0:
+                break
+            skipped += 1
+            continue
+        items.append(item)
+    return items, skipped, None
+
+
+def parse_extraction(text: Optional[str]) -> Dict[str, Any]:
+    """Parse a text response, salvaging complete metric objects from broken JSON."""
+    cleaned = _strip_fences(text or "")
+    try:
+        return normalize_extraction(json.loads(cleaned))
+    except ValueError:
+        pass
+
+    brace = cleaned.find("{")
+    if brace >= 0:
+        try:
+            data, _ = json.JSONDecoder().raw_decode(cleaned, brace)
+            if isinstance(data, dict) and "metrics" in data:
+                return normalize_extraction(data)
+        except ValueError:
+            pass
+
+    match = re.search(r'"metrics"\s*:\s*\[', cleaned)
+    start = match.end() if match else (1 if cleaned.startswith("[") else 0)
+    if start:
+        items, skipped, end = _salvage_array(cleaned, start)
+        if items:
+            data = {"metrics": items}
+            # Top-level fields outside the metrics array, where the per-metric ones cannot shadow them.
+            outside = (cleaned[:match.start()] if match else "") + (cleaned[end:] if end else "")
+            for field in ("confidence", "raw_text", "capture_time"):
+                found = re.search(rf'"{field}"\s*:\s*("(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?)', outside)
+                if found:
+                    data[field] = json.loads(found.group(1))
+            problems = ([f"skipped {skipped} malformed metric rows"] if skipped else []) + ([] if end else ["output was cut off"])
+            warning = f"Recovered {len(items)} metric rows; " + ", ".join(problems) if problems else None
+            result = normalize_extraction(data, warning=warning)
+            result["raw_text"] = result["raw_text"] or cleaned
+            return result
+
+    return {
+        "metrics": [],
+        "raw_text": cleaned,
+        "confidence": 0.0,
+        "status": "error",
+        "capture_time": None,
+    }
@@ -1,6 +1,11 @@
 from typing import AsyncGenerator, List, Dict, Any, Optional
 import json
 from ..config import get_settings
+from .llm_providers import provider_error_details
+from .image_preprocessing import prepare_image
+from .extraction_schema import gemini_schema, parse_extraction
+from .prompt_registry import RenderedPrompt, chat_turns, extraction_prompt
+from .chat_tools import ChatToolbox
 
 settings = get_settings()
 
@@ -16,7 +21,8 @@ class GeminiService:
             # Fallback to old SDK if new one not available
             import google.generativeai as genai
             genai.configure(api_key=api_key or settings.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel(model_name or settings.GEMINI_MODEL)
+            self.model_name = model_name or settings.GEMINI_MODEL
+            self.model = genai.GenerativeModel(self.model_name)
             self.use_new_sdk = False
 
     async def generate_enhanced_manual(self, equipment) -> Dict[str, Any]:
@@ -40,13 +46,13 @@ class GeminiService:
 
         try:
             if self.use_new_sdk:
-                response = self.client.models.generate_content(
+                response = await self.client.aio.models.generate_content(
                     model=self.model_name,
                     contents=prompt
                 )
                 response_text = response.text
             else:
-                response = self.model.generate_content(prompt)
+                response = await self.model.generate_content_async(prompt)
                 response_text = response.text
 
             # Clean up response text
@@ -96,106 +102,150 @@ class GeminiService:
     async def chat_stream(
         self,
         message: str,
-        inventory: List[Dict[str, Any]],
-        history: List[Dict[str, str]]
+        prompt: RenderedPrompt,
+        history: List[Dict[str, str]],
+        tools: Optional[ChatToolbox] = None
     ) -> AsyncGenerator[str, None]:
-        """Stream chat responses with inventory context."""
-
-        system_context = f"""You are DC-Ops Master, an AI assistant for data center operations.
-
-Current Inventory:
-{json.dumps(inventory, indent=2)}
+        """Stream a chat answer; ``prompt`` is the rendered chat_assistant prompt.
 
-Help engineers with equipment monitoring, troubleshooting, and maintenance."""
-
-        full_message = f"{system_context}\n\nUser: {message}"
+        With ``tools`` (new SDK only), function calls are run and answered
+        with function responses, for up to CHAT_TOOL_MAX_ROUNDS rounds.
+        """
+        turns = chat_turns(history, message)
 
         try:
-            if self.use_new_sdk:
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=full_message
+            if not self.use_new_sdk:
+                # The old SDK fixes system_instruction per model; send it as the first user turn.
+                contents = [{"role": "user", "parts": [prompt.text]}, {"role": "model", "parts": ["Understood."]}]
+                contents += [{"role": turn["role"], "parts": [turn["content"]]} for turn in turns]
+                stream = await self.model.generate_content_async(
+                    contents,
+                    stream=True,
+                    generation_config={"max_output_tokens": settings.CHAT_MAX_TOKENS},
                 )
-                yield response.text
-            else:
-                response = self.model.generate_content(full_message, stream=True)
-                for chunk in response:
+                async for chunk in stream:
                     if chunk.text:
                         yield chunk.text
+                return
+
+            from google.genai import types
+            contents = [
+                types.Content(role=turn["role"], parts=[types.Part(text=turn["content"])])
+                for turn in turns
+            ]
+            tool_options = {}
+            if tools is not None:
+                tool_options = {
+                    "tools": [types.Tool(function_declarations=[
+                        types.FunctionDeclaration(
+                            name=d["name"], description=d["description"], parameters_json_schema=d["parameters"]
+                        )
+                        for d in tools.definitions
+                    ])],
+                    "automatic_function_calling": types.AutomaticFunctionCallingConfig(disable=True),
+                }
+            for round_number in range(settings.CHAT_TOOL_MAX_ROUNDS + 1):
+                if tool_options and round_number == settings.CHAT_TOOL_MAX_ROUNDS:
+                    tool_options["tool_config"] = types.ToolConfig(
+                        function_calling_config=types.FunctionCallingConfig(mode="NONE")
+                    )
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=contents,
+                    config=types.GenerateContentConfig(
+                        system_instruction=prompt.text,
+                        max_output_tokens=settings.CHAT_MAX_TOKENS,
+                        **tool_options,
+                    ),
+                )
+                # Keep the original parts: newer models attach thought signatures to function calls
+                call_parts = []
+                async for chunk in stream:
+                    content = chunk.candidates[0].content if chunk.candidates else None
+                    for part in (content.parts if content else None) or []:
+                        if part.function_call:
+                            call_parts.append(part)
+                        elif part.text and not part.thought:
+                            yield part.text
+                if not call_parts:
+                    return
+                contents.append(types.Content(role="model", parts=call_parts))
+                responses = []
+                for part in call_parts:
+                    call = part.function_call
+                    result = await tools.call(call.name, dict(call.args or {}))
+                    responses.append(types.Part.from_function_response(name=call.name, response=result))
+                contents.append(types.Content(role="user", parts=responses))
 
         except Exception as e:
             yield f"I apologize, but I encountered an error: {str(e)}. Please try again."
 
-    def extract_metrics_from_image(self, file_path: str) -> Dict[str, Any]:
-        prompt = """
-        Extract metrics from this monitoring dashboard screenshot.
-        If multiple hosts/VMs are present, return a COMPLETE row per host/VM IP with all metric keys.
-        For each IP, always include cpu_util, ram_util, disk_util, net_in, net_out (use null if not visible).
-        Return JSON ONLY in this format:
-        {
-          "metrics": [
-            {"ip_address": "10.0.1.11", "key": "cpu_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "ram_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "disk_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "net_in", "value": null, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "net_out", "value": null, "unit": "%", "confidence": 0.0}
-          ],
-          "raw_text": "...",
-          "confidence": 0.0,
-          "status": "ok",
-          "capture_time": null
-        }
-        Use keys cpu_util, ram_util, disk_util, net_in, net_out only.
-        If a metric is not visible for an IP, set value to null (do not guess).
-        """
+    async def summarize(self, prompt: RenderedPrompt) -> str:
+        """Plain completion for the chat_summary prompt; errors propagate."""
+        if self.use_new_sdk:
+            from google.genai import types
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=prompt.user,
+                config=types.GenerateContentConfig(
+                    system_instruction=prompt.system,
+                    max_output_tokens=settings.CHAT_SUMMARY_MAX_CHARS // 2,
+                ),
+            )
+        else:
+            response = await self.model.generate_content_async(
+                prompt.text, generation_config={"max_output_tokens": settings.CHAT_SUMMARY_MAX_CHARS // 2}
+            )
+        return (response.text or "").strip()
+
+    def _schema_options(self) -> Dict[str, Any]:
+        if not settings.LLM_STRUCTURED_OUTPUT:
+            return {}
+        return {"response_mime_type": "application/json", "response_schema": gemini_schema()}
+
+    def extract_metrics_from_image(self, file_path: str, prompt: Optional[RenderedPrompt] = None) -> Dict[str, Any]:
+        prompt = prompt or extraction_prompt()
         try:
-            import mimetypes
-            mime_type, _ = mimetypes.guess_type(file_path)
-            mime_type = mime_type or "image/png"
-            with open(file_path, "rb") as f:
-                image_bytes = f.read()
+            image = prepare_image(file_path, provider="gemini")
+            mime_type = image.mime_type
+            image_bytes = image.data
 
             if self.use_new_sdk:
                 from google.genai import types
+                config = types.GenerateContentConfig(
+                    system_instruction=prompt.system,
+                    temperature=0,
+                    max_output_tokens=settings.LLM_EXTRACTION_MAX_TOKENS,
+                    **self._schema_options(),
+                )
                 response = self.client.models.generate_content(
                     model=self.model_name,
                     contents=[
-                        prompt,
+                        prompt.user,
                         types.Part.from_bytes(data=image_bytes, mime_type=mime_type)
-                    ]
+                    ],
+                    config=config,
                 )
                 response_text = response.text
             else:
-                response = self.model.generate_content([prompt, image_bytes])
+                response = self.model.generate_content(
+                    [prompt.text, image_bytes],
+                    generation_config={
+                        "temperature": 0,
+                        "max_output_tokens": settings.LLM_EXTRACTION_MAX_TOKENS,
+                        **self._schema_options(),
+                    },
+                )
                 response_text = response.text
 
-            if response_text.startswith("```"):
-                response_text = response_text.split("```", 2)[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-
-            cleaned = response_text.strip()
-            try:
-                data = json.loads(cleaned)
-                return data
-            except Exception:
-                # Try to extract JSON block if the model added extra text.
-                import re
-                match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
-                if match:
-                    try:
-                        data = json.loads(match.group(0))
-                        return data
-                    except Exception:
-                        pass
-
-            return {
-                "metrics": [],
-                "raw_text": cleaned,
-                "confidence": 0.0,
-                "status": "error",
-                "capture_time": None
+            result = parse_extraction(response_text)
+            usage = getattr(response, "usage_metadata", None)
+            result["usage"] = {
+                "input_tokens": getattr(usage, "prompt_token_count", None),
+                "output_tokens": getattr(usage, "candidates_token_count", None),
+                "cached_input_tokens": getattr(usage, "cached_content_token_count", None),
             }
+            return result
         except Exception as e:
             return {
                 "metrics": [],
@@ -203,5 +253,7 @@ Help engineers with equipment monitoring, troubleshooting, and maintenance."""
                 "confidence": 0.0,
                 "status": "error",
                 "capture_time": None,
-                "error": str(e)
+                "error": str(e),
+                "error_type": type(e).__name__,
+                **provider_error_details(e)
             }
@@ -0,0 +1,101 @@
+"""Shrink dashboard screenshots before they are sent to a vision model.
+
+The image is decoded once, optionally trimmed of uniform borders (window
+chrome, letterboxing), downscaled so its long side fits the provider's
+preferred resolution and re-encoded as WebP/JPEG. Results are cached on disk
+by content hash, so failover, hedges and re-parses of the same upload reuse
+the derived file. Without Pillow the original bytes are sent unchanged.
+"""
+import hashlib
+import io
+import mimetypes
+import os
+from typing import Optional
+
+from ..config import get_settings
+
+settings = get_settings()
+
+# Long-side pixels beyond which the provider downsamples anyway.
+PROVIDER_MAX_SIDE = {
+    "openai": 2048,
+    "claude": 1568,
+    "gemini": 2048,
+}
+
+_MIME_TYPES = {"WEBP": "image/webp", "JPEG": "image/jpeg", "PNG": "image/png"}
+
+
+class PreparedImage:
+    def __init__(self, data: bytes, mime_type: str, width: Optional[int] = None, height: Optional[int] = None):
+        self.data = data
+        self.mime_type = mime_type
+        self.width = width
+        self.height = height
+
+
+def derived_cache_dir() -> str:
+    return os.path.join(settings.UPLOAD_DIR, "monitoring", "derived")
+
+
+def _trim_borders(image):
+    from PIL import Image, ImageChops
+
+    background = image.getpixel((0, 0))
+    diff = ImageChops.difference(image, Image.new(image.mode, image.size, background))
+    bbox = diff.convert("L").point(lambda p: 255 if p > 12 else 0).getbbox()
+    return image.crop(bbox) if bbox else image
+
+
+def _encode(raw: bytes, max_side: int, fmt: str, quality: int, crop: bool) -> PreparedImage:
+    from PIL import Image
+
+    with Image.open(io.BytesIO(raw)) as image:
+        image.load()
+        image = image.convert("RGB")
+        if crop:
+            image = _trim_borders(image)
+        if max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.LANCZOS, reducing_gap=2.0)
+        options = {"quality": quality}
+        if fmt == "WEBP":
+            options["method"] = 2  # higher methods save ~2% on screenshots at 2-3x the encode time
+        out = io.BytesIO()
+        image.save(out, format=fmt, **options)
+        return PreparedImage(out.getvalue(), _MIME_TYPES[fmt], *image.size)
+
+
+def prepare_image(file_path: str, provider: Optional[str] = None, max_side: Optional[int] = None) -> PreparedImage:
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    original = PreparedImage(raw, mimetypes.guess_type(file_path)[0] or "image/png")
+    if not settings.IMAGE_PREPROCESSING_ENABLED:
+        return original
+
+    max_side = max_side or settings.IMAGE_MAX_SIDE or PROVIDER_MAX_SIDE.get(provider or "", 2048)
+    fmt = settings.IMAGE_FORMAT.upper()
+    crop = settings.IMAGE_TRIM_BORDERS
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_path = os.path.join(
+        derived_cache_dir(), f"{digest}-{max_side}-{fmt.lower()}-q{settings.IMAGE_QUALITY}{'-trim' if crop else ''}"
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return PreparedImage(f.read(), _MIME_TYPES[fmt])
+
+    try:
+        prepared = _encode(raw, max_side, fmt, settings.IMAGE_QUALITY, crop)
+    except ImportError:
+        return original
+    except Exception as e:
+        print(f"Image preprocessing failed for {file_path}: {e}")
+        return original
+    if len(prepared.data) >= len(raw):
+        return original  # already small; keep the lossless original
+
+    os.makedirs(derived_cache_dir(), exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(prepared.data)
+    os.replace(tmp_path, cache_path)
+    return prepared
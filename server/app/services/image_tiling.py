@@ -0,0 +1,138 @@
+"""Split tall multi-host dashboards into horizontal strips for parallel extraction.
+
+Cuts are placed on gutter rows (near-uniform background between panels or
+table rows) close to the target strip height; when no gutter is near, the
+strip is cut at the target height and the next one starts ``overlap`` pixels
+earlier so a table row is never lost between two tiles. Results from the
+tiles are merged per (ip_address, key) by ``merge_tile_results``.
+"""
+import hashlib
+import io
+import os
+from typing import Any, Dict, List, Tuple
+
+from ..config import get_settings
+from .image_preprocessing import derived_cache_dir
+
+settings = get_settings()
+
+GUTTER_MAX_RANGE = 10  # grey-level spread below which a pixel row counts as empty
+GUTTER_SAMPLE_WIDTH = 256
+
+
+def _gutter_rows(image) -> List[int]:
+    from PIL import Image
+
+    width, height = image.size
+    small = image.convert("L").resize((min(GUTTER_SAMPLE_WIDTH, width), height), Image.BILINEAR)
+    pixels = small.tobytes()
+    row_width = small.size[0]
+    gutters = []
+    for y in range(height):
+        row = pixels[y * row_width:(y + 1) * row_width]
+        if max(row) - min(row) <= GUTTER_MAX_RANGE:
+            gutters.append(y)
+    return gutters
+
+
+def plan_strips(height: int, gutters: List[int], tile_height: int, overlap: int) -> List[Tuple[int, int]]:
+    # Each strip must advance by at least half a tile, whatever the settings say.
+    tile_height = max(2, tile_height)
+    overlap = min(max(0, overlap), tile_height // 2)
+    strips = []
+    top = 0
+    while top < height:
+        target = top + tile_height
+        if target >= height:
+            strips.append((top, height))
+            break
+        near = [g for g in gutters if target - tile_height // 4 <= g <= target]
+        if near:
+            cut = max(near)
+            strips.append((top, cut))
+            top = cut
+        else:
+            strips.append((top, target))
+            top = target - overlap
+    return strips
+
+
+def split_into_tiles(file_path: str) -> List[str]:
+    """Write the strips of a tall screenshot next to the derived images; [] when tiling does not apply."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return []
+
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    with Image.open(io.BytesIO(raw)) as image:
+        image.load()
+        width, height = image.size
+        if height < settings.IMAGE_TILE_MIN_HEIGHT:
+            return []
+        image = image.convert("RGB")
+        strips = plan_strips(height, _gutter_rows(image), settings.IMAGE_TILE_HEIGHT, settings.IMAGE_TILE_OVERLAP)
+        if len(strips) < 2:
+            return []
+
+        header_px = min(settings.IMAGE_TILE_HEADER_PX, strips[0][1])
+        header = image.crop((0, 0, width, header_px)) if header_px else None
+        digest = hashlib.sha256(raw).hexdigest()
+        os.makedirs(derived_cache_dir(), exist_ok=True)
+        paths = []
+        for index, (top, bottom) in enumerate(strips):
+            path = os.path.join(derived_cache_dir(), f"{digest}-tile{index}-{top}-{bottom}.png")
+            if not os.path.exists(path):
+                tile = image.crop((0, top, width, bottom))
+                if header is not None and top > 0:
+                    # Repeat the table header so column meaning survives the cut.
+                    framed = Image.new("RGB", (width, header_px + tile.size[1]))
+                    framed.paste(header, (0, 0))
+                    framed.paste(tile, (0, header_px))
+                    tile = framed
+                tile.save(path, format="PNG")
+            paths.append(path)
+        return paths
+
+
+def _metric_key(metric: Dict[str, Any]) -> Tuple[Any, Any]:
+    return (metric.get("ip_address"), metric.get("key"))
+
+
+def merge_tile_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Union of per-tile metrics; duplicates from overlaps collapse and conflicts keep
+    a non-null value first, then the most confident one. Failed tiles are reported in
+    ``error`` but only fail the upload when every tile failed."""
+    merged: Dict[Tuple[Any, Any], Dict[str, Any]] = {}
+    order: List[Tuple[Any, Any]] = []
+    ok = [r for r in results if r.get("status", "ok") == "ok" and not r.get("error")]
+    for result in ok:
+        for metric in result.get("metrics") or []:
+            key = _metric_key(metric)
+            current = merged.get(key)
+            if current is None:
+                merged[key] = metric
+                order.append(key)
+                continue
+            rank = (metric.get("value") is not None, metric.get("confidence") or 0)
+            if rank > (current.get("value") is not None, current.get("confidence") or 0):
+                merged[key] = metric
+
+    failed = [
+        f"tile {index + 1}: {r.get('error') or 'unparsed response'}"
+        for index, r in enumerate(results)
+        if r not in ok
+    ]
+    capture_times = [r.get("capture_time") for r in ok if r.get("capture_time")]
+    warnings = [f"tile {index + 1}: {r['warning']}" for index, r in enumerate(results) if r in ok and r.get("warning")]
+    return {
+        "metrics": [merged[key] for key in order],
+        "raw_text": "\n".join(r.get("raw_text") or "" for r in ok) or None,
+        "confidence": (sum(r.get("confidence") or 0 for r in ok) / len(ok)) if ok else 0.0,
+        "status": "ok" if ok else "error",
+        "capture_time": capture_times[0] if capture_times else None,
+        "error": f"{len(failed)}/{len(results)} tiles failed; " + "; ".join(failed) if failed else None,
+        "warning": "; ".join(warnings) or None,
+        "tiles": len(results),
+    }
@@ -0,0 +1,270 @@
+import csv
+import io
+import zipfile
+from datetime import datetime
+from xml.etree.ElementTree import ParseError
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import insert, or_, update
+from sqlalchemy.orm import Session
+
+from ..models.device_item import DeviceItem
+from ..models.vm_item import VmItem
+from ..models.location import Location
+from ..schemas.device_item import DeviceItemCreate
+from ..schemas.vm_item import VmItemCreate
+
+
+class ImportFormatError(ValueError):
+    pass
+
+
+class ImportSpec:
+    """How rows of one inventory table are validated and matched to existing records.
+
+    ``natural_keys`` are tried in order, strongest first; a key only matches
+    when exactly one record carries its value, so shared hostnames (e.g.
+    cluster nodes) fall through to the next key instead of overwriting an
+    arbitrary row. A weaker key never matches a record whose value for a
+    stronger key's column differs from the row's (same hostname, different
+    IP is a different node).
+    """
+
+    def __init__(self, model, schema, natural_keys: Sequence[Tuple[str, ...]]):
+        self.model = model
+        self.schema = schema
+        self.natural_keys = natural_keys
+        self.fields = list(schema.model_fields)
+        self.adapter = TypeAdapter(List[schema])
+
+
+DEVICE_IMPORT = ImportSpec(
+    DeviceItem,
+    DeviceItemCreate,
+    [("serial_number",), ("hostname", "ip_address"), ("hostname",), ("ip_address",)],
+)
+
+VM_IMPORT = ImportSpec(
+    VmItem,
+    VmItemCreate,
+    [("hostname", "ip_address"), ("ip_address",), ("hostname",), ("name",)],
+)
+
+
+def _normalize_header(value: Any) -> str:
+    return str(value or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _clean(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def _rows_from_table(rows: Iterator[Sequence[Any]]) -> Iterator[Dict[str, Any]]:
+    header = next(rows, None)
+    if not header:
+        raise ImportFormatError("File has no header row")
+    columns = [_normalize_header(h) for h in header]
+    for values in rows:
+        row = {col: _clean(v) for col, v in zip(columns, values) if col}
+        if any(v is not None for v in row.values()):
+            yield row
+
+
+def _iter_csv(fileobj: BinaryIO) -> Iterator[Dict[str, Any]]:
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    try:
+        yield from _rows_from_table(csv.reader(text))
+    except UnicodeDecodeError:
+        raise ImportFormatError("CSV file is not UTF-8 encoded; save it as 'CSV UTF-8' and upload again")
+    except csv.Error as e:
+        raise ImportFormatError(f"Invalid CSV file: {e}")
+    finally:
+        text.detach()
+
+
+def _iter_xlsx(fileobj: BinaryIO) -> Iterator[Dict[str, Any]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFormatError("XLSX import requires openpyxl; upload a CSV file instead")
+    from openpyxl.utils.exceptions import InvalidFileException
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except (zipfile.BadZipFile, InvalidFileException, KeyError, ParseError, OSError):
+        raise ImportFormatError("Invalid or corrupt XLSX file")
+    try:
+        yield from _rows_from_table(workbook.active.iter_rows(values_only=True))
+    except (zipfile.BadZipFile, KeyError, ParseError) as e:
+        raise ImportFormatError(f"Invalid or corrupt XLSX file: {e}")
+    finally:
+        workbook.close()
+
+
+def iter_rows(filename: str, fileobj: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Stream spreadsheet rows as dicts keyed by normalized header names."""
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return _iter_csv(fileobj)
+    if name.endswith(".xlsx"):
+        return _iter_xlsx(fileobj)
+    raise ImportFormatError("Unsupported file type; upload .csv or .xlsx")
+
+
+class _Importer:
+    def __init__(self, db: Session, spec: ImportSpec):
+        self.db = db
+        self.spec = spec
+        self.summary = {"total": 0, "created": 0, "updated": 0, "unchanged": 0, "errors": []}
+        self._location_ids: Optional[Dict[str, int]] = None
+
+    def _error(self, row_number: int, message: str):
+        self.summary["errors"].append({"row": row_number, "error": message})
+
+    def _resolve_location(self, row: Dict[str, Any]) -> Optional[str]:
+        code = row.pop("location_code", None)
+        if not code or row.get("location_id"):
+            return None
+        if self._location_ids is None:
+            self._location_ids = {loc.code: loc.id for loc in self.db.query(Location.code, Location.id)}
+        location_id = self._location_ids.get(code)
+        if location_id is None:
+            return f"Unknown location code '{code}'"
+        row["location_id"] = location_id
+        return None
+
+    def _validate(self, batch: List[Tuple[int, Dict[str, Any]]]):
+        try:
+            return list(zip(batch, self.spec.adapter.validate_python([row for _, row in batch])))
+        except ValidationError as exc:
+            bad = {}
+            for err in exc.errors():
+                index = err["loc"][0]
+                field = ".".join(str(part) for part in err["loc"][1:])
+                bad.setdefault(index, f"{field}: {err['msg']}" if field else err["msg"])
+            for index, message in sorted(bad.items()):
+                self._error(batch[index][0], message)
+            good = [item for i, item in enumerate(batch) if i not in bad]
+            if not good:
+                return []
+            return list(zip(good, self.spec.adapter.validate_python([row for _, row in good])))
+
+    def _load_existing(self, items) -> List[Dict[str, Any]]:
+        model = self.spec.model
+        key_columns = {col for key in self.spec.natural_keys for col in key}
+        conditions = []
+        for col in sorted(key_columns):
+            values = {getattr(item, col) for item in items if getattr(item, col)}
+            if values:
+                conditions.append(getattr(model, col).in_(values))
+        if not conditions:
+            return []
+        columns = [model.id] + [getattr(model, f) for f in self.spec.fields]
+        return [dict(row._mapping) for row in self.db.query(*columns).filter(or_(*conditions))]
+
+    def _index(self, index: Dict, record: Dict[str, Any]):
+        for key in self.spec.natural_keys:
+            values = tuple(record.get(col) for col in key)
+            if all(values):
+                index.setdefault((key, values), []).append(record)
+
+    def _match(self, index: Dict, values: Dict[str, Any]):
+        ambiguous = None
+        stronger: List[str] = []
+        for key in self.spec.natural_keys:
+            key_values = tuple(values.get(col) for col in key)
+            if all(key_values):
+                candidates = [
+                    record for record in index.get((key, key_values), [])
+                    if not any(values.get(col) and record.get(col) and values[col] != record[col] for col in stronger)
+                ]
+                if len(candidates) == 1:
+                    return candidates[0], None
+                if candidates and ambiguous is None:
+                    ambiguous = f"Ambiguous match on {'+'.join(key)}"
+            stronger.extend(col for col in key if col not in stronger)
+        return None, ambiguous
+
+    def import_batch(self, batch: List[Tuple[int, Dict[str, Any]]], present: set):
+        validated = self._validate(batch)
+        if not validated:
+            return
+
+        index: Dict = {}
+        for record in self._load_existing([item for _, item in validated]):
+            self._index(index, record)
+
+        created: List[Dict[str, Any]] = []
+        updates: Dict[int, Dict[str, Any]] = {}
+        for (row_number, _), item in validated:
+            values = item.model_dump()
+            record, ambiguous = self._match(index, values)
+            if record is None:
+                if ambiguous:
+                    self._error(row_number, ambiguous)
+                    continue
+                created.append(values)
+                self._index(index, values)
+                self.summary["created"] += 1
+                continue
+
+            # A blank cell leaves the stored value alone
+            changes = {f: values[f] for f in present if values[f] is not None and record.get(f) != values[f]}
+            if not changes:
+                self.summary["unchanged"] += 1
+                continue
+            record.update(changes)
+            if record.get("id"):
+                updates.setdefault(record["id"], {}).update(changes)
+            self.summary["updated"] += 1
+
+        model = self.spec.model
+        if created:
+            self.db.execute(insert(model), created)
+        if updates:
+            now = datetime.utcnow()
+            self.db.execute(
+                update(model),
+                [{"id": record_id, **changes, "updated_at": now} for record_id, changes in updates.items()]
+            )
+
+
+def import_inventory(db: Session, spec: ImportSpec, filename: str, fileobj: BinaryIO, batch_size: int = 500) -> Dict[str, Any]:
+    """Upsert spreadsheet rows in batches: one lookup, one INSERT and one UPDATE per batch.
+
+    Only non-blank cells of columns present in the sheet are written to
+    existing records. Invalid rows are reported in ``errors`` and skipped; the
+    rest are committed together. An unreadable file raises ImportFormatError
+    and nothing is written.
+    """
+    importer = _Importer(db, spec)
+    present: Optional[set] = None
+    batch: List[Tuple[int, Dict[str, Any]]] = []
+
+    try:
+        for row_number, row in enumerate(iter_rows(filename, fileobj), start=2):
+            importer.summary["total"] += 1
+            if present is None:
+                present = (set(row) | ({"location_id"} if "location_code" in row else set())) & set(spec.fields)
+            error = importer._resolve_location(row)
+            if error:
+                importer._error(row_number, error)
+                continue
+            batch.append((row_number, row))
+            if len(batch) >= batch_size:
+                importer.import_batch(batch, present)
+                batch = []
+    except ImportFormatError:
+        db.rollback()
+        raise
+
+    if batch:
+        importer.import_batch(batch, present)
+    db.commit()
+    importer.summary["errors"].sort(key=lambda e: e["row"])
+    return importer.summary
@@ -0,0 +1,68 @@
+"""Registry of LLM provider services.
+
+Provider modules (and the SDKs they wrap) are imported on first use, so
+workers that never call an LLM do not pay for google-genai/openai/anthropic.
+"""
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Dict, Optional
+
+# name -> (module relative to app.services, class name)
+PROVIDERS = {
+    "gemini": (".gemini_service", "GeminiService"),
+    "openai": (".openai_service", "OpenAIService"),
+    "claude": (".anthropic_service", "AnthropicService"),
+    "replay": (".replay_service", "ReplayService"),  # recorded responses, for load tests
+}
+
+_ALIASES = {"anthropic": "claude"}
+
+DEFAULT_PROVIDER = "gemini"
+
+
+def normalize_provider(name: Optional[str]) -> str:
+    """Map a configured provider name to a registry key; unknown names fall back to Gemini."""
+    name = (name or DEFAULT_PROVIDER).lower()
+    name = _ALIASES.get(name, name)
+    return name if name in PROVIDERS else DEFAULT_PROVIDER
+
+
+@lru_cache(maxsize=None)
+def get_provider_class(name: str):
+    module_name, class_name = PROVIDERS[normalize_provider(name)]
+    module = import_module(module_name, package=__package__)
+    return getattr(module, class_name)
+
+
+def create_provider(name: Optional[str], api_key: Optional[str] = None, model_name: Optional[str] = None):
+    return get_provider_class(normalize_provider(name))(api_key=api_key, model_name=model_name)
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+def provider_error_details(exc: Exception) -> Dict[str, Any]:
+    """HTTP status and Retry-After from an SDK exception, for the rate limiter.
+
+    The openai/anthropic SDKs expose ``status_code`` and google-genai ``code``;
+    all three keep the httpx response on ``response``.
+    """
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    return {
+        "error_status": status if isinstance(status, int) else None,
+        "retry_after": _retry_after_seconds(headers.get("retry-after")),
+    }
@@ -1,95 +1,372 @@
-from typing import Dict, Any
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+import time
 from ..config import get_settings
 from ..database import SessionLocal
 from ..models.llm_api_key import LlmApiKey
 from ..models.llm_settings import LlmSettings
-from .gemini_service import GeminiService
-from .openai_service import OpenAIService
-from .anthropic_service import AnthropicService
+from ..utils.cascade import FAST, STRONG, cascade_stats, escalation_reason
+from ..utils.circuit_breaker import get_breaker
+from ..utils.hedging import get_latency_tracker, hedge_stats
+from ..utils.llm_ledger import call_error_type, call_outcome, record_llm_call
+from ..utils.rate_limiter import FAILED, OVERLOAD_STATUSES, OVERLOADED, SUCCESS, get_limiter
+from .llm_providers import create_provider, normalize_provider
+from .image_tiling import merge_tile_results, split_into_tiles
+from .prompt_registry import RenderedPrompt, extraction_prompt
+from .replay_service import record_response
+
+settings = get_settings()
+
+_hedge_executor = ThreadPoolExecutor(max_workers=settings.LLM_HEDGE_MAX_WORKERS, thread_name_prefix="llm-hedge")
+_tile_executor = ThreadPoolExecutor(max_workers=settings.IMAGE_TILE_CONCURRENCY, thread_name_prefix="llm-tile")
+
+
+class ProviderSlot:
+    """One entry of the failover chain: a provider plus the key and breaker it uses."""
+
+    def __init__(
+        self, breaker_name: str, provider: str, api_key: str, model_name: Optional[str] = None, tier: Optional[str] = None
+    ):
+        self.breaker_name = breaker_name
+        self.provider = normalize_provider(provider)
+        self.api_key = api_key
+        self.model_name = model_name
+        self.tier = tier
+
+    @property
+    def members(self) -> List["ProviderSlot"]:
+        return [self]
+
+    def candidates(self) -> Iterator["ProviderSlot"]:
+        yield self
+
+    def with_model(self, model_name: str, tier: str) -> "ProviderSlot":
+        # Provider rate limits and outages are per model, so the tier gets its own
+        # breaker, limiter and latency tracker.
+        return ProviderSlot(f"{self.breaker_name}/{tier}", self.provider, self.api_key, model_name, tier=tier)
+
+
+class KeyPool:
+    """Pooled keys of one provider, used as a single chain entry.
+
+    Each call goes to the least-loaded member (fewest in-flight calls relative
+    to its adaptive limit, keys with spare rate quota first). Members whose
+    breaker is open are ejected until their half-open probe succeeds, and a
+    failing member fails over to the next one before leaving the pool.
+    """
+
+    def __init__(self, provider: str, members: Optional[List[ProviderSlot]] = None):
+        self.provider = normalize_provider(provider)
+        self.members: List[ProviderSlot] = members or []
+
+    def with_model(self, model_name: str, tier: str) -> "KeyPool":
+        return KeyPool(self.provider, [member.with_model(model_name, tier) for member in self.members])
+
+    def candidates(self) -> Iterator[ProviderSlot]:
+        remaining = list(self.members)
+        while remaining:
+            remaining.sort(key=lambda m: get_limiter(m.breaker_name).load())
+            yield remaining.pop(0)
+
+
+def env_provider_chain(settings) -> List[ProviderSlot]:
+    """Providers configured through the environment, LLM_PROVIDER first."""
+    configured = {
+        "gemini": (settings.GEMINI_API_KEY, settings.GEMINI_MODEL),
+        "openai": (settings.OPENAI_API_KEY, settings.OPENAI_MODEL),
+        "claude": (settings.ANTHROPIC_API_KEY, settings.ANTHROPIC_MODEL),
+    }
+    primary = normalize_provider(settings.LLM_PROVIDER)
+    order = sorted(configured, key=lambda name: name != primary)
+    return [
+        ProviderSlot(f"env:{name}", name, configured[name][0], configured[name][1])
+        for name in order
+        if configured[name][0]
+    ]
+
+
+def fast_tier_chain(chain: List[Union[ProviderSlot, KeyPool]], settings) -> List[Union[ProviderSlot, KeyPool]]:
+    """The same chain with each provider's cheap cascade model."""
+    models = {
+        "gemini": settings.LLM_CASCADE_GEMINI_MODEL,
+        "openai": settings.LLM_CASCADE_OPENAI_MODEL,
+        "claude": settings.LLM_CASCADE_ANTHROPIC_MODEL,
+    }
+    return [entry.with_model(models[entry.provider], FAST) for entry in chain if models.get(entry.provider)]
 
 
 class MetricsExtractionService:
-    def __init__(self):
+    """Extracts metrics through an ordered chain of providers.
+
+    The chain is the configured ``LlmApiKey`` rows (selected key first, then
+    oldest first; pooled keys of a provider share one ``KeyPool`` entry), or
+    the environment keys when no rows exist. Providers whose
+    circuit breaker is open are skipped; a provider error fails over to the
+    next entry.
+
+    With LLM_CASCADE_ENABLED the chain first runs with each provider's cheap
+    model, and only results that fail ``escalation_reason`` (errors, low
+    confidence, missing or impossible values) are redone with the configured
+    models.
+    """
+
+    def __init__(self, upload_id: Optional[int] = None):
         settings = get_settings()
-        provider = (settings.LLM_PROVIDER or "gemini").lower()
-        api_key = None
-        model_name = None
-        self.provider_name = provider
+        self.upload_id = upload_id  # recorded on llm_calls rows
+        self.provider_name = normalize_provider(settings.LLM_PROVIDER)
         self.provider_error = None
+        self.chain: List[Union[ProviderSlot, KeyPool]] = []
 
         keys_present = False
         try:
             db = SessionLocal()
             try:
-                keys = db.query(LlmApiKey).all()
+                keys = db.query(LlmApiKey).order_by(LlmApiKey.created_at, LlmApiKey.id).all()
                 keys_present = len(keys) > 0
                 selection = db.query(LlmSettings).first()
-                selected_key = None
-
-                if keys:
-                    if len(keys) == 1:
-                        selected_key = keys[0]
-                    elif selection and selection.selected_key_id:
-                        selected_key = next((k for k in keys if k.id == selection.selected_key_id), None)
-                        if not selected_key:
-                            self.provider_error = "Selected API key not found. Update LLM settings."
-                    else:
-                        self.provider_error = "Multiple API keys configured. Select one in Admin Hub."
-
-                if selected_key:
-                    provider = selected_key.provider.lower()
-                    api_key = selected_key.api_key
-                    self.provider_name = provider
+                selected_id = selection.selected_key_id if selection else None
+                keys.sort(key=lambda k: k.id != selected_id)
+                pools: Dict[str, KeyPool] = {}
+                for k in keys:
+                    slot = ProviderSlot(f"llm_key:{k.id}", k.provider, k.api_key)
+                    if not k.is_pooled:
+                        self.chain.append(slot)
+                        continue
+                    if slot.provider not in pools:
+                        pools[slot.provider] = KeyPool(slot.provider)
+                        self.chain.append(pools[slot.provider])
+                    pools[slot.provider].members.append(slot)
             finally:
                 db.close()
         except Exception as e:
             self.provider_error = f"Failed to load LLM settings: {e}"
 
-        if not api_key and not keys_present:
-            if provider == "openai":
-                api_key = settings.OPENAI_API_KEY
-                model_name = settings.OPENAI_MODEL
-            elif provider in ("claude", "anthropic"):
-                api_key = settings.ANTHROPIC_API_KEY
-                model_name = settings.ANTHROPIC_MODEL
-                self.provider_name = "claude"
-            else:
-                api_key = settings.GEMINI_API_KEY
-                model_name = settings.GEMINI_MODEL
-                self.provider_name = "gemini"
-
-        if not api_key:
+        if not keys_present:
+            self.chain = env_provider_chain(settings)
+        if normalize_provider(settings.LLM_PROVIDER) == "replay":
+            # Load tests must never reach a live provider, whatever keys are configured.
+            self.chain = [ProviderSlot("env:replay", "replay", "")]
+            self.provider_error = None
+
+        if self.chain:
+            self.provider_name = self.chain[0].provider
+        else:
             self.provider_error = self.provider_error or f"Missing API key for {self.provider_name}"
-            self.provider = None
-            return
+        self.fast_chain = fast_tier_chain(self.chain, settings) if settings.LLM_CASCADE_ENABLED else []
 
-        try:
-            if provider == "openai":
-                self.provider = OpenAIService(api_key=api_key, model_name=model_name)
-            elif provider in ("claude", "anthropic"):
-                self.provider = AnthropicService(api_key=api_key, model_name=model_name)
-            else:
-                self.provider = GeminiService(api_key=api_key, model_name=model_name)
-                self.provider_name = "gemini"
-        except Exception as e:
-            self.provider = None
-            self.provider_error = f"{provider} init failed: {e}"
-
-    def extract_from_image(self, file_path: str) -> Dict[str, Any]:
-        if self.provider_error or not self.provider:
-            return {
-                "metrics": [],
-                "raw_text": None,
-                "confidence": 0.0,
-                "status": "error",
-                "capture_time": None,
-                "error": self._sanitize_error(self.provider_error or "LLM provider unavailable")
-            }
-        result = self.provider.extract_metrics_from_image(file_path)
-        if isinstance(result, dict) and result.get("error"):
-            result["error"] = self._sanitize_error(str(result["error"]))
+    def _error_result(self, message: str) -> Dict[str, Any]:
+        return {
+            "metrics": [],
+            "raw_text": None,
+            "confidence": 0.0,
+            "status": "error",
+            "capture_time": None,
+            "error": self._sanitize_error(message)
+        }
+
+    def _available_slots(self, chain: List[Union[ProviderSlot, KeyPool]], errors: List[str]) -> Iterator[ProviderSlot]:
+        # Only a peek: the breaker admits the call in _call, so a hedge that is
+        # queued and then cancelled never holds the half-open probe.
+        for entry in chain:
+            for slot in entry.candidates():
+                if get_breaker(slot.breaker_name).available():
+                    yield slot
+                else:
+                    errors.append(f"{slot.provider}: circuit open")
+
+    def _call(
+        self, slot: ProviderSlot, file_path: str, prompt: RenderedPrompt
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[float]]:
+        """(result, error, latency_ms); latency is None when no provider call was made."""
+        breaker = get_breaker(slot.breaker_name)
+        admission = breaker.allow()
+        if not admission:
+            return None, "circuit open", None
+        limiter = get_limiter(slot.breaker_name)
+        ledger = {
+            "provider": slot.provider,
+            "model": slot.model_name,
+            "key_ref": slot.breaker_name,
+            "tier": slot.tier,
+            "prompt_version": prompt.version,
+            "upload_id": self.upload_id,
+        }
+        for attempt in range(settings.LLM_RATE_LIMIT_RETRIES + 1):
+            if not limiter.acquire(timeout=settings.LLM_RATE_LIMIT_WAIT_SECONDS):
+                record_llm_call(**ledger, retries=attempt, outcome="throttled", error_type="rate_limit_wait")
+                # The provider was never reached: no breaker outcome, and a held probe goes back.
+                breaker.release(admission)
+                return None, "rate limit wait exceeded", None
+            started = time.perf_counter()
+            overloaded = False
+            retry_after = None
+            outcome = FAILED  # only a parsed answer may raise the concurrency limit
+            try:
+                provider = create_provider(slot.provider, api_key=slot.api_key, model_name=slot.model_name)
+                ledger["model"] = getattr(provider, "model_name", None) or slot.model_name
+                result = provider.extract_metrics_from_image(file_path, prompt=prompt)
+                error = result.get("error") if isinstance(result, dict) else "Invalid provider response"
+                if error:
+                    overloaded = isinstance(result, dict) and result.get("error_status") in OVERLOAD_STATUSES
+                    retry_after = result.get("retry_after") if overloaded else None
+                    outcome = OVERLOADED if overloaded else FAILED
+                elif result.get("status", "ok") == "ok":
+                    outcome = SUCCESS
+            except Exception as e:
+                result, error = None, f"{slot.provider} init failed: {e}"
+            finally:
+                latency_ms = (time.perf_counter() - started) * 1000
+                limiter.release(outcome, retry_after=retry_after)
+            # A 429 is the limiter's job, not a sign of an unhealthy provider: retry after the pause.
+            if not (overloaded and attempt < settings.LLM_RATE_LIMIT_RETRIES):
+                break
+
+        usage = (result.get("usage") if isinstance(result, dict) else None) or {}
+        record_llm_call(
+            **ledger,
+            input_tokens=usage.get("input_tokens"),
+            output_tokens=usage.get("output_tokens"),
+            cached_input_tokens=usage.get("cached_input_tokens"),
+            latency_ms=latency_ms,
+            retries=attempt,
+            outcome=call_outcome(result, error, overloaded),
+            error_type=call_error_type(result, error),
+        )
+        breaker.record(
+            ok=not error, latency_ms=latency_ms, error=self._sanitize_error(str(error)) if error else None
+        )
+        if not error:
+            get_latency_tracker(slot.breaker_name).record(latency_ms)
+            result["provider"] = slot.provider
+            if settings.LLM_REPLAY_RECORD and slot.provider != "replay" and result.get("status", "ok") == "ok":
+                record_response(file_path, result)
+        return result, error, latency_ms
+
+    def extract_from_image(self, file_path: str, prompt: Optional[RenderedPrompt] = None) -> Dict[str, Any]:
+        """``prompt`` defaults to the extraction prompt for the default metric keys."""
+        if not self.chain:
+            return self._error_result(self.provider_error or "LLM provider unavailable")
+        prompt = prompt or extraction_prompt()
+        if settings.IMAGE_TILING_ENABLED:
+            tiles = split_into_tiles(file_path)
+            if tiles:
+                results = list(_tile_executor.map(lambda tile: self._extract_single(tile, prompt), tiles))
+                merged = merge_tile_results(results)
+                if merged.get("error"):
+                    merged["error"] = self._sanitize_error(merged["error"])
+                return merged
+        return self._extract_single(file_path, prompt)
+
+    def _extract_single(self, file_path: str, prompt: RenderedPrompt) -> Dict[str, Any]:
+        if not self.fast_chain:
+            return self._extract_tier(self.chain, file_path, prompt)
+
+        started = time.perf_counter()
+        result = self._extract_tier(self.fast_chain, file_path, prompt)
+        cascade_stats.record_call(FAST, (time.perf_counter() - started) * 1000)
+        tier = FAST
+        reason = escalation_reason(result)
+        if reason is not None:
+            cascade_stats.record_escalation(reason)
+            strong_started = time.perf_counter()
+            strong = self._extract_tier(self.chain, file_path, prompt)
+            cascade_stats.record_call(STRONG, (time.perf_counter() - strong_started) * 1000)
+            # A failed strong call does not discard a usable (if doubtful) fast result.
+            if reason == "error" or (strong.get("status", "ok") == "ok" and not strong.get("error")):
+                result, tier = strong, STRONG
+        cascade_stats.finish_request(tier, (time.perf_counter() - started) * 1000)
+        result["tier"] = tier
+        result["escalation"] = reason
         return result
 
+    def _extract_tier(self, chain: List[Union[ProviderSlot, KeyPool]], file_path: str, prompt: RenderedPrompt) -> Dict[str, Any]:
+        if settings.LLM_HEDGE_ENABLED and sum(len(entry.members) for entry in chain) > 1:
+            return self._extract_hedged(chain, file_path, prompt)
+
+        errors: List[str] = []
+        fallback = None
+        for slot in self._available_slots(chain, errors):
+            result, error, _ = self._call(slot, file_path, prompt)
+            if error:
+                errors.append(f"{slot.provider}: {error}")
+            elif result.get("status", "ok") == "ok":
+                self.provider_name = slot.provider
+                return result
+            elif fallback is None:
+                fallback = result  # answered but unparsed; try the next provider first
+        return self._fallback_result(fallback, errors)
+
+    def _extract_hedged(
+        self, chain: List[Union[ProviderSlot, KeyPool]], file_path: str, prompt: RenderedPrompt
+    ) -> Dict[str, Any]:
+        """Failover plus one hedge: if the first call outlives the provider's p90
+        latency (and the hedge budget allows), the next provider is raced against
+        it and the first parsed result wins. Sync SDK calls cannot be aborted, so
+        the losing call finishes in the background and its result is dropped.
+        """
+        errors: List[str] = []
+        candidates = self._available_slots(chain, errors)
+        pending: Dict[Future, ProviderSlot] = {}
+        fallback = None
+        hedged = False
+        primary = None
+        started = time.perf_counter()
+        hedge_stats.start_request()
+
+        while True:
+            if not pending:
+                slot = next(candidates, None)
+                if slot is None:
+                    break
+                future = _hedge_executor.submit(self._call, slot, file_path, prompt)
+                if primary is None:
+                    primary = slot
+                    future.add_done_callback(
+                        lambda f: f.cancelled() or f.result()[2] is None or hedge_stats.record_primary(f.result()[2])
+                    )
+                pending[future] = slot
+
+            timeout = None
+            if not hedged and len(pending) == 1:
+                (primary_slot,) = pending.values()
+                timeout = get_latency_tracker(primary_slot.breaker_name).hedge_delay_ms() / 1000
+
+            done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                hedged = True  # at most one hedge per upload
+                if hedge_stats.try_hedge():
+                    slot = next(candidates, None)
+                    if slot is not None:
+                        pending[_hedge_executor.submit(self._call, slot, file_path, prompt)] = slot
+                continue
+
+            for future in done:
+                slot = pending.pop(future)
+                result, error, _ = future.result()
+                if error:
+                    errors.append(f"{slot.provider}: {error}")
+                elif result.get("status", "ok") == "ok":
+                    for loser in pending:
+                        loser.cancel()
+                    self.provider_name = slot.provider
+                    hedge_stats.finish_request((time.perf_counter() - started) * 1000, won_by_hedge=hedged and slot is not primary)
+                    return result
+                elif fallback is None:
+                    fallback = result  # answered but unparsed; keep unless the other call does better
+
+        hedge_stats.finish_request((time.perf_counter() - started) * 1000, won_by_hedge=False)
+        return self._fallback_result(fallback, errors)
+
+    def _fallback_result(self, fallback: Optional[Dict[str, Any]], errors: List[str]) -> Dict[str, Any]:
+        """What is returned when no provider gave an ok result: the first unparsed answer, else the errors."""
+        if fallback is None:
+            return self._error_result("; ".join(errors))
+        self.provider_name = fallback.get("provider", self.provider_name)
+        for field in ("error", "warning"):
+            if fallback.get(field):
+                fallback[field] = self._sanitize_error(fallback[field])
+        return fallback
+
     def _sanitize_error(self, message: str) -> str:
         import re
         if not message:
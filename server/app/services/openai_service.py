@@ -1,10 +1,12 @@
-from typing import Dict, Any
+from typing import AsyncGenerator, Dict, Any, List
 import base64
-import json
-import mimetypes
-import re
 
 from ..config import get_settings
+from .llm_providers import provider_error_details
+from .extraction_schema import EXTRACTION_SCHEMA, parse_extraction
+from .prompt_registry import RenderedPrompt, chat_turns, extraction_prompt
+from .chat_tools import ChatToolbox, result_json
+from .image_preprocessing import prepare_image
 
 settings = get_settings()
 
@@ -15,45 +17,115 @@ from typing import Optional
 class OpenAIService:
     def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
         from openai import OpenAI
-        self.client = OpenAI(api_key=api_key or settings.OPENAI_API_KEY)
+        self.api_key = api_key or settings.OPENAI_API_KEY
+        self.client = OpenAI(api_key=self.api_key)
         self.model_name = model_name or settings.OPENAI_MODEL
+        self._async_client = None
 
-    def extract_metrics_from_image(self, file_path: str) -> Dict[str, Any]:
-        prompt = """
-        Extract metrics from this monitoring dashboard screenshot.
-        If multiple hosts/VMs are present, return a COMPLETE row per host/VM IP with all metric keys.
-        For each IP, always include cpu_util, ram_util, disk_util, net_in, net_out (use null if not visible).
-        Return JSON ONLY in this format:
-        {
-          "metrics": [
-            {"ip_address": "10.0.1.11", "key": "cpu_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "ram_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "disk_util", "value": 0.0, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "net_in", "value": null, "unit": "%", "confidence": 0.0},
-            {"ip_address": "10.0.1.11", "key": "net_out", "value": null, "unit": "%", "confidence": 0.0}
-          ],
-          "raw_text": "...",
-          "confidence": 0.0,
-          "status": "ok",
-          "capture_time": null
-        }
-        Use keys cpu_util, ram_util, disk_util, net_in, net_out only.
-        If a metric is not visible for an IP, set value to null (do not guess).
+    @property
+    def async_client(self):
+        """AsyncOpenAI for callers on the event loop; created on first use."""
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+        return self._async_client
+
+    async def chat_stream(
+        self,
+        message: str,
+        prompt: RenderedPrompt,
+        history: List[Dict[str, str]],
+        tools: Optional[ChatToolbox] = None
+    ) -> AsyncGenerator[str, None]:
+        """Stream a chat answer; ``prompt`` is the rendered chat_assistant prompt.
+
+        With ``tools``, tool calls streamed by the model are run and their
+        results sent back, for up to CHAT_TOOL_MAX_ROUNDS rounds.
         """
+        messages = [{"role": "system", "content": prompt.text}]
+        messages += [
+            {"role": "assistant" if turn["role"] == "model" else "user", "content": turn["content"]}
+            for turn in chat_turns(history, message)
+        ]
         try:
-            mime_type, _ = mimetypes.guess_type(file_path)
-            mime_type = mime_type or "image/png"
-            with open(file_path, "rb") as f:
-                image_bytes = f.read()
+            for round_number in range(settings.CHAT_TOOL_MAX_ROUNDS + 1):
+                options = {}
+                if tools is not None:
+                    options["tools"] = [{"type": "function", "function": d} for d in tools.definitions]
+                    if round_number == settings.CHAT_TOOL_MAX_ROUNDS:
+                        options["tool_choice"] = "none"  # out of rounds: answer with what it has
+                stream = await self.async_client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    max_tokens=settings.CHAT_MAX_TOKENS,
+                    stream=True,
+                    **options,
+                )
+                text, calls = "", {}
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+                    if delta.content:
+                        text += delta.content
+                        yield delta.content
+                    # Tool calls arrive in fragments keyed by index
+                    for fragment in delta.tool_calls or []:
+                        call = calls.setdefault(fragment.index, {"id": None, "name": "", "arguments": ""})
+                        call["id"] = fragment.id or call["id"]
+                        if fragment.function is not None:
+                            call["name"] += fragment.function.name or ""
+                            call["arguments"] += fragment.function.arguments or ""
+                if not calls:
+                    return
+                messages.append({
+                    "role": "assistant",
+                    "content": text or None,
+                    "tool_calls": [
+                        {"id": c["id"], "type": "function", "function": {"name": c["name"], "arguments": c["arguments"]}}
+                        for c in calls.values()
+                    ],
+                })
+                for call in calls.values():
+                    result = await tools.call(call["name"], call["arguments"])
+                    messages.append({"role": "tool", "tool_call_id": call["id"], "content": result_json(result)})
+        except Exception as e:
+            yield f"I apologize, but I encountered an error: {str(e)}. Please try again."
+
+    async def summarize(self, prompt: RenderedPrompt) -> str:
+        """Plain completion for the chat_summary prompt; errors propagate."""
+        response = await self.async_client.chat.completions.create(
+            model=self.model_name,
+            messages=[{"role": "system", "content": prompt.system}, {"role": "user", "content": prompt.user}],
+            max_tokens=settings.CHAT_SUMMARY_MAX_CHARS // 2,
+        )
+        return (response.choices[0].message.content or "").strip()
+
+    def _response_format(self) -> Dict[str, Any]:
+        if not settings.LLM_STRUCTURED_OUTPUT:
+            return {}
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "dashboard_metrics", "schema": EXTRACTION_SCHEMA, "strict": True},
+            }
+        }
 
-            image_b64 = base64.b64encode(image_bytes).decode("utf-8")
+    def extract_metrics_from_image(self, file_path: str, prompt: Optional[RenderedPrompt] = None) -> Dict[str, Any]:
+        prompt = prompt or extraction_prompt()
+        try:
+            image = prepare_image(file_path, provider="openai")
+            mime_type = image.mime_type
+            image_b64 = base64.b64encode(image.data).decode("utf-8")
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
+                    # Static system prompt first: OpenAI caches repeated prompt prefixes.
+                    {"role": "system", "content": prompt.system},
                     {
                         "role": "user",
                         "content": [
-                            {"type": "text", "text": prompt},
+                            {"type": "text", "text": prompt.user},
                             {
                                 "type": "image_url",
                                 "image_url": {
@@ -64,34 +136,17 @@ class OpenAIService:
                     }
                 ],
                 temperature=0,
+                max_tokens=settings.LLM_EXTRACTION_MAX_TOKENS,
+                **self._response_format(),
             )
-            response_text = response.choices[0].message.content or ""
-
-            if response_text.startswith("```"):
-                response_text = response_text.split("```", 2)[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-
-            cleaned = response_text.strip()
-            try:
-                data = json.loads(cleaned)
-                return data
-            except Exception:
-                match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
-                if match:
-                    try:
-                        data = json.loads(match.group(0))
-                        return data
-                    except Exception:
-                        pass
-
-            return {
-                "metrics": [],
-                "raw_text": cleaned,
-                "confidence": 0.0,
-                "status": "error",
-                "capture_time": None
+            result = parse_extraction(response.choices[0].message.content)
+            usage = getattr(response, "usage", None)
+            result["usage"] = {
+                "input_tokens": getattr(usage, "prompt_tokens", None),
+                "output_tokens": getattr(usage, "completion_tokens", None),
+                "cached_input_tokens": getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", None),
             }
+            return result
         except Exception as e:
             return {
                 "metrics": [],
@@ -99,5 +154,7 @@ class OpenAIService:
                 "confidence": 0.0,
                 "status": "error",
                 "capture_time": None,
-                "error": str(e)
+                "error": str(e),
+                "error_type": type(e).__name__,
+                **provider_error_details(e)
             }
@@ -0,0 +1,210 @@
+"""Versioned prompt templates shared by the provider services.
+
+A template has a static ``system`` part, identical for every call and sent
+first so provider-side prompt caching (OpenAI/Gemini prefix caching,
+Anthropic ``cache_control``) can reuse it, and a ``task`` part rendered per
+call. ``RenderedPrompt.version`` combines the template version with a
+digest of the rendered task, so two uploads with the same ``prompt_version``
+were sent the same prompt and their extraction results are comparable.
+
+Bump a template's version whenever its wording changes.
+"""
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..models.metric_definition import MetricDefinition
+from ..models.metric_group_member import MetricGroupMember
+from ..models.monitoring_upload import MonitoringUpload
+from .extraction_schema import METRIC_KEYS
+
+
+class RenderedPrompt:
+    def __init__(self, name: str, version: str, system: str, user: str):
+        self.name = name
+        self.version = version
+        self.system = system
+        self.user = user
+
+    @property
+    def text(self) -> str:
+        """System and task in one string, for SDKs without a system role."""
+        return f"{self.system}\n\n{self.user}"
+
+
+class PromptTemplate:
+    def __init__(self, name: str, version: int, system: str, task: str):
+        self.name = name
+        self.version = version
+        self.system = system.strip()
+        self.task = task.strip()
+
+    def render(self, **values) -> RenderedPrompt:
+        user = self.task.format(**values)
+        digest = hashlib.sha256(user.encode("utf-8")).hexdigest()[:8]
+        return RenderedPrompt(self.name, f"{self.name}@v{self.version}+{digest}", self.system, user)
+
+
+PROMPTS: Dict[str, PromptTemplate] = {}
+
+
+def register(template: PromptTemplate) -> PromptTemplate:
+    PROMPTS[template.name] = template
+    return template
+
+
+def get_prompt(name: str) -> PromptTemplate:
+    return PROMPTS[name]
+
+
+# v1 was the inline prompt copied into each provider service.
+METRICS_EXTRACTION = register(PromptTemplate(
+    name="metrics_extraction",
+    version=2,
+    system="""
+You read metrics from monitoring dashboard screenshots (Grafana and similar).
+If multiple hosts/VMs are present, return a COMPLETE row per host/VM IP with every requested metric key.
+Answer with JSON only, in this format:
+{
+  "metrics": [
+    {"ip_address": "10.0.1.11", "key": "<metric key>", "value": 0.0, "unit": "%", "confidence": 0.0}
+  ],
+  "raw_text": "...",
+  "confidence": 0.0,
+  "capture_time": null
+}
+Use only the metric keys listed in the request, exactly as written.
+If a metric is not visible for an IP, set value to null (do not guess).
+capture_time is the dashboard's time in ISO 8601, or null when it is not shown.
+""",
+    task="""
+Metric keys to report for each host/VM IP:
+{metric_lines}
+""",
+))
+
+
+def _metric_lines(keys: List[str], definitions: Dict[str, MetricDefinition]) -> str:
+    lines = []
+    for key in keys:
+        definition = definitions.get(key)
+        if definition is None:
+            lines.append(f"- {key}")
+            continue
+        unit = f" ({definition.default_unit})" if definition.default_unit else ""
+        lines.append(f"- {key}: {definition.display_name}{unit}")
+    return "\n".join(lines)
+
+
+def extraction_metric_keys(db: Session, upload: Optional[MonitoringUpload]) -> Tuple[List[str], Dict[str, MetricDefinition]]:
+    """Keys of the asset's metric group, else every defined metric, else the built-in five."""
+    definitions = {d.key: d for d in db.query(MetricDefinition).order_by(MetricDefinition.id)}
+    asset = (upload.device_item or upload.vm_item) if upload is not None else None
+    group_id = asset.metric_group_id if asset is not None else None
+    keys: List[str] = []
+    if group_id:
+        keys = [
+            m.metric_key
+            for m in db.query(MetricGroupMember)
+            .filter(MetricGroupMember.group_id == group_id)
+            .order_by(MetricGroupMember.id)
+        ]
+    return keys or list(definitions) or list(METRIC_KEYS), definitions
+
+
+def extraction_prompt(db: Optional[Session] = None, upload: Optional[MonitoringUpload] = None) -> RenderedPrompt:
+    if db is None:
+        return METRICS_EXTRACTION.render(metric_lines=_metric_lines(METRIC_KEYS, {}))
+    keys, definitions = extraction_metric_keys(db, upload)
+    return METRICS_EXTRACTION.render(metric_lines=_metric_lines(keys, definitions))
+
+
+# v1 was the f-string in GeminiService.chat_stream; v2 sent the whole equipment
+# list as JSON, v3 sends the records retrieved for the question, v4 adds tools,
+# v5 the summary of earlier turns.
+CHAT_ASSISTANT = register(PromptTemplate(
+    name="chat_assistant",
+    version=5,
+    system="""
+You are DC-Ops Master, an AI assistant for data center operations.
+Help engineers with equipment monitoring, troubleshooting, and maintenance.
+Each request lists the size of the estate and the records that best match the
+question, found by keyword search. When tools are offered, use them for live
+metric values, rankings, open alerts and assets that are not listed; prefer a
+narrow call (one asset, one metric, a location, a limit) over a broad one.
+Never invent values. If the asset the engineer means cannot be found, say so
+and ask for its name, hostname or IP. Only the latest messages are sent
+verbatim; earlier ones arrive as a summary.
+""",
+    task="""
+Estate: {estate}
+Earlier in this conversation: {summary}
+Matching records:
+{records}
+""",
+))
+
+
+def chat_prompt(
+    records: List[Dict[str, Any]], counts: Dict[str, int], snippet_chars: int = 300, summary: Optional[str] = None
+) -> RenderedPrompt:
+    estate = ", ".join(f"{count} {kind}" for kind, count in counts.items() if count) or "empty"
+    lines = []
+    for record in records:
+        text = record["text"]
+        if len(text) > snippet_chars:
+            text = text[:snippet_chars].rstrip() + "..."
+        lines.append(f"- [{record['type']} #{record['id']}] {text}")
+    return CHAT_ASSISTANT.render(estate=estate, summary=summary or "(nothing yet)", records="\n".join(lines) or "(none)")
+
+
+CHAT_SUMMARY = register(PromptTemplate(
+    name="chat_summary",
+    version=1,
+    system="""
+You keep the running summary of a conversation between a data center engineer
+and DC-Ops Master, an operations assistant. Merge the new messages into the
+summary. Keep what later questions may refer back to: assets by name, hostname
+or IP, sites, metric values and alerts discussed, decisions, and open
+questions. Drop greetings and repeated explanations. Write plain sentences,
+no headings, and reply with the updated summary only.
+""",
+    task="""
+Summary so far:
+{summary}
+
+New messages:
+{messages}
+
+Updated summary (at most {max_chars} characters):
+""",
+))
+
+
+def chat_summary_prompt(summary: str, messages: List[Dict[str, str]], message_chars: int, max_chars: int) -> RenderedPrompt:
+    lines = []
+    for message in messages:
+        content = message["content"]
+        if len(content) > message_chars:
+            content = content[:message_chars].rstrip() + "..."
+        lines.append(f"{'Engineer' if message['role'] == 'user' else 'Assistant'}: {content}")
+    return CHAT_SUMMARY.render(summary=summary or "(empty)", messages="\n".join(lines), max_chars=max_chars)
+
+
+def chat_turns(history: List[Dict[str, str]], message: str) -> List[Dict[str, str]]:
+    """History plus the new message as alternating user/model turns.
+
+    Consecutive turns with the same role (a reply that failed to save) are
+    merged, since the Anthropic API rejects them.
+    """
+    turns: List[Dict[str, str]] = []
+    for item in [*history, {"role": "user", "content": message}]:
+        role = "model" if item["role"] in ("model", "assistant") else "user"
+        if not item["content"]:
+            continue
+        if turns and turns[-1]["role"] == role:
+            turns[-1] = {"role": role, "content": f"{turns[-1]['content']}\n\n{item['content']}"}
+        else:
+            turns.append({"role": role, "content": item["content"]})
+    return turns
@@ -0,0 +1,160 @@
+"""Offline stand-in for the vision providers.
+
+``ReplayService`` answers ``extract_metrics_from_image`` from responses
+recorded earlier, keyed by the SHA-256 of the screenshot file, with a
+configurable latency distribution and injected errors, so the ingestion
+pipeline can be load-tested without calling a live LLM. Select it with
+LLM_PROVIDER=replay; it then replaces the whole provider chain.
+
+``chat_stream`` streams a canned answer with the same latency settings
+(plus LLM_REPLAY_TOKEN_MS between tokens), using only ``asyncio.sleep``, so
+CHAT_PROVIDER=replay exercises the streaming path without a network.
+
+Responses are recorded from live providers with LLM_REPLAY_RECORD=true or
+written directly with ``save_recording`` (see benchmarks/pipeline_throughput.py).
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from ..config import get_settings
+from .extraction_schema import METRIC_KEYS
+from .prompt_registry import RenderedPrompt
+
+settings = get_settings()
+
+_rng = random.Random()
+_IP = re.compile(r"\b\d{1,3}(?:\.\d{1,3}){3}\b")
+
+
+def replay_dir() -> Path:
+    return Path(settings.LLM_REPLAY_DIR or os.path.join(settings.UPLOAD_DIR, "llm_replay"))
+
+
+def image_key(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def save_recording(key: str, result: Dict[str, Any]) -> None:
+    """Store a provider result for ``key`` (an ``image_key``); the last recording wins."""
+    directory = replay_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    recording = {name: value for name, value in result.items() if name not in ("provider", "tier", "escalation")}
+    tmp = directory / f"{key}.json.tmp"
+    tmp.write_text(json.dumps(recording, default=str))
+    tmp.replace(directory / f"{key}.json")
+
+
+def record_response(file_path: str, result: Dict[str, Any]) -> None:
+    try:
+        save_recording(image_key(file_path), result)
+    except OSError as e:
+        print(f"LLM replay recording failed: {e}")
+
+
+def _latency_seconds() -> float:
+    """Log-normal around LLM_REPLAY_LATENCY_MEDIAN_MS, the usual shape of LLM latency."""
+    median = settings.LLM_REPLAY_LATENCY_MEDIAN_MS
+    if median <= 0:
+        return 0.0
+    return median * math.exp(_rng.gauss(0, settings.LLM_REPLAY_LATENCY_SIGMA)) / 1000
+
+
+def _synthetic(key: str) -> Dict[str, Any]:
+    """Deterministic stand-in for screenshots nobody recorded."""
+    rng = random.Random(key)
+    return {
+        "metrics": [
+            {"ip_address": None, "key": metric_key, "value": round(rng.uniform(0, 100), 1), "unit": "%", "confidence": 0.9}
+            for metric_key in METRIC_KEYS
+        ],
+        "raw_text": f"replay:synthetic:{key[:12]}",
+        "confidence": 0.9,
+        "status": "ok",
+        "capture_time": None,
+    }
+
+
+class ReplayService:
+    def __init__(self, api_key: Optional[str] = None, model_name: Optional[str] = None):
+        self.model_name = model_name or "replay"
+
+    def extract_metrics_from_image(self, file_path: str, prompt=None) -> Dict[str, Any]:
+        time.sleep(_latency_seconds())
+        if _rng.random() < settings.LLM_REPLAY_ERROR_RATE:
+            status = _rng.choice([int(s) for s in settings.LLM_REPLAY_ERROR_STATUSES.split(",") if s.strip()] or [500])
+            return {
+                "metrics": [],
+                "raw_text": None,
+                "confidence": 0.0,
+                "status": "error",
+                "capture_time": None,
+                "error": f"replay: injected HTTP {status}",
+                "error_type": "InjectedError",
+                "error_status": status,
+                "retry_after": 1.0 if status == 429 else None,
+            }
+
+        key = image_key(file_path)
+        path = replay_dir() / f"{key}.json"
+        if path.exists():
+            result = json.loads(path.read_text())
+            if isinstance(result.get("capture_time"), str):
+                result["capture_time"] = datetime.fromisoformat(result["capture_time"])
+        elif settings.LLM_REPLAY_MISS == "synthetic":
+            result = _synthetic(key)
+        else:
+            return {
+                "metrics": [],
+                "raw_text": None,
+                "confidence": 0.0,
+                "status": "error",
+                "capture_time": None,
+                "error": f"replay: no recording for {key[:12]}",
+                "error_type": "ReplayMiss",
+            }
+        result.setdefault("usage", {"input_tokens": None, "output_tokens": None, "cached_input_tokens": None})
+        return result
+
+    async def chat_stream(
+        self,
+        message: str,
+        prompt: RenderedPrompt,
+        history: List[Dict[str, str]],
+        tools=None
+    ) -> AsyncGenerator[str, None]:
+        await asyncio.sleep(_latency_seconds())
+        answer = (
+            f"Replay answer to {message!r} from prompt {prompt.version} "
+            f"with {len(history)} earlier messages in context."
+        )
+        if tools is not None:
+            # Stand-in for a model choosing tools: an IP asks for its metrics, "alert" for open alerts
+            calls = [("latest_metrics", {"asset": ip}) for ip in _IP.findall(message)]
+            if "alert" in message.lower():
+                calls.append(("open_alerts", {"limit": 5}))
+            for name, arguments in calls:
+                result = await tools.call(name, arguments)
+                rows = result.get("metrics") or result.get("alerts") or []
+                answer += f" {name}: {result['error']}." if "error" in result else f" {name}: {len(rows)} rows."
+        for index, word in enumerate(answer.split(" ")):
+            if index:
+                await asyncio.sleep(settings.LLM_REPLAY_TOKEN_MS / 1000)
+            yield word if index == 0 else f" {word}"
+
+    async def summarize(self, prompt: RenderedPrompt) -> str:
+        await asyncio.sleep(_latency_seconds())
+        folded = prompt.user.count("\nEngineer: ") + prompt.user.count("\nAssistant: ")
+        return f"Replay summary from {prompt.version}: {folded} more messages folded in."
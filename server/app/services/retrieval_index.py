@@ -0,0 +1,310 @@
+"""Local keyword index over the estate, used to pick chat context.
+
+The chat prompt used to carry every equipment row; it now carries the top-k
+records for the question, ranked with BM25 over equipment, device items,
+VMs, manuals, attachment metadata and recent or open alerts.
+
+The index lives in process memory and is built on first use. Committed ORM
+writes to the indexed tables mark the affected records stale (see the
+session listeners at the bottom), and stale records are reloaded before the
+next search, so a write costs one small query instead of a rebuild. Bulk
+statements and location edits mark a whole kind stale. Writes made by other
+worker processes are picked up by the full rebuild every
+CHAT_RETRIEVAL_REBUILD_SECONDS.
+"""
+import math
+import re
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, or_
+from sqlalchemy.orm import Session, joinedload
+
+from ..config import get_settings
+from ..models.alert import Alert
+from ..models.attachment import Attachment
+from ..models.device_item import DeviceItem
+from ..models.equipment import Equipment
+from ..models.manual import ManualContent
+from ..models.vm_item import VmItem
+
+settings = get_settings()
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:[._\-/:][a-z0-9]+)*")
+_SEPARATORS = re.compile(r"[._\-/:]")
+_STOPWORDS = {
+    "a", "an", "and", "any", "are", "at", "be", "by", "can", "do", "does", "for", "from", "have", "how",
+    "i", "in", "is", "it", "its", "me", "my", "of", "on", "or", "show", "the", "there", "this", "to",
+    "what", "when", "where", "which", "who", "why", "with",
+}
+
+# BM25 parameters (the usual defaults)
+_K1 = 1.2
+_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-case words; IPs and hostnames are kept whole and also split into parts."""
+    tokens = []
+    for match in _TOKEN.findall(text.lower()):
+        if match in _STOPWORDS:
+            continue
+        tokens.append(match)
+        parts = [part for part in _SEPARATORS.split(match) if part]
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+def _join(*values) -> str:
+    return " | ".join(str(v) for v in values if v not in (None, "", []))
+
+
+def _location(item) -> Optional[str]:
+    location = item.location
+    return f"{location.name} ({location.code})" if location is not None else None
+
+
+def _equipment_docs(db: Session, ids=None):
+    query = db.query(Equipment)
+    if ids is not None:
+        query = query.filter(Equipment.id.in_(ids))
+    for eq in query:
+        yield eq.id, _join(eq.name, eq.vendor, eq.model, eq.area, eq.type, f"SOP {eq.sop_status}", eq.web_support)
+
+
+def _device_docs(db: Session, ids=None):
+    query = db.query(DeviceItem).options(joinedload(DeviceItem.location), joinedload(DeviceItem.equipment))
+    if ids is not None:
+        query = query.filter(DeviceItem.id.in_(ids))
+    for item in query:
+        model = item.model or (f"{item.equipment.vendor} {item.equipment.model}" if item.equipment else None)
+        yield item.id, _join(
+            item.device_name, item.hostname, item.ip_address, item.category, model, item.version,
+            _location(item), item.rack_position, item.status, item.description,
+        )
+
+
+def _vm_docs(db: Session, ids=None):
+    query = db.query(VmItem).options(joinedload(VmItem.location))
+    if ids is not None:
+        query = query.filter(VmItem.id.in_(ids))
+    for vm in query:
+        yield vm.id, _join(
+            vm.name, vm.hostname, vm.ip_address, vm.role, vm.os, vm.project, vm.tier,
+            f"host {vm.host_ip}" if vm.host_ip else None, _location(vm),
+        )
+
+
+def _manual_docs(db: Session, ids=None):
+    query = db.query(ManualContent).options(joinedload(ManualContent.equipment))
+    if ids is not None:
+        query = query.filter(ManualContent.id.in_(ids))
+    for manual in query:
+        equipment = manual.equipment
+        title = f"SOP manual for {equipment.vendor} {equipment.model} ({equipment.name})" if equipment else "SOP manual"
+        steps = [*(manual.monitoring or []), *(manual.maintenance or []), *(manual.troubleshooting or [])]
+        yield manual.id, _join(title, manual.summary, *steps)
+
+
+def _attachment_docs(db: Session, ids=None):
+    # Only metadata is indexed: documents are stored as files/URLs without extracted text.
+    query = db.query(Attachment).options(joinedload(Attachment.equipment)).filter(Attachment.is_published.is_(True))
+    if ids is not None:
+        query = query.filter(Attachment.id.in_(ids))
+    for attachment in query:
+        equipment = attachment.equipment
+        metadata = attachment.file_metadata or {}
+        yield attachment.id, _join(
+            attachment.name, f"{attachment.document_category} {attachment.type}",
+            f"for {equipment.name}" if equipment else None, metadata.get("author"),
+        )
+
+
+def _alert_docs(db: Session, ids=None):
+    since = datetime.utcnow() - timedelta(days=settings.CHAT_RETRIEVAL_ALERT_DAYS)
+    query = db.query(Alert).options(joinedload(Alert.device_item), joinedload(Alert.vm_item)).filter(
+        or_(Alert.status.in_(["open", "ack", "in_progress"]), Alert.detected_at >= since)
+    )
+    if ids is not None:
+        query = query.filter(Alert.id.in_(ids))
+    for alert in query:
+        asset = alert.device_item or alert.vm_item
+        asset_text = None
+        if asset is not None:
+            asset_text = f"on {getattr(asset, 'device_name', None) or asset.name} {asset.hostname or ''} {asset.ip_address or ''}"
+        value = f"value {alert.latest_value:g}" if alert.latest_value is not None else None
+        detected = alert.detected_at.strftime("%Y-%m-%d %H:%M") if alert.detected_at else None
+        yield alert.id, _join(f"{alert.status} {alert.severity} alert", alert.summary, asset_text, value, detected)
+
+
+# kind -> (table, loader(db, ids) yielding (id, text))
+SOURCES = {
+    "equipment": ("equipment", _equipment_docs),
+    "device": ("device_items", _device_docs),
+    "vm": ("vm_items", _vm_docs),
+    "manual": ("manual_contents", _manual_docs),
+    "attachment": ("attachments", _attachment_docs),
+    "alert": ("alerts", _alert_docs),
+}
+_KIND_BY_TABLE = {table: kind for kind, (table, _) in SOURCES.items()}
+# Tables whose rows are copied into documents of other kinds; a write re-reads those kinds
+_DEPENDENT_KINDS = {"locations": ("device", "vm"), "equipment": ("manual", "attachment")}
+
+
+class RetrievalIndex:
+    """In-memory BM25 index; documents are keyed by (kind, record id)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._texts: Dict[Tuple[str, int], str] = {}
+        self._lengths: Dict[Tuple[str, int], int] = {}
+        self._postings: Dict[str, Dict[Tuple[str, int], int]] = defaultdict(dict)
+        self._total_length = 0
+        self._built_at: Optional[float] = None
+        self._stale: Set[Tuple[str, int]] = set()
+        self._stale_kinds: Set[str] = set()
+
+    # -- maintenance -------------------------------------------------------
+
+    def _add(self, key: Tuple[str, int], text: str):
+        self._remove(key)
+        counts = Counter(tokenize(text))
+        self._texts[key] = text
+        self._lengths[key] = sum(counts.values())
+        self._total_length += self._lengths[key]
+        for term, count in counts.items():
+            self._postings[term][key] = count
+
+    def _remove(self, key: Tuple[str, int]):
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        self._total_length -= self._lengths.pop(key)
+        for term in set(tokenize(text)):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(key, None)
+                if not postings:
+                    del self._postings[term]
+
+    def _load_kind(self, db: Session, kind: str):
+        for key in [key for key in self._texts if key[0] == kind]:
+            self._remove(key)
+        for record_id, text in SOURCES[kind][1](db):
+            self._add((kind, record_id), text)
+
+    def mark_stale(self, changes: Iterable[Tuple[str, Optional[int]]]):
+        """Record committed writes as (table, id); an id of None marks the whole table."""
+        with self._lock:
+            for table, record_id in changes:
+                kind = _KIND_BY_TABLE.get(table)
+                if kind is not None:
+                    if record_id is None:
+                        self._stale_kinds.add(kind)
+                    else:
+                        self._stale.add((kind, record_id))
+                self._stale_kinds.update(_DEPENDENT_KINDS.get(table, ()))
+
+    def _refresh(self, db: Session):
+        if self._built_at is None or time.monotonic() - self._built_at > settings.CHAT_RETRIEVAL_REBUILD_SECONDS:
+            self._texts.clear()
+            self._lengths.clear()
+            self._postings.clear()
+            self._total_length = 0
+            self._stale.clear()
+            self._stale_kinds.clear()
+            for kind in SOURCES:
+                self._load_kind(db, kind)
+            self._built_at = time.monotonic()
+            return
+
+        kinds, self._stale_kinds = self._stale_kinds, set()
+        for kind in kinds:
+            self._load_kind(db, kind)
+        stale, self._stale = {key for key in self._stale if key[0] not in kinds}, set()
+        by_kind: Dict[str, List[int]] = defaultdict(list)
+        for kind, record_id in stale:
+            by_kind[kind].append(record_id)
+        for kind, ids in by_kind.items():
+            found = dict(SOURCES[kind][1](db, ids))
+            for record_id in ids:
+                if record_id in found:
+                    self._add((kind, record_id), found[record_id])
+                else:
+                    self._remove((kind, record_id))  # deleted, or (alerts) fell out of the window
+
+    # -- queries -----------------------------------------------------------
+
+    def search(self, db: Session, query: str, k: int) -> List[Dict[str, Any]]:
+        """Top ``k`` records for ``query`` as ``{"type", "id", "text", "score"}``, best first."""
+        with self._lock:
+            self._refresh(db)
+            total = len(self._texts)
+            if not total:
+                return []
+            average = self._total_length / total or 1.0
+            scores: Dict[Tuple[str, int], float] = defaultdict(float)
+            for term in set(tokenize(query)):
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+                for key, count in postings.items():
+                    norm = count + _K1 * (1 - _B + _B * self._lengths[key] / average)
+                    scores[key] += idf * count * (_K1 + 1) / norm
+            best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+            return [
+                {"type": kind, "id": record_id, "text": self._texts[(kind, record_id)], "score": round(score, 3)}
+                for (kind, record_id), score in best
+            ]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            counts = Counter(kind for kind, _ in self._texts)
+            return {kind: counts.get(kind, 0) for kind in SOURCES}
+
+
+retrieval_index = RetrievalIndex()
+
+
+_WATCHED_TABLES = set(_KIND_BY_TABLE) | set(_DEPENDENT_KINDS)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_writes(session: Session, flush_context):
+    changes = session.info.setdefault("retrieval_changes", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = obj.__table__.name
+        if table in _WATCHED_TABLES:
+            changes.add((table, obj.id))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_writes(orm_execute_state):
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.local_table.name in _WATCHED_TABLES:
+        orm_execute_state.session.info.setdefault("retrieval_changes", set()).add((mapper.local_table.name, None))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_writes(session: Session):
+    changes = session.info.pop("retrieval_changes", None)
+    if changes:
+        retrieval_index.mark_stale(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_rolled_back_writes(session: Session):
+    session.info.pop("retrieval_changes", None)
+
+
+def chat_context(db: Session, question: str) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """Records relevant to ``question`` and the number of indexed records per kind."""
+    records = retrieval_index.search(db, question, settings.CHAT_RETRIEVAL_TOP_K)
+    return records, retrieval_index.counts()
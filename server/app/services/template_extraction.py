@@ -0,0 +1,181 @@
+"""Deterministic extraction for known dashboard layouts.
+
+A ``DashboardTemplate`` stores where each (ip_address, key) value sits on a
+fixed Grafana layout. Matching uploads are cropped at those boxes and read
+with local OCR (Tesseract via pytesseract), skipping the vision LLM. Any
+unreadable or out-of-range value rejects the whole read so the caller falls
+back to the LLM. Templates can be learned from an upload whose extracted
+metrics were confirmed, by locating each value on the screenshot.
+"""
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..models.dashboard_template import DashboardTemplate
+from ..models.monitoring_upload import MonitoringUpload
+from .extraction_schema import parse_number
+
+settings = get_settings()
+
+ASPECT_TOLERANCE = 0.03  # relative difference between screenshot and template aspect ratios
+TEMPLATE_CONFIDENCE = 0.95
+BOX_PADDING = 0.25  # of the word box, on each side, when learning
+_DIGITS_CONFIG = "--psm 7 -c tessedit_char_whitelist=0123456789.,%"
+
+
+class TemplateLearningError(Exception):
+    pass
+
+
+@lru_cache(maxsize=1)
+def _ocr():
+    """pytesseract, or None when the package or the tesseract binary is missing.
+
+    Checked once per process: the version check spawns the tesseract binary.
+    """
+    try:
+        import pytesseract
+    except ImportError:
+        return None
+    if settings.TESSERACT_CMD:
+        pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_CMD
+    try:
+        pytesseract.get_tesseract_version()
+    except Exception:
+        return None
+    return pytesseract
+
+
+def _for_ocr(image):
+    """Greyscale, dark text on light background, upscaled: what Tesseract reads best."""
+    from PIL import Image, ImageOps, ImageStat
+
+    grey = ImageOps.grayscale(image)
+    if ImageStat.Stat(grey).mean[0] < 128:  # Grafana dark theme
+        grey = ImageOps.invert(grey)
+    grey = ImageOps.autocontrast(grey)
+    if grey.size[1] < 60:
+        scale = 60 / max(1, grey.size[1])
+        grey = grey.resize((max(1, int(grey.size[0] * scale)), 60), Image.LANCZOS)
+    return grey
+
+
+def _is_valid(value: Optional[float], unit: Optional[str]) -> bool:
+    if value is None or value < 0:
+        return False
+    return value <= 100 if unit == "%" else True
+
+
+def find_template(db: Session, upload: MonitoringUpload) -> Optional[DashboardTemplate]:
+    query = db.query(DashboardTemplate).filter(DashboardTemplate.is_enabled.is_(True))
+    if upload.dashboard_label:
+        template = query.filter(
+            func.lower(DashboardTemplate.match_label) == upload.dashboard_label.strip().lower()
+        ).first()
+        if template:
+            return template
+    asset = upload.device_item or upload.vm_item
+    if asset is not None and asset.grafana_url:
+        return query.filter(DashboardTemplate.match_grafana_url == asset.grafana_url).first()
+    return None
+
+
+def extract_with_template(template: DashboardTemplate, file_path: str) -> Optional[Dict[str, Any]]:
+    """Read every region of ``template``; None means "use the LLM instead"."""
+    ocr = _ocr()
+    if ocr is None or not template.regions:
+        return None
+    from PIL import Image
+
+    with Image.open(file_path) as image:
+        image.load()
+        width, height = image.size
+        expected = template.width / template.height
+        if abs(width / height - expected) / expected > ASPECT_TOLERANCE:
+            return None
+
+        metrics = []
+        for region in template.regions:
+            x0, y0, x1, y1 = region["box"]
+            crop = image.crop((round(x0 * width), round(y0 * height), round(x1 * width), round(y1 * height)))
+            value = parse_number(ocr.image_to_string(_for_ocr(crop), config=_DIGITS_CONFIG))
+            if not _is_valid(value, region.get("unit")):
+                return None
+            metrics.append({
+                "ip_address": region.get("ip_address"),
+                "key": region["key"],
+                "value": value,
+                "unit": region.get("unit"),
+                "confidence": TEMPLATE_CONFIDENCE,
+            })
+
+    return {
+        "metrics": metrics,
+        "raw_text": f"template:{template.name}",
+        "confidence": TEMPLATE_CONFIDENCE,
+        "status": "ok",
+        "capture_time": None,
+        "extractor": "template",
+    }
+
+
+def learn_regions(file_path: str, metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Locate each confirmed metric value on the screenshot and return template geometry.
+
+    A value is matched to an OCR word with the same number; when several words
+    match, the one on the same text line as the metric's IP address wins.
+    """
+    ocr = _ocr()
+    if ocr is None:
+        raise TemplateLearningError("Local OCR engine (tesseract) is not available")
+    from PIL import Image
+
+    with Image.open(file_path) as image:
+        image.load()
+        width, height = image.size
+        data = ocr.image_to_data(_for_ocr(image.convert("RGB")), output_type=ocr.Output.DICT)
+
+    words = [
+        {"text": text.strip(), "box": (left, top, left + w, top + h)}
+        for text, left, top, w, h in zip(data["text"], data["left"], data["top"], data["width"], data["height"])
+        if text and text.strip()
+    ]
+
+    def same_line(a, b):
+        return a[1] < b[3] and b[1] < a[3]
+
+    regions, missing = [], []
+    for metric in metrics:
+        if metric.get("value") is None or not metric.get("key"):
+            continue
+        target = float(metric["value"])
+        candidates = [w for w in words if (v := parse_number(w["text"])) is not None and abs(v - target) < 0.05]
+        ip = metric.get("ip_address")
+        if len(candidates) > 1 and ip:
+            ip_boxes = [w["box"] for w in words if w["text"] == ip]
+            candidates = [c for c in candidates if any(same_line(c["box"], box) for box in ip_boxes)]
+        if len(candidates) != 1:
+            missing.append(f"{ip or '-'} {metric['key']}={metric['value']}")
+            continue
+        x0, y0, x1, y1 = candidates[0]["box"]
+        pad_x, pad_y = (x1 - x0) * BOX_PADDING, (y1 - y0) * BOX_PADDING
+        regions.append({
+            "ip_address": ip,
+            "key": metric["key"],
+            "unit": metric.get("unit"),
+            "box": [
+                round(max(0.0, (x0 - pad_x) / width), 5),
+                round(max(0.0, (y0 - pad_y) / height), 5),
+                round(min(1.0, (x1 + pad_x) / width), 5),
+                round(min(1.0, (y1 + pad_y) / height), 5),
+            ],
+        })
+
+    if missing:
+        raise TemplateLearningError("Could not locate a unique value for: " + ", ".join(missing[:10]))
+    if not regions:
+        raise TemplateLearningError("Upload has no confirmed metric values to learn from")
+    return {"width": width, "height": height, "regions": regions}
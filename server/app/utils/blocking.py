@@ -0,0 +1,52 @@
+"""Bounded thread pools for blocking work started from the event loop.
+
+Sync background tasks would otherwise run on Starlette's shared threadpool,
+which also serves sync dependencies such as ``get_db``; an extraction stuck
+in rate-limiter waits there starves ordinary requests. ``run_blocking``
+keeps short blocking calls (chat context loads and saves, tool queries, the
+summary writer) on a pool of BLOCKING_POOL_SIZE threads. Upload extraction
+holds its thread for a whole provider call, so ``run_extraction`` gives it
+its own pool of EXTRACTION_POOL_SIZE threads; a burst of uploads then
+queues behind itself instead of behind chat.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict
+
+from ..config import get_settings
+
+settings = get_settings()
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def _executor(name: str, size: int) -> ThreadPoolExecutor:
+    with _lock:
+        executor = _executors.get(name)
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=max(1, size), thread_name_prefix=name)
+            _executors[name] = executor
+        return executor
+
+
+def blocking_executor() -> ThreadPoolExecutor:
+    return _executor("blocking", settings.BLOCKING_POOL_SIZE)
+
+
+def extraction_executor() -> ThreadPoolExecutor:
+    return _executor("extraction", settings.EXTRACTION_POOL_SIZE)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Await ``func(*args, **kwargs)`` on the bounded pool without blocking the loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(blocking_executor(), partial(func, *args, **kwargs))
+
+
+async def run_extraction(func, *args, **kwargs):
+    """Like ``run_blocking``, on the pool reserved for upload extraction."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(extraction_executor(), partial(func, *args, **kwargs))
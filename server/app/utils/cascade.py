@@ -0,0 +1,91 @@
+import threading
+from collections import deque
+from typing import Any, Dict, Optional
+
+from ..config import get_settings
+from .hedging import percentile
+
+settings = get_settings()
+
+FAST = "fast"
+STRONG = "strong"
+
+
+def escalation_reason(result: Dict[str, Any]) -> Optional[str]:
+    """Why a fast-tier extraction is not good enough to keep, or None to keep it."""
+    if result.get("status", "ok") != "ok" or result.get("error"):
+        return "error"
+    if result.get("warning"):
+        return "partial_output"
+    metrics = result.get("metrics") or []
+    if not metrics:
+        return "no_metrics"
+    if (result.get("confidence") or 0) < settings.LLM_CASCADE_MIN_CONFIDENCE:
+        return "low_confidence"
+    mean_confidence = sum(m.get("confidence") or 0 for m in metrics) / len(metrics)
+    if mean_confidence < settings.LLM_CASCADE_MIN_CONFIDENCE:
+        return "low_confidence"
+    nulls = sum(1 for m in metrics if m.get("value") is None)
+    if nulls / len(metrics) > settings.LLM_CASCADE_MAX_NULL_FRACTION:
+        return "missing_values"
+    for metric in metrics:
+        value = metric.get("value")
+        if value is not None and (value < 0 or (metric.get("unit") == "%" and value > 100)):
+            return "out_of_range"
+    return None
+
+
+class CascadeStats:
+    """Per-process usage of the two cascade tiers.
+
+    Cost is in fast-call units (a strong call counts LLM_CASCADE_STRONG_COST_RATIO)
+    and is compared with sending every screenshot straight to the strong tier.
+    """
+
+    def __init__(self, window: int = 500):
+        self._latency = {FAST: deque(maxlen=window), STRONG: deque(maxlen=window), "total": deque(maxlen=window)}
+        self.requests = 0
+        self.calls = {FAST: 0, STRONG: 0}
+        self.accepted = {FAST: 0, STRONG: 0}
+        self.escalations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record_call(self, tier: str, latency_ms: float):
+        with self._lock:
+            self.calls[tier] += 1
+            self._latency[tier].append(latency_ms)
+
+    def record_escalation(self, reason: str):
+        with self._lock:
+            self.escalations[reason] = self.escalations.get(reason, 0) + 1
+
+    def finish_request(self, tier: str, latency_ms: float):
+        with self._lock:
+            self.requests += 1
+            self.accepted[tier] += 1
+            self._latency["total"].append(latency_ms)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            ratio = settings.LLM_CASCADE_STRONG_COST_RATIO
+            cost = self.calls[FAST] + self.calls[STRONG] * ratio
+            escalated = sum(self.escalations.values())
+            return {
+                "enabled": settings.LLM_CASCADE_ENABLED,
+                "requests": self.requests,
+                "fast_calls": self.calls[FAST],
+                "strong_calls": self.calls[STRONG],
+                "accepted_fast": self.accepted[FAST],
+                "accepted_strong": self.accepted[STRONG],
+                "escalations": dict(self.escalations),
+                "escalation_rate": (escalated / self.calls[FAST]) if self.calls[FAST] else 0.0,
+                "cost_per_request": (cost / self.requests) if self.requests else None,
+                "strong_only_cost_per_request": ratio,
+                "fast_p50_ms": percentile(list(self._latency[FAST]), 0.5),
+                "strong_p50_ms": percentile(list(self._latency[STRONG]), 0.5),
+                "total_p50_ms": percentile(list(self._latency["total"]), 0.5),
+                "total_p99_ms": percentile(list(self._latency["total"]), 0.99),
+            }
+
+
+cascade_stats = CascadeStats()
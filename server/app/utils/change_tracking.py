@@ -0,0 +1,89 @@
+from datetime import datetime
+from typing import Dict, Iterable
+from sqlalchemy import event, insert, update
+from sqlalchemy.orm import Session
+from ..models.resource_version import ResourceVersion
+from ..models.deleted_record import DeletedRecord
+
+# Tables whose writes are counted in resource_versions. Anything served through
+# the response cache must be listed here, otherwise its ETag never changes.
+TRACKED_TABLES = {
+    "device_items",
+    "vm_items",
+    "locations",
+    "equipment",
+    "attachments",
+    "metric_definitions",
+    "metric_groups",
+}
+
+# Tables replicated through the /sync change feed; deletes leave a tombstone.
+SYNC_TABLES = {"device_items", "vm_items", "locations", "equipment"}
+
+
+def _bump(session: Session, tables: Iterable[str]):
+    conn = session.connection()
+    table = ResourceVersion.__table__
+    now = datetime.utcnow()
+    for name in sorted(set(tables)):
+        result = conn.execute(
+            update(table)
+            .where(table.c.resource == name)
+            .values(version=table.c.version + 1, updated_at=now)
+        )
+        if result.rowcount == 0:
+            conn.execute(insert(table).values(resource=name, version=1, updated_at=now))
+
+
+def _record_tombstones(session: Session, deleted):
+    rows = [
+        {"resource": obj.__table__.name, "record_id": obj.id, "deleted_at": datetime.utcnow()}
+        for obj in deleted
+        if obj.__table__.name in SYNC_TABLES
+    ]
+    if rows:
+        session.connection().execute(insert(DeletedRecord.__table__), rows)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_writes(session: Session, flush_context):
+    _record_tombstones(session, session.deleted)
+    touched = set()
+    for obj in list(session.new) + list(session.deleted):
+        touched.add(obj.__table__.name)
+    for obj in session.dirty:
+        if session.is_modified(obj, include_collections=False):
+            touched.add(obj.__table__.name)
+    touched &= TRACKED_TABLES
+    if touched:
+        _bump(session, touched)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_writes(orm_execute_state):
+    # Bulk insert/update/delete statements bypass the flush, so count them here.
+    # Bulk deletes do not know their row ids and leave no tombstones; delete
+    # rows of SYNC_TABLES through the session instead.
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.local_table.name in TRACKED_TABLES:
+        _bump(orm_execute_state.session, [mapper.local_table.name])
+
+
+def ensure_resource_versions(db: Session):
+    """Create a counter row for every tracked table that does not have one yet."""
+    existing = {r.resource for r in db.query(ResourceVersion.resource).all()}
+    for name in sorted(TRACKED_TABLES - existing):
+        db.add(ResourceVersion(resource=name, version=0))
+    db.commit()
+
+
+def get_versions(db: Session, tables: Iterable[str]) -> Dict[str, int]:
+    tables = list(tables)
+    rows = db.query(ResourceVersion.resource, ResourceVersion.version).filter(
+        ResourceVersion.resource.in_(tables)
+    ).all()
+    versions = {name: 0 for name in tables}
+    versions.update({r.resource: r.version for r in rows})
+    return versions
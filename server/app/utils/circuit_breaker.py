@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional, Union
+
+from ..config import get_settings
+
+settings = get_settings()
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+PROBE = "probe"  # truthy admission returned by allow() for the half-open probe
+
+
+class CircuitBreaker:
+    """Per-process breaker over a rolling window of call outcomes.
+
+    Opens when, once ``min_calls`` outcomes are in the window, the share of
+    failed or slow calls reaches ``failure_rate``. After ``open_seconds`` one
+    probe call is let through (half-open): success closes the breaker with a
+    fresh window, failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        window: int = 20,
+        min_calls: int = 5,
+        failure_rate: float = 0.5,
+        slow_call_ms: float = 30000,
+        open_seconds: float = 60,
+    ):
+        self.name = name
+        self.window = window
+        self.min_calls = min_calls
+        self.failure_rate = failure_rate
+        self.slow_call_ms = slow_call_ms
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._outcomes: deque = deque(maxlen=window)  # (ok, latency_ms)
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def available(self) -> bool:
+        """Whether ``allow`` would admit a call now, without taking the half-open probe."""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                return time.monotonic() - self.opened_at >= self.open_seconds
+            return not self._probe_in_flight
+
+    def allow(self) -> Union[bool, str]:
+        """Admit a call: True, PROBE for the single half-open probe, or False.
+
+        The caller reports the outcome with ``record``, or hands the admission
+        back with ``release`` if the provider was never called.
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.open_seconds:
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return PROBE
+            return False
+
+    def release(self, admission: Union[bool, str]):
+        """Return an admission whose call never happened, without recording an outcome."""
+        if admission != PROBE:
+            return
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+
+    def record(self, ok: bool, latency_ms: float, error: Optional[str] = None):
+        slow = latency_ms >= self.slow_call_ms
+        with self._lock:
+            if error:
+                self.last_error = error
+            if self.state == HALF_OPEN:
+                self._probe_in_flight = False
+                if ok and not slow:
+                    self.state = CLOSED
+                    self._outcomes.clear()
+                else:
+                    self._trip()
+                return
+            self._outcomes.append((ok and not slow, latency_ms))
+            if self.state == CLOSED and len(self._outcomes) >= self.min_calls:
+                bad = sum(1 for good, _ in self._outcomes if not good)
+                if bad / len(self._outcomes) >= self.failure_rate:
+                    self._trip()
+
+    def _trip(self):
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            calls = len(self._outcomes)
+            bad = sum(1 for good, _ in self._outcomes if not good)
+            latency = [ms for _, ms in self._outcomes]
+            retry_in = None
+            if self.state == OPEN:
+                retry_in = max(0.0, self.open_seconds - (time.monotonic() - self.opened_at))
+            return {
+                "state": self.state,
+                "calls": calls,
+                "failure_rate": (bad / calls) if calls else 0.0,
+                "avg_latency_ms": (sum(latency) / calls) if calls else None,
+                "retry_in_seconds": retry_in,
+                "last_error": self.last_error,
+            }
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                name,
+                window=settings.LLM_BREAKER_WINDOW,
+                min_calls=settings.LLM_BREAKER_MIN_CALLS,
+                failure_rate=settings.LLM_BREAKER_FAILURE_RATE,
+                slow_call_ms=settings.LLM_BREAKER_SLOW_CALL_MS,
+                open_seconds=settings.LLM_BREAKER_OPEN_SECONDS,
+            )
+            _breakers[name] = breaker
+        return breaker
+
+
+def peek_breaker(name: str) -> Optional[CircuitBreaker]:
+    return _breakers.get(name)
@@ -0,0 +1,109 @@
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+from ..config import get_settings
+
+settings = get_settings()
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class LatencyTracker:
+    """Recent successful-call latencies for one provider, used to pick the hedge delay."""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float):
+        with self._lock:
+            self._samples.append(latency_ms)
+
+    def hedge_delay_ms(self) -> float:
+        with self._lock:
+            samples = list(self._samples)
+        if len(samples) < settings.LLM_HEDGE_MIN_SAMPLES:
+            return settings.LLM_HEDGE_DEFAULT_DELAY_MS
+        return max(settings.LLM_HEDGE_MIN_DELAY_MS, percentile(samples, settings.LLM_HEDGE_PERCENTILE))
+
+
+class HedgeStats:
+    """Per-process hedging budget and latency report.
+
+    ``observed`` is what callers waited; ``primary`` is what they would have
+    waited without hedging (the first provider's own latency, recorded even
+    when it lost the race), so the two percentiles show the tail cut.
+    """
+
+    def __init__(self, window: int = 500):
+        self._hedged: deque = deque(maxlen=window)
+        self._observed: deque = deque(maxlen=window)
+        self._primary: deque = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def start_request(self):
+        with self._lock:
+            self.requests += 1
+            self._hedged.append(False)
+
+    def try_hedge(self) -> bool:
+        """Spend hedge budget for the current request, if any is left."""
+        with self._lock:
+            budget = max(1, int(len(self._hedged) * settings.LLM_HEDGE_BUDGET_PERCENT / 100))
+            if sum(self._hedged) >= budget:
+                return False
+            self._hedged[-1] = True
+            self.hedges += 1
+            return True
+
+    def finish_request(self, observed_ms: float, won_by_hedge: bool):
+        with self._lock:
+            self._observed.append(observed_ms)
+            if won_by_hedge:
+                self.hedge_wins += 1
+
+    def record_primary(self, latency_ms: float):
+        with self._lock:
+            self._primary.append(latency_ms)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            observed = list(self._observed)
+            primary = list(self._primary)
+            return {
+                "enabled": settings.LLM_HEDGE_ENABLED,
+                "requests": self.requests,
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "hedge_rate": (self.hedges / self.requests) if self.requests else 0.0,
+                "budget_percent": settings.LLM_HEDGE_BUDGET_PERCENT,
+                "observed_p50_ms": percentile(observed, 0.5),
+                "observed_p99_ms": percentile(observed, 0.99),
+                "primary_p50_ms": percentile(primary, 0.5),
+                "primary_p99_ms": percentile(primary, 0.99),
+            }
+
+
+_trackers: Dict[str, LatencyTracker] = {}
+_trackers_lock = threading.Lock()
+
+hedge_stats = HedgeStats()
+
+
+def get_latency_tracker(name: str) -> LatencyTracker:
+    with _trackers_lock:
+        tracker = _trackers.get(name)
+        if tracker is None:
+            tracker = LatencyTracker()
+            _trackers[name] = tracker
+        return tracker
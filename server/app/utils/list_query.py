@@ -0,0 +1,165 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import DateTime, Integer, String, and_, func, or_
+from sqlalchemy.orm import Session
+
+
+class ListParams:
+    """Paging, sorting, search and projection options shared by list endpoints.
+
+    Every option is optional: without ``limit`` the full list is returned, so
+    existing clients keep working unchanged.
+    """
+
+    def __init__(
+        self,
+        sort: Optional[str] = Query(None, description="Comma-separated fields; prefix with - for descending"),
+        limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to return every row"),
+        cursor: Optional[str] = Query(None, description="Value of X-Next-Cursor from the previous page"),
+        fields: Optional[str] = Query(None, description="Comma-separated subset of fields to return"),
+        q: Optional[str] = Query(None, description="Case-insensitive text search"),
+    ):
+        self.sort = sort
+        self.limit = limit
+        self.cursor = cursor
+        self.fields = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+        self.q = q.strip() if q and q.strip() else None
+
+
+class Page:
+    def __init__(self, items: List[Dict[str, Any]], next_cursor: Optional[str] = None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _sort_expr(expr, table):
+    # A NOT NULL column of the listed table (the id tiebreaker among them) is
+    # compared as is, so its index can serve the keyset filter and the order.
+    if getattr(expr, "nullable", True) is False and getattr(expr, "table", None) is table:
+        return expr
+    # NULLs break row-value comparisons, so sort on a non-null stand-in.
+    if isinstance(expr.type, String):
+        return func.coalesce(expr, "")
+    if isinstance(expr.type, Integer):
+        return func.coalesce(expr, 0)
+    return expr
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def _decode_cursor(cursor: str, exprs: Sequence[Any]) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise _bad_request("Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(exprs):
+        raise _bad_request("Cursor does not match sort order")
+    decoded = []
+    for expr, value in zip(exprs, values):
+        if value is not None and isinstance(expr.type, DateTime):
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError):
+                raise _bad_request("Invalid cursor")
+        decoded.append(value)
+    return decoded
+
+
+class ListQuery:
+    """Keyset-paginated column projection over one table and its lookups.
+
+    ``columns`` maps public field names to SQL expressions and doubles as the
+    whitelist for ``sort`` and ``fields``. Only the requested fields (plus the
+    sort keys) are selected from the database.
+    """
+
+    def __init__(
+        self,
+        model,
+        columns: Dict[str, Any],
+        joins: Sequence[Tuple[Any, Any]] = (),
+        search: Sequence[str] = (),
+        default_sort: str = "id",
+    ):
+        self.model = model
+        self.columns = columns
+        self.joins = joins
+        self.search = search
+        self.default_sort = default_sort
+
+    def _parse_sort(self, sort: Optional[str]) -> List[Tuple[str, bool]]:
+        keys = []
+        for part in (sort or self.default_sort).split(","):
+            part = part.strip()
+            if not part:
+                continue
+            descending = part.startswith("-")
+            name = part.lstrip("-+")
+            if name not in self.columns:
+                raise _bad_request(f"Cannot sort by '{name}'")
+            keys.append((name, descending))
+        # id breaks ties so the keyset is unique
+        if not any(name == "id" for name, _ in keys):
+            keys.append(("id", False))
+        return keys
+
+    def fetch(self, db: Session, params: ListParams, filters: Sequence[Any] = ()) -> Page:
+        fields = params.fields or list(self.columns)
+        unknown = [f for f in fields if f not in self.columns]
+        if unknown:
+            raise _bad_request(f"Unknown fields: {', '.join(unknown)}")
+
+        sort_keys = self._parse_sort(params.sort)
+        sort_exprs = [_sort_expr(self.columns[name], self.model.__table__) for name, _ in sort_keys]
+
+        selected = [self.columns[f].label(f) for f in fields]
+        selected += [expr.label(f"_k{i}") for i, expr in enumerate(sort_exprs)]
+
+        query = db.query(*selected).select_from(self.model)
+        for target, onclause in self.joins:
+            query = query.outerjoin(target, onclause)
+        for condition in filters:
+            query = query.filter(condition)
+        if params.q and self.search:
+            pattern = f"%{params.q}%"
+            query = query.filter(or_(*[self.columns[name].ilike(pattern) for name in self.search]))
+
+        if params.cursor:
+            values = _decode_cursor(params.cursor, sort_exprs)
+            # (a, b, id) > (va, vb, vid) expanded so each key can have its own direction
+            branches = []
+            for i, ((_, descending), expr) in enumerate(zip(sort_keys, sort_exprs)):
+                equal = [sort_exprs[j] == values[j] for j in range(i)]
+                step = expr < values[i] if descending else expr > values[i]
+                branches.append(and_(*equal, step))
+            query = query.filter(or_(*branches))
+
+        query = query.order_by(*[
+            expr.desc() if descending else expr.asc()
+            for (_, descending), expr in zip(sort_keys, sort_exprs)
+        ])
+
+        if params.limit:
+            rows = query.limit(params.limit + 1).all()
+        else:
+            rows = query.all()
+
+        next_cursor = None
+        if params.limit and len(rows) > params.limit:
+            rows = rows[:params.limit]
+            last = rows[-1]._mapping
+            next_cursor = _encode_cursor([last[f"_k{i}"] for i in range(len(sort_exprs))])
+
+        items = [{f: row._mapping[f] for f in fields} for row in rows]
+        return Page(items, next_cursor)
@@ -0,0 +1,80 @@
+"""Per-call LLM ledger: who served each extraction call, how long it took,
+how many tokens it used and what it cost.
+
+Rows are written from the provider-call wrapper in
+MetricsExtractionService; a ledger failure is logged and never fails the
+extraction.
+"""
+from typing import Any, Dict, Optional
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.llm_call import LlmCall
+
+settings = get_settings()
+
+# USD per million (input, output) tokens, matched by longest model-name prefix.
+# List prices at the time of writing; override or extend with LLM_PRICES_PER_MTOK.
+MODEL_PRICES_PER_MTOK = {
+    "gemini-2.0-flash-lite": (0.075, 0.30),
+    "gemini-2.0-flash": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+    "gpt-4o-mini": (0.15, 0.60),
+    "gpt-4o": (2.50, 10.00),
+    "gpt-4.1-mini": (0.40, 1.60),
+    "gpt-4.1": (2.00, 8.00),
+    "claude-3-5-haiku": (0.80, 4.00),
+    "claude-3-5-sonnet": (3.00, 15.00),
+    "claude-sonnet-4": (3.00, 15.00),
+}
+
+
+def _price(model: Optional[str]):
+    if not model:
+        return None
+    prices = {**MODEL_PRICES_PER_MTOK, **settings.LLM_PRICES_PER_MTOK}
+    matches = [prefix for prefix in prices if model.startswith(prefix)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def estimate_cost(model: Optional[str], input_tokens: Optional[int], output_tokens: Optional[int]) -> Optional[float]:
+    price = _price(model)
+    if price is None or input_tokens is None:
+        return None
+    return (input_tokens * price[0] + (output_tokens or 0) * price[1]) / 1_000_000
+
+
+def call_outcome(result: Optional[Dict[str, Any]], error: Optional[str], overloaded: bool) -> str:
+    if error:
+        return "rate_limited" if overloaded else "error"
+    if result.get("status", "ok") != "ok":
+        return "unparsed"
+    return "partial" if result.get("warning") else "ok"
+
+
+def call_error_type(result: Any, error: Optional[str]) -> Optional[str]:
+    if not error:
+        return None
+    if result is None:
+        return "init_failed"
+    if not isinstance(result, dict):
+        return "invalid_response"
+    if result.get("error_status"):
+        return f"http_{result['error_status']}"
+    return result.get("error_type") or "error"
+
+
+def record_llm_call(**fields) -> None:
+    if not settings.LLM_LEDGER_ENABLED:
+        return
+    fields.setdefault("cost_usd", estimate_cost(fields.get("model"), fields.get("input_tokens"), fields.get("output_tokens")))
+    db = SessionLocal()
+    try:
+        db.add(LlmCall(**fields))
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"LLM ledger write failed: {e}")
+    finally:
+        db.close()
@@ -0,0 +1,143 @@
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from ..config import get_settings
+
+settings = get_settings()
+
+OVERLOAD_STATUSES = {429, 503, 529}  # 529: Anthropic "overloaded"
+
+# Outcomes reported to AdaptiveLimiter.release
+SUCCESS = "success"
+OVERLOADED = "overloaded"
+FAILED = "failed"  # timeouts, other errors, unparsed answers: neither grow nor shrink the limit
+
+
+class AdaptiveLimiter:
+    """Token bucket plus AIMD concurrency limit for one provider key.
+
+    The bucket caps the request rate at ``rate_per_minute`` with ``burst``
+    headroom. The concurrency limit grows by one per window of successful
+    calls (additive increase) and halves on a 429/overload response
+    (multiplicative decrease), so in-flight calls settle just under what the
+    provider accepts. A ``Retry-After`` pauses all callers of the key until it
+    passes. Only successful calls count towards the increase, so a failing
+    provider holds the limit where it is.
+
+    Shared by every extraction thread in one process, not across processes:
+    ``get_limiter`` gives each process LLM_RATE_LIMIT_WORKERS' share of the
+    configured rate, so N workers together stay within LLM_RATE_LIMIT_RPM.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate_per_minute: float = 60,
+        burst: int = 10,
+        initial_limit: float = 4,
+        min_limit: float = 1,
+        max_limit: float = 16,
+        default_backoff_seconds: float = 5,
+    ):
+        self.name = name
+        self.rate_per_second = rate_per_minute / 60
+        self.burst = burst
+        self.limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.default_backoff_seconds = default_backoff_seconds
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate_per_second)
+        self._refilled_at = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self.in_flight < int(self.limit) and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.in_flight += 1
+                    self.requests += 1
+                    return True
+                waits = []
+                if now < self._paused_until:
+                    waits.append(self._paused_until - now)
+                if self._tokens < 1:
+                    waits.append((1 - self._tokens) / self.rate_per_second)
+                wait = min(waits) if waits else None  # else: woken by release()
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return False
+                    wait = remaining if wait is None else min(wait, remaining)
+                self._cond.wait(wait)
+
+    def load(self) -> Tuple[bool, float]:
+        """Sort key for picking among pooled keys: keys with spare quota first, then least loaded."""
+        with self._cond:
+            now = time.monotonic()
+            self._refill(now)
+            has_quota = now >= self._paused_until and self._tokens >= 1 and self.in_flight < int(self.limit)
+            return (not has_quota, self.in_flight / self.limit)
+
+    def release(self, outcome: str, retry_after: Optional[float] = None):
+        """End a call with its outcome: SUCCESS, OVERLOADED or FAILED."""
+        with self._cond:
+            self.in_flight -= 1
+            if outcome == OVERLOADED:
+                self.throttled += 1
+                now = time.monotonic()
+                # Calls in flight when the pause started report the same overload:
+                # halve once per pause, not once per call.
+                if now >= self._paused_until:
+                    self.limit = max(self.min_limit, self.limit / 2)
+                pause = retry_after if retry_after is not None else self.default_backoff_seconds
+                self._paused_until = max(self._paused_until, now + pause)
+            elif outcome == SUCCESS:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def snapshot(self) -> Dict:
+        with self._cond:
+            return {
+                "concurrency_limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "paused_for_seconds": max(0.0, self._paused_until - time.monotonic()) or None,
+            }
+
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(name: str) -> AdaptiveLimiter:
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            workers = max(1, settings.LLM_RATE_LIMIT_WORKERS)
+            limiter = AdaptiveLimiter(
+                name,
+                rate_per_minute=settings.LLM_RATE_LIMIT_RPM / workers,
+                burst=max(1, settings.LLM_RATE_LIMIT_BURST // workers),
+                initial_limit=settings.LLM_CONCURRENCY_INITIAL,
+                max_limit=settings.LLM_CONCURRENCY_MAX,
+            )
+            _limiters[name] = limiter
+        return limiter
+
+
+def peek_limiter(name: str) -> Optional[AdaptiveLimiter]:
+    return _limiters.get(name)
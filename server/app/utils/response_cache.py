@@ -0,0 +1,96 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from .change_tracking import get_versions
+from .list_query import Page
+from .responses import dump_json
+
+settings = get_settings()
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == "*" or candidate == etag:
+            return True
+    return False
+
+
+class ResponseCache:
+    """Serialized list responses kept in memory and validated by resource versions.
+
+    The ETag is derived from the request path/query and the change counters of
+    every table the response reads, so a repeat request costs one small lookup
+    and is answered with 304 or with the cached bytes. Loaders may return a
+    ``Page`` whose next cursor is cached and sent as ``X-Next-Cursor``.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, bytes, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, etag: str) -> Optional[Tuple[str, bytes, Dict[str, str]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != etag:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def _put(self, key: str, etag: str, body: bytes, extra_headers: Dict[str, str]):
+        with self._lock:
+            self._entries[key] = (etag, body, extra_headers)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def respond(
+        self,
+        request: Request,
+        db: Session,
+        resources: Iterable[str],
+        schema: Any,
+        loader: Callable[[], Any],
+    ) -> Response:
+        versions = get_versions(db, resources)
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        key = f"{request.url.path}?{query}"
+        fingerprint = key + "|" + ",".join(f"{k}:{v}" for k, v in sorted(versions.items()))
+        etag = '"' + hashlib.sha1(fingerprint.encode("utf-8")).hexdigest() + '"'
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        entry = self._get(key, etag)
+        if entry is None:
+            data = loader()
+            extra_headers = {}
+            if isinstance(data, Page):
+                if data.next_cursor:
+                    extra_headers["X-Next-Cursor"] = data.next_cursor
+                data = data.items
+            body = dump_json(schema, data)
+            self._put(key, etag, body, extra_headers)
+        else:
+            _, body, extra_headers = entry
+
+        return Response(content=body, media_type="application/json", headers={**headers, **extra_headers})
+
+
+response_cache = ResponseCache(max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
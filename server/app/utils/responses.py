@@ -0,0 +1,39 @@
+from functools import lru_cache
+from typing import Any, Mapping, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def dump_json(schema: Any, data: Any) -> bytes:
+    """Validate ORM objects/dicts against ``schema`` and serialize straight to JSON bytes.
+
+    Goes through pydantic-core in one pass, skipping the
+    ``jsonable_encoder`` + ``json.dumps`` round trip used for plain returns.
+    """
+    adapter = _adapter(schema)
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+class SchemaJSONResponse(Response):
+    """JSON response serialized through a response schema; for large list endpoints.
+
+    Keep ``response_model`` on the route for the OpenAPI docs; FastAPI passes
+    a returned ``Response`` through unchanged.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        schema: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ):
+        super().__init__(dump_json(schema, content), status_code=status_code, headers=headers)
@@ -1,8 +1,47 @@
+import os
+import time
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from pathlib import Path
 from ..models.monitoring_upload import MonitoringUpload
 from ..models.metric_sample import MetricSample
+from ..models.deleted_record import DeletedRecord
+from ..models.job_run import JobRun
+from ..models.dashboard_template import DashboardTemplate
+from ..models.llm_call import LlmCall
+from ..services.image_preprocessing import derived_cache_dir
+
+
+def purge_old_tombstones(db: Session, days: int = 30):
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    db.query(DeletedRecord).filter(DeletedRecord.deleted_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+
+
+def purge_old_derived_images(days: int = 30):
+    """Drop preprocessed screenshots (cached by content hash) not written for ``days``."""
+    cache_dir = derived_cache_dir()
+    if not os.path.isdir(cache_dir):
+        return
+    cutoff = time.time() - days * 86400
+    for entry in os.scandir(cache_dir):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def purge_old_job_runs(db: Session, days: int = 30):
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    db.query(JobRun).filter(JobRun.started_at < cutoff).delete(synchronize_session=False)
+    db.commit()
+
+
+def purge_old_llm_calls(db: Session, days: int = 90):
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    db.query(LlmCall).filter(LlmCall.created_at < cutoff).delete(synchronize_session=False)
+    db.commit()
 
 
 def purge_old_monitoring_data(db: Session, days: int = 30):
@@ -13,6 +52,14 @@ def purge_old_monitoring_data(db: Session, days: int = 30):
 
     if old_upload_ids:
         db.query(MetricSample).filter(MetricSample.source_upload_id.in_(old_upload_ids)).delete(synchronize_session=False)
+        # Templates outlive the screenshot they were learned from.
+        db.query(DashboardTemplate).filter(DashboardTemplate.source_upload_id.in_(old_upload_ids)).update(
+            {DashboardTemplate.source_upload_id: None}, synchronize_session=False
+        )
+        # The call ledger has its own retention (purge_old_llm_calls).
+        db.query(LlmCall).filter(LlmCall.upload_id.in_(old_upload_ids)).update(
+            {LlmCall.upload_id: None}, synchronize_session=False
+        )
 
     for upload in old_uploads:
         try:
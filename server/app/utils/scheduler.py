@@ -0,0 +1,297 @@
+import asyncio
+import os
+import random
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..config import get_settings
+from ..database import SessionLocal
+from ..models.job_run import JobRun
+from ..models.scheduled_job import ScheduledJob
+from ..models.scheduler_lease import SchedulerLease
+
+settings = get_settings()
+
+LEADER_LEASE = "scheduler"
+
+
+def _parse_cron_field(field: str, low: int, high: int) -> set:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = int(part)
+            end = high if step > 1 else start
+        if start < low or end > high or start > end or step < 1:
+            raise ValueError(f"cron field {field!r} out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSchedule:
+    """Five-field cron expression (minute hour day-of-month month day-of-week), in UTC.
+
+    Supports ``*``, lists, ranges and ``/step``; day-of-week 0 and 7 are Sunday.
+    """
+
+    def __init__(self, expr: str):
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron expression needs 5 fields: {expr!r}")
+        self.expr = expr
+        self.minutes = _parse_cron_field(fields[0], 0, 59)
+        self.hours = _parse_cron_field(fields[1], 0, 23)
+        self.days = _parse_cron_field(fields[2], 1, 31)
+        self.months = _parse_cron_field(fields[3], 1, 12)
+        self.weekdays = {d % 7 for d in _parse_cron_field(fields[4], 0, 7)}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok  # cron semantics when both are restricted
+
+    def next_after(self, moment: datetime) -> datetime:
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=366 * 5)
+        while candidate < limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"cron expression never fires: {self.expr!r}")
+
+
+class Job:
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[Session], None],
+        every: Optional[timedelta] = None,
+        cron: Optional[str] = None,
+        jitter_seconds: float = 0,
+    ):
+        if (every is None) == (cron is None):
+            raise ValueError("Job needs exactly one of every= or cron=")
+        self.name = name
+        self.func = func
+        self.every = every
+        self.cron = CronSchedule(cron) if cron else None
+        self.jitter_seconds = jitter_seconds
+
+    @property
+    def schedule(self) -> str:
+        return f"cron {self.cron.expr}" if self.cron else f"every {int(self.every.total_seconds())}s"
+
+    def _jitter(self) -> timedelta:
+        return timedelta(seconds=random.uniform(0, self.jitter_seconds)) if self.jitter_seconds else timedelta()
+
+    def first_run(self, now: datetime) -> datetime:
+        # Interval jobs run soon after the first boot, as the old per-worker loops did.
+        return (self.cron.next_after(now) if self.cron else now) + self._jitter()
+
+    def next_run(self, now: datetime) -> datetime:
+        return (self.cron.next_after(now) if self.cron else now + self.every) + self._jitter()
+
+
+class Scheduler:
+    """Runs registered periodic jobs once per interval across all workers.
+
+    Every worker ticks, but only the holder of the ``scheduler`` lease row
+    claims due jobs. Claims are a conditional UPDATE on ``next_run_at``, so a
+    job still runs once even if the lease changes hands mid-tick. A lease row
+    rather than ``pg_advisory_lock`` keeps SQLite and Postgres on one code
+    path and needs no pinned connection.
+    """
+
+    def __init__(self, tick_seconds: float = 30, lease_seconds: float = 90):
+        self.tick_seconds = tick_seconds
+        self.lease_seconds = lease_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self.jobs: Dict[str, Job] = {}
+        self.is_leader = False
+        self._running: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, func: Callable[[Session], None], **schedule) -> Job:
+        job = Job(name, func, **schedule)
+        self.jobs[name] = job
+        return job
+
+    def job(self, name: str, **schedule):
+        def decorator(func):
+            self.register(name, func, **schedule)
+            return func
+        return decorator
+
+    # --- database side (runs in a worker thread) ---
+
+    def _acquire_leadership(self, db: Session, now: datetime) -> bool:
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        renewed = db.execute(
+            update(SchedulerLease)
+            .where(
+                SchedulerLease.name == LEADER_LEASE,
+                or_(SchedulerLease.holder == self.worker_id, SchedulerLease.expires_at < now),
+            )
+            .values(holder=self.worker_id, expires_at=expires_at)
+        ).rowcount
+        if not renewed:
+            if db.get(SchedulerLease, LEADER_LEASE) is not None:
+                db.rollback()
+                return False
+            db.add(SchedulerLease(name=LEADER_LEASE, holder=self.worker_id, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return False
+        return True
+
+    def _ensure_job_rows(self, db: Session, now: datetime):
+        existing = {name for (name,) in db.query(ScheduledJob.name)}
+        for job in self.jobs.values():
+            if job.name not in existing:
+                db.add(ScheduledJob(name=job.name, next_run_at=job.first_run(now), run_count=0, failure_count=0))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()  # another worker registered them first
+
+    def _claim_due(self, db: Session, now: datetime) -> List[Job]:
+        claimed = []
+        due = db.query(ScheduledJob).filter(ScheduledJob.next_run_at <= now).all()
+        for row in due:
+            job = self.jobs.get(row.name)
+            if job is None or job.name in self._running:
+                continue
+            won = db.execute(
+                update(ScheduledJob)
+                .where(ScheduledJob.name == row.name, ScheduledJob.next_run_at == row.next_run_at)
+                .values(next_run_at=job.next_run(now))
+            ).rowcount
+            if won:
+                claimed.append(job)
+        db.commit()
+        return claimed
+
+    def _tick_sync(self) -> List[Job]:
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            self._ensure_job_rows(db, now)
+            self.is_leader = self._acquire_leadership(db, now)
+            return self._claim_due(db, now) if self.is_leader else []
+        finally:
+            db.close()
+
+    def _run_job(self, job: Job):
+        db = SessionLocal()
+        try:
+            run = JobRun(job_name=job.name, worker=self.worker_id, started_at=datetime.utcnow(), status="running")
+            db.add(run)
+            db.commit()
+
+            started = time.perf_counter()
+            error = None
+            try:
+                job.func(db)
+            except Exception as e:
+                db.rollback()
+                error = f"{type(e).__name__}: {e}"
+                print(f"Scheduled job {job.name} failed: {error}")
+            duration_ms = (time.perf_counter() - started) * 1000
+            finished_at = datetime.utcnow()
+
+            run.finished_at = finished_at
+            run.duration_ms = duration_ms
+            run.status = "error" if error else "ok"
+            run.error = error
+            db.execute(
+                update(ScheduledJob)
+                .where(ScheduledJob.name == job.name)
+                .values(
+                    last_run_at=finished_at,
+                    last_status=run.status,
+                    last_duration_ms=duration_ms,
+                    run_count=ScheduledJob.run_count + 1,
+                    failure_count=ScheduledJob.failure_count + (1 if error else 0),
+                )
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    def _release_leadership(self):
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == LEADER_LEASE, SchedulerLease.holder == self.worker_id)
+                .values(expires_at=datetime.utcnow())
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    # --- event loop side ---
+
+    async def _execute(self, job: Job):
+        try:
+            await asyncio.to_thread(self._run_job, job)
+        finally:
+            self._running.pop(job.name, None)
+
+    async def tick(self):
+        for job in await asyncio.to_thread(self._tick_sync):
+            self._running[job.name] = asyncio.create_task(self._execute(job))
+
+    async def run_forever(self):
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                print(f"Scheduler tick failed: {e}")
+            await asyncio.sleep(self.tick_seconds)
+
+    def start(self):
+        if self._task is None and self.jobs:
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        self._task = None
+        if self.is_leader:
+            # Let another worker take over on its next tick instead of waiting out the lease.
+            await asyncio.to_thread(self._release_leadership)
+            self.is_leader = False
+
+
+scheduler = Scheduler(
+    tick_seconds=settings.SCHEDULER_TICK_SECONDS,
+    lease_seconds=settings.SCHEDULER_LEASE_SECONDS,
+)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..models.location import Location
+from ..models.equipment import Equipment
+from ..models.device_item import DeviceItem
+from ..models.metric_definition import MetricDefinition
+from ..models.metric_group import MetricGroup
+from ..models.metric_group_member import MetricGroupMember
+from ..models.alert_rule import AlertRule
+from ..models.seed_version import SeedVersion
+
+SEED_DIR = Path(__file__).resolve().parent.parent / "seed_data"
+
+# Branches added after the first release: their devices are also added, by
+# hostname, to device tables that were seeded before the branch existed.
+LATE_BRANCHES = {"THA-BR", "AMR-BR", "AUR-BR", "CHND-BR", "RAT-BR", "NSK-BR", "NAD-BR", "NAG-BR", "KOL-BR", "DHU-BR"}
+
+# Bump when the loading rules below change in a way the data files do not show.
+SEED_FORMAT_VERSION = "2"
+
+
+def _load(name: str) -> List[Dict[str, Any]]:
+    with open(SEED_DIR / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def seed_fingerprint() -> str:
+    digest = hashlib.sha256(SEED_FORMAT_VERSION.encode("utf-8"))
+    for path in sorted(SEED_DIR.glob("*.json")):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _bulk_insert(db: Session, model, rows: List[Dict[str, Any]]) -> int:
+    if rows:
+        # executemany needs every row to carry the same keys.
+        keys = sorted({k for row in rows for k in row})
+        db.execute(insert(model), [{k: row.get(k) for k in keys} for row in rows])
+    return len(rows)
+
+
+def _insert_missing(db: Session, model, rows: List[Dict[str, Any]], key: Sequence[str]) -> int:
+    """Bulk-insert the rows whose natural key is not in the table yet; never touches existing rows."""
+    columns = [getattr(model, col) for col in key]
+    existing = {tuple(r) for r in db.query(*columns)}
+    return _bulk_insert(db, model, [row for row in rows if tuple(row.get(col) for col in key) not in existing])
+
+
+def _insert_if_empty(db: Session, model, rows: List[Dict[str, Any]]) -> int:
+    """Sample data that admins are expected to edit or prune: only fill an empty table."""
+    if db.query(model.id).first():
+        return 0
+    return _bulk_insert(db, model, rows)
+
+
+def _seed_locations(db: Session) -> int:
+    return _insert_missing(db, Location, _load("locations"), ["code"])
+
+
+def _seed_equipment(db: Session) -> int:
+    return _insert_if_empty(db, Equipment, _load("equipment"))
+
+
+def _seed_device_items(db: Session) -> int:
+    location_ids = {code: id for code, id in db.query(Location.code, Location.id)}
+    rows = []
+    for row in _load("device_items"):
+        row = dict(row)
+        code = row.pop("location_code", None)
+        row["location_id"] = location_ids.get(code) if code else None
+        rows.append((code, row))
+    if not db.query(DeviceItem.id).first():
+        return _bulk_insert(db, DeviceItem, [row for _, row in rows])
+    # Sample devices admins deleted or renamed stay that way; only late branches are topped up
+    return _insert_missing(db, DeviceItem, [row for code, row in rows if code in LATE_BRANCHES], ["hostname"])
+
+
+def _seed_metric_definitions(db: Session) -> int:
+    return _insert_missing(db, MetricDefinition, _load("metric_definitions"), ["key"])
+
+
+def _seed_metric_groups(db: Session) -> int:
+    groups = _load("metric_groups")
+    added = _insert_missing(
+        db, MetricGroup, [{k: v for k, v in g.items() if k != "members"} for g in groups], ["name"]
+    )
+    group_ids = {name: id for name, id in db.query(MetricGroup.name, MetricGroup.id)}
+    members = [
+        {"group_id": group_ids[g["name"]], "metric_key": key}
+        for g in groups
+        for key in g.get("members", [])
+    ]
+    return added + _insert_missing(db, MetricGroupMember, members, ["group_id", "metric_key"])
+
+
+def _seed_alert_rules(db: Session) -> int:
+    group_ids = {name: id for name, id in db.query(MetricGroup.name, MetricGroup.id)}
+    rows = []
+    for row in _load("alert_rules"):
+        row = dict(row)
+        row["group_id"] = group_ids.get(row.pop("group", None))
+        rows.append(row)
+    return _insert_missing(db, AlertRule, rows, ["name", "metric_key"])
+
+
+# Order matters: later loaders resolve codes/names inserted by earlier ones.
+SEEDERS: List[Tuple[str, Callable[[Session], int]]] = [
+    ("locations", _seed_locations),
+    ("equipment", _seed_equipment),
+    ("device items", _seed_device_items),
+    ("metric definitions", _seed_metric_definitions),
+    ("metric groups and members", _seed_metric_groups),
+    ("alert rules", _seed_alert_rules),
+]
+
+
+def run_seeds(db: Session) -> bool:
+    """Apply the seed data files once per fingerprint.
+
+    Returns False when this fingerprint was already applied (warm start). All
+    inserts and the fingerprint row share one transaction, so when several
+    workers boot together the unique fingerprint lets exactly one of them
+    commit and the others roll back.
+    """
+    fingerprint = seed_fingerprint()
+    if db.query(SeedVersion.id).filter(SeedVersion.fingerprint == fingerprint).first():
+        return False
+
+    counts = {name: seeder(db) for name, seeder in SEEDERS}
+    db.add(SeedVersion(fingerprint=fingerprint))
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+
+    for name, count in counts.items():
+        if count:
+            print(f"Seeded {count} {name}")
+    return True
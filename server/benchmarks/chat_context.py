@@ -0,0 +1,113 @@
+"""Chat prompt size and retrieval cost as the estate grows.
+
+    cd server && python -m benchmarks.chat_context [--sizes 264,2000,10000] [--queries 200]
+
+Seeds a throwaway SQLite database, pads device_items with synthetic rows up
+to each size, and compares the chat prompt that pasted every equipment row
+(chat_assistant v2, which also ignored devices) with the retrieval prompt
+(v3, top CHAT_RETRIEVAL_TOP_K records). Reports prompt size, the index
+build time and per-question search latency.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="cims-chat-context-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.sqlite')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+
+from app.config import get_settings  # noqa: E402
+from app.database import SessionLocal, init_db  # noqa: E402
+from app.models.device_item import DeviceItem  # noqa: E402
+from app.models.equipment import Equipment  # noqa: E402
+from app.services.prompt_registry import chat_prompt  # noqa: E402
+from app.services.retrieval_index import RetrievalIndex  # noqa: E402
+from app.utils.hedging import percentile  # noqa: E402
+from app.utils.seeding import run_seeds  # noqa: E402
+
+settings = get_settings()
+
+QUESTIONS = [
+    "which firewalls are in Pune?",
+    "what firmware is the primary firewall on?",
+    "how do I troubleshoot high CPU on the core router",
+    "who supports the storage array",
+    "status of 10.0.11.35",
+    "list backup servers in Mumbai branch",
+]
+
+
+def full_inventory_prompt_chars(db) -> int:
+    """Size of the v2 prompt: every equipment row as indented JSON."""
+    inventory = [
+        {"id": e.id, "name": e.name, "vendor": e.vendor, "model": e.model, "area": e.area, "type": e.type}
+        for e in db.query(Equipment)
+    ]
+    return len(json.dumps(inventory, indent=2))
+
+
+def full_estate_prompt_chars(db) -> int:
+    """What v2 would cost had it included devices too, as the request asked."""
+    devices = [
+        {"id": d.id, "name": d.device_name, "hostname": d.hostname, "ip": d.ip_address, "category": d.category}
+        for d in db.query(DeviceItem)
+    ]
+    return full_inventory_prompt_chars(db) + len(json.dumps(devices, indent=2))
+
+
+def pad_devices(db, target: int):
+    count = db.query(DeviceItem).count()
+    rng = random.Random(count)
+    rows = []
+    for index in range(count, target):
+        site = rng.choice(["PUN", "MUM", "THA", "NAG", "BLR"])
+        role = rng.choice(["SW", "RTR", "FW", "SRV", "STO"])
+        rows.append(DeviceItem(
+            device_name=f"Synthetic {role} {index}",
+            hostname=f"FSL-BR-{site}-{role}-{index:05d}",
+            ip_address=f"10.{rng.randint(3, 250)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
+            category=rng.choice(["Network", "Compute", "Storage", "Security", "Backup"]),
+            status="Active",
+        ))
+    db.add_all(rows)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="264,2000,10000", help="device_items counts")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        run_seeds(db)
+        print(f"{'devices':>8s} {'v2 chars':>9s} {'all-rows chars':>15s} {'v3 chars':>9s} {'build ms':>9s} {'search p50':>11s} {'p95 ms':>7s}")
+        for size in [int(s) for s in args.sizes.split(",")]:
+            pad_devices(db, size)
+            index = RetrievalIndex()
+            started = time.perf_counter()
+            index.search(db, "warm up", 1)
+            build_ms = (time.perf_counter() - started) * 1000
+
+            latencies, v3_chars = [], []
+            for i in range(args.queries):
+                question = QUESTIONS[i % len(QUESTIONS)]
+                started = time.perf_counter()
+                records = index.search(db, question, settings.CHAT_RETRIEVAL_TOP_K)
+                latencies.append((time.perf_counter() - started) * 1000)
+                v3_chars.append(len(chat_prompt(records, index.counts(), settings.CHAT_RETRIEVAL_SNIPPET_CHARS).text))
+            print(
+                f"{size:8d} {full_inventory_prompt_chars(db):9d} {full_estate_prompt_chars(db):15d} "
+                f"{max(v3_chars):9d} {build_ms:9.0f} {percentile(latencies, 0.5):11.2f} {percentile(latencies, 0.95):7.2f}"
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
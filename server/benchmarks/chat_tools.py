@@ -0,0 +1,119 @@
+"""Latency of the chat tools over a large metric history.
+
+    cd server && python -m benchmarks.chat_tools [--samples 500000] [--calls 50] [--without-indexes]
+
+Seeds a throwaway SQLite database, writes synthetic cpu/memory samples for
+the seeded devices and VMs plus a few hundred alerts, and times each tool in
+services/chat_tools.py the way the model would call it. --without-indexes
+drops the metric_samples/alerts indexes added for the tools, to show what
+they buy.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+_tmpdir = tempfile.mkdtemp(prefix="cims-chat-tools-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.sqlite')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.database import SessionLocal, engine, init_db  # noqa: E402
+from app.models.alert import Alert  # noqa: E402
+from app.models.device_item import DeviceItem  # noqa: E402
+from app.models.metric_sample import MetricSample  # noqa: E402
+from app.models.vm_item import VmItem  # noqa: E402
+from app.services import chat_tools  # noqa: E402
+from app.utils.hedging import percentile  # noqa: E402
+from app.utils.seeding import run_seeds  # noqa: E402
+
+TOOL_INDEXES = [
+    "ix_metric_samples_device_key_time", "ix_metric_samples_vm_key_time",
+    "ix_metric_samples_key_time", "ix_alerts_status_detected_at",
+]
+
+
+def seed_history(db, samples: int):
+    devices = [i for (i,) in db.query(DeviceItem.id)]
+    vms = [i for (i,) in db.query(VmItem.id)]
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    assets = [("device_item_id", i) for i in devices] + [("vm_id", i) for i in vms]
+    batch = []
+    for index in range(samples):
+        column, asset_id = assets[index % len(assets)]
+        batch.append({
+            "device_item_id": asset_id if column == "device_item_id" else None,
+            "vm_id": asset_id if column == "vm_id" else None,
+            "metric_key": rng.choice(["cpu_util", "mem_util"]),
+            "value": rng.uniform(5, 99),
+            "unit": "%",
+            "captured_at": now - timedelta(minutes=rng.randint(0, 60 * 24 * 30)),
+        })
+        if len(batch) == 20000:
+            db.bulk_insert_mappings(MetricSample, batch)
+            batch = []
+    if batch:
+        db.bulk_insert_mappings(MetricSample, batch)
+    db.bulk_insert_mappings(Alert, [
+        {
+            "device_item_id": rng.choice(devices), "status": rng.choice(["open", "resolved", "resolved", "ack"]),
+            "severity": rng.choice(["warning", "critical"]), "summary": "synthetic alert",
+            "detected_at": now - timedelta(hours=rng.randint(0, 24 * 30)),
+        }
+        for _ in range(500)
+    ])
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=500000)
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--without-indexes", action="store_true")
+    args = parser.parse_args()
+
+    init_db()
+    db = SessionLocal()
+    try:
+        run_seeds(db)
+        started = time.perf_counter()
+        seed_history(db, args.samples)
+        print(f"seeded {args.samples} samples in {time.perf_counter() - started:.1f} s")
+        if args.without_indexes:
+            with engine.begin() as connection:
+                for name in TOOL_INDEXES:
+                    connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        with engine.begin() as connection:
+            connection.execute(text("ANALYZE"))
+
+        device = db.query(DeviceItem).first()
+        calls = {
+            "find_assets(ip)": lambda: chat_tools.find_assets(db, device.ip_address),
+            "latest_metrics(ip)": lambda: chat_tools.latest_metrics(db, device.ip_address),
+            "top_metrics(cpu, Pune, >85)": lambda: chat_tools.top_metrics(
+                db, "cpu_util", asset_type="vm", location="Pune", min_value=85
+            ),
+            "top_metrics(cpu, 1h)": lambda: chat_tools.top_metrics(db, "cpu_util", since_hours=1),
+            "open_alerts(critical)": lambda: chat_tools.open_alerts(db, severity="critical"),
+        }
+        print(f"{'tool call':30s} {'p50 ms':>8s} {'p95 ms':>8s} {'result chars':>13s}")
+        for name, call in calls.items():
+            latencies = []
+            for _ in range(args.calls):
+                started = time.perf_counter()
+                result = call()
+                latencies.append((time.perf_counter() - started) * 1000)
+            print(
+                f"{name:30s} {percentile(latencies, 0.5):8.2f} {percentile(latencies, 0.95):8.2f} "
+                f"{len(chat_tools.result_json(result)):13d}"
+            )
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
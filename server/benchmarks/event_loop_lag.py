@@ -0,0 +1,143 @@
+"""Event-loop lag while chat answers stream and uploads are extracted.
+
+    cd server && python -m benchmarks.event_loop_lag [--chats 50] [--uploads 0]
+        [--threshold-ms 100] [--blocking]
+
+Runs the real app in-process on one event loop (httpx ASGITransport) with
+CHAT_PROVIDER=replay and LLM_PROVIDER=replay, so chat tokens and extraction
+results come from services/replay_service.py with realistic latency. A probe
+task sleeps in short intervals and records how late it wakes up; any provider
+or route that blocks the loop shows up as lag. Exits non-zero when the worst
+lag exceeds --threshold-ms. The client shares the loop and the GIL with the
+app, so a burst of streams shows some lag even when nothing blocks.
+
+--blocking swaps the replay chat for one that sleeps synchronously between
+tokens, the way the old sync SDK calls behaved, to show what the probe catches.
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="cims-loop-lag-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.sqlite')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+os.environ["CHAT_PROVIDER"] = "replay"
+os.environ["LLM_PROVIDER"] = "replay"
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ.setdefault("LLM_RATE_LIMIT_RPM", "100000")
+os.environ.setdefault("LLM_RATE_LIMIT_BURST", "1000")
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chats", type=int, default=50, help="concurrent chat streams")
+    parser.add_argument("--uploads", type=int, default=0, help="screenshots uploaded alongside the chats")
+    parser.add_argument("--latency-ms", type=float, default=300, help="replay time to first token / extraction")
+    parser.add_argument("--token-ms", type=float, default=5, help="replay delay between chat tokens")
+    parser.add_argument("--probe-ms", type=float, default=5, help="probe sleep interval")
+    parser.add_argument("--threshold-ms", type=float, default=100, help="largest acceptable loop lag")
+    parser.add_argument("--blocking", action="store_true", help="use a chat provider that blocks the loop")
+    return parser.parse_args()
+
+
+ARGS = _parse_args()
+os.environ["LLM_REPLAY_LATENCY_MEDIAN_MS"] = str(ARGS.latency_ms)
+os.environ["LLM_REPLAY_TOKEN_MS"] = str(ARGS.token_ms)
+
+import httpx  # noqa: E402
+from PIL import Image, ImageDraw  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.replay_service import ReplayService  # noqa: E402
+from app.utils.hedging import percentile  # noqa: E402
+
+settings = get_settings()
+
+if ARGS.blocking:
+    async def _blocking_chat_stream(self, message, prompt, history, tools=None):
+        for word in ("blocking", " replay", " answer"):
+            time.sleep(ARGS.token_ms / 1000 or 0.005)
+            yield word
+
+    ReplayService.chat_stream = _blocking_chat_stream
+
+
+async def probe(lags, stop):
+    interval = ARGS.probe_ms / 1000
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, (time.perf_counter() - started - interval) * 1000))
+
+
+def screenshot(index):
+    image = Image.new("RGB", (1280, 400), (24, 27, 31))
+    ImageDraw.Draw(image).text((20, 20), f"Loop lag dashboard {index}", fill=(220, 220, 220))
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+async def chat(client, index, first_token_ms):
+    started = time.perf_counter()
+    async with client.stream("POST", "/api/chat/stream", json={"message": f"status of rack {index}?"}) as response:
+        response.raise_for_status()
+        async for _ in response.aiter_text():
+            if len(first_token_ms) <= index:
+                first_token_ms.append((time.perf_counter() - started) * 1000)
+
+
+async def upload(client, index, data):
+    response = await client.post(
+        "/api/monitoring-uploads/", files={"file": (f"dash-{index}.png", data, "image/png")}
+    )
+    response.raise_for_status()
+
+
+async def main():
+    lags, first_token_ms = [], []
+    stop = asyncio.Event()
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver", timeout=120) as client:
+            (await client.post(
+                "/api/auth/login", json={"email": settings.ADMIN_EMAIL, "password": settings.ADMIN_PASSWORD}
+            )).raise_for_status()
+
+            # Warm-up: first calls import provider modules and image plugins
+            await asyncio.gather(chat(client, 0, []), upload(client, 0, screenshot(0)))
+            shots = [screenshot(index) for index in range(1, ARGS.uploads + 1)]
+
+            probe_task = asyncio.create_task(probe(lags, stop))
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(chat(client, index, first_token_ms) for index in range(ARGS.chats)),
+                *(upload(client, index, data) for index, data in enumerate(shots, 1)),
+            )
+            wall = time.perf_counter() - started
+            stop.set()
+            await probe_task
+
+    worst = max(lags) if lags else 0.0
+    print(
+        f"{ARGS.chats} chats + {ARGS.uploads} uploads in {wall:.2f} s "
+        f"({'blocking' if ARGS.blocking else 'async'} chat provider, replay latency {ARGS.latency_ms:.0f} ms)"
+    )
+    if first_token_ms:
+        print(f"time to first chunk: p50 {percentile(first_token_ms, 0.5):.1f} ms, p95 {percentile(first_token_ms, 0.95):.1f} ms")
+    print(
+        f"loop lag over {len(lags)} probes: p50 {percentile(lags, 0.5) or 0:.1f} ms, "
+        f"p99 {percentile(lags, 0.99) or 0:.1f} ms, max {worst:.1f} ms (threshold {ARGS.threshold_ms:.0f} ms)"
+    )
+    if worst > ARGS.threshold_ms:
+        print("FAIL: the event loop was blocked longer than the threshold")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
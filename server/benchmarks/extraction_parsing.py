@@ -0,0 +1,94 @@
+"""How many uploads survive malformed model output, old parser vs tolerant parser.
+
+    cd server && python -m benchmarks.extraction_parsing [--samples 2000] [--rows 250]
+
+Builds dashboard responses and damages them the way text-mode models do
+(markdown fences, prose around the JSON, truncation at the token limit,
+stray commas, numbers as strings), then counts responses that still parse
+and metric rows recovered. The "legacy" parser is the fence-strip plus
+``\\{.*\\}`` regex the providers used before services/extraction_schema.py.
+"""
+import argparse
+import json
+import random
+import re
+
+from app.services.extraction_schema import METRIC_KEYS, parse_extraction
+
+
+def legacy_parse(text):
+    if text.startswith("```"):
+        text = text.split("```", 2)[1]
+        if text.startswith("json"):
+            text = text[4:]
+    cleaned = text.strip()
+    try:
+        return json.loads(cleaned)
+    except Exception:
+        match = re.search(r"\{.*\}", cleaned, flags=re.DOTALL)
+        if match:
+            try:
+                return json.loads(match.group(0))
+            except Exception:
+                pass
+    return {"metrics": [], "status": "error"}
+
+
+def build_response(rng, rows):
+    metrics = []
+    for host in range(rows // len(METRIC_KEYS)):
+        for key in METRIC_KEYS:
+            metrics.append({
+                "ip_address": f"10.0.{host // 250}.{host % 250}",
+                "key": key,
+                "value": round(rng.uniform(0, 100), 1),
+                "unit": "%",
+                "confidence": 0.9,
+            })
+    return {"metrics": metrics, "raw_text": "...", "confidence": 0.9, "capture_time": None}
+
+
+def damage(rng, text):
+    kind = rng.choice(["clean", "fence", "prose", "truncate", "comma", "string_number"])
+    if kind == "fence":
+        return kind, f"```json\n{text}\n```"
+    if kind == "prose":
+        return kind, f"Here are the metrics I found:\n{text}\nLet me know if you need anything else."
+    if kind == "truncate":
+        return kind, text[: int(len(text) * rng.uniform(0.3, 0.95))]
+    if kind == "comma":
+        return kind, text.replace('"unit": "%"', '"unit": "%",', 1)
+    if kind == "string_number":
+        return kind, re.sub(r'"value": (\d+\.\d)', r'"value": "\1 %"', text, count=3)
+    return kind, text
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=250)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    totals = {"legacy": [0, 0], "tolerant": [0, 0]}
+    expected_rows = 0
+    for _ in range(args.samples):
+        response = build_response(rng, args.rows)
+        expected_rows += len(response["metrics"])
+        _, text = damage(rng, json.dumps(response))
+        for name, parse in (("legacy", legacy_parse), ("tolerant", parse_extraction)):
+            result = parse(text)
+            usable = result.get("status", "ok") == "ok" and bool(result.get("metrics"))
+            totals[name][0] += usable
+            totals[name][1] += len(result.get("metrics") or []) if usable else 0
+
+    print(f"{args.samples} responses, {args.rows} metric rows each")
+    for name, (usable, rows) in totals.items():
+        print(
+            f"{name:9s} usable {usable / args.samples:6.1%}  "
+            f"re-uploads {1 - usable / args.samples:6.1%}  rows recovered {rows / expected_rows:6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Extraction accuracy, payload size and latency per screenshot resolution.
+
+    cd server && python -m benchmarks.image_resolution --fixtures path/to/screens [--sides 1024,1568,2048,0]
+    cd server && python -m benchmarks.image_resolution --dry-run   # sizes only, no LLM calls
+
+A fixture is ``<name>.png`` plus ``<name>.json`` holding the expected
+``{"metrics": [{"ip_address": ..., "key": ..., "value": ...}]}``. Side 0
+means the original file, unprocessed. Live runs use the configured LLM keys
+through MetricsExtractionService, so they cost real tokens.
+"""
+import argparse
+import glob
+import json
+import os
+import tempfile
+import time
+
+from app.config import get_settings
+from app.services.image_preprocessing import prepare_image
+
+settings = get_settings()
+
+
+def _synthetic_fixture(directory: str) -> str:
+    """A 4K dashboard-like PNG, for --dry-run when no fixtures are given."""
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (3840, 2160), (24, 26, 32))
+    draw = ImageDraw.Draw(image)
+    for row in range(40):
+        y = 60 + row * 50
+        draw.text((80, y), f"10.0.{row}.11   cpu_util {row * 2.5:.1f}%   ram_util {40 + row:.1f}%", fill=(220, 220, 220))
+        draw.rectangle((1400, y, 1400 + row * 55, y + 30), fill=(60, 160, 90))
+    path = os.path.join(directory, "synthetic.png")
+    image.save(path)
+    return path
+
+
+def _accuracy(expected, extracted) -> float:
+    want = {(m.get("ip_address"), m["key"]): m.get("value") for m in expected}
+    got = {(m.get("ip_address"), m.get("key")): m.get("value") for m in extracted or []}
+    if not want:
+        return 1.0
+    hits = 0
+    for key, value in want.items():
+        other = got.get(key)
+        if value is None:
+            hits += other is None
+        elif other is not None and abs(float(other) - float(value)) <= 0.5:
+            hits += 1
+    return hits / len(want)
+
+
+def _configure(side: int):
+    settings.IMAGE_PREPROCESSING_ENABLED = side != 0
+    settings.IMAGE_MAX_SIDE = side
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", help="directory of <name>.png + <name>.json")
+    parser.add_argument("--sides", default="768,1024,1568,2048,0")
+    parser.add_argument("--provider", default=None, help="size profile for --dry-run (openai/claude/gemini)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+    sides = [int(s) for s in args.sides.split(",")]
+
+    workdir = tempfile.mkdtemp(prefix="cims-img-bench-")
+    settings.UPLOAD_DIR = workdir  # keep derived images out of the real upload dir
+    images = sorted(glob.glob(os.path.join(args.fixtures, "*.png"))) if args.fixtures else []
+    if not images:
+        if not args.dry_run:
+            parser.error("no fixtures found; pass --fixtures DIR or use --dry-run")
+        images = [_synthetic_fixture(workdir)]
+
+    service = None
+    if not args.dry_run:
+        from app.services.metrics_extraction_service import MetricsExtractionService
+        service = MetricsExtractionService()
+
+    print(f"{'side':>6} {'avg KB':>9} {'prep ms':>8}" + ("" if args.dry_run else f" {'llm ms':>8} {'accuracy':>9}"))
+    for side in sides:
+        _configure(side)
+        sizes, prep_ms, llm_ms, scores = [], [], [], []
+        for path in images:
+            started = time.perf_counter()
+            prepared = prepare_image(path, provider=args.provider)
+            prep_ms.append((time.perf_counter() - started) * 1000)
+            sizes.append(len(prepared.data) / 1024)
+            if service is None:
+                continue
+            with open(path[:-4] + ".json") as f:
+                expected = json.load(f)["metrics"]
+            started = time.perf_counter()
+            result = service.extract_from_image(path)
+            llm_ms.append((time.perf_counter() - started) * 1000)
+            scores.append(_accuracy(expected, result.get("metrics")))
+        line = f"{side or 'orig':>6} {sum(sizes) / len(sizes):9.1f} {sum(prep_ms) / len(prep_ms):8.1f}"
+        if service is not None:
+            line += f" {sum(llm_ms) / len(llm_ms):8.0f} {sum(scores) / len(scores):9.1%}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
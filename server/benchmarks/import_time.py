@@ -0,0 +1,70 @@
+"""Cold-start import report for the API, based on `python -X importtime`.
+
+    cd server && python -m benchmarks.import_time [--budget-ms 2500] [--top 20]
+
+Imports `app.main` in a fresh interpreter, prints the slowest modules by
+cumulative time, and exits non-zero when the total exceeds the budget or
+when an LLM/spreadsheet SDK was imported eagerly (those must stay lazy, see
+app/services/llm_providers.py).
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SERVER_DIR = Path(__file__).resolve().parent.parent
+
+LAZY_MODULES = (
+    "openai", "anthropic", "google.genai", "google.generativeai", "openpyxl",
+    "app.services.gemini_service", "app.services.openai_service", "app.services.anthropic_service",
+)
+
+
+def profile_imports(module: str = "app.main"):
+    """Return [(module, self_us, cumulative_us)] in import order."""
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SERVER_DIR, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--budget-ms", type=float, default=float(os.environ.get("IMPORT_BUDGET_MS", 2500)))
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    rows = profile_imports(args.module)
+    total_ms = next(cum for name, _, cum in rows if name == args.module) / 1000
+
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: r[2], reverse=True)[: args.top]:
+        print(f"{cum_us / 1000:14.1f} {self_us / 1000:9.1f}  {name}")
+
+    failures = []
+    eager = sorted({name for name, _, _ in rows for lazy in LAZY_MODULES if name == lazy or name.startswith(lazy + ".")})
+    if eager:
+        failures.append(f"eagerly imported: {', '.join(eager[:10])}")
+    if total_ms > args.budget_ms:
+        failures.append(f"import {args.module} took {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+
+    print(f"\nimport {args.module}: {total_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
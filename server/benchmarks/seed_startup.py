@@ -0,0 +1,45 @@
+"""Time startup seeding against a throwaway SQLite database.
+
+    cd server && python -m benchmarks.seed_startup
+
+"cold" is the first boot on an empty database (schema + every seed row),
+"warm" is every later boot, which should only read the seed fingerprint.
+"""
+import os
+import sys
+import tempfile
+import time
+
+_tmpdir = tempfile.mkdtemp(prefix="cims-seed-bench-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'bench.sqlite')}"
+
+from app.database import SessionLocal, init_db  # noqa: E402
+from app.utils.seeding import run_seeds  # noqa: E402
+
+
+def _timed_seed():
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        applied = run_seeds(db)
+        return applied, (time.perf_counter() - started) * 1000
+    finally:
+        db.close()
+
+
+def main(warm_runs: int = 20):
+    init_db()
+    applied, cold_ms = _timed_seed()
+    assert applied, "expected the first run to apply the seed data"
+    warm = []
+    for _ in range(warm_runs):
+        applied, elapsed = _timed_seed()
+        assert not applied, "warm start re-applied the seed data"
+        warm.append(elapsed)
+    warm.sort()
+    print(f"cold seed: {cold_ms:8.1f} ms")
+    print(f"warm seed: {warm[len(warm) // 2]:8.1f} ms median, {warm[-1]:.1f} ms max over {warm_runs} runs")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,131 @@
+"""Serialization CPU time and wire size for the largest list payloads.
+
+    cd server && python -m benchmarks.serialization [--repeat 20]
+
+Compares the classic FastAPI path (validate -> jsonable_encoder -> json.dumps),
+orjson over the validated models (when installed) and the pydantic-core
+``dump_json`` used by app/utils/responses.py, then reports raw vs compressed
+bytes at the configured gzip level (and brotli, when installed).
+"""
+import argparse
+import gzip
+import json
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.config import get_settings
+from app.schemas.alerts import AlertResponse
+from app.schemas.device_item import DeviceItemResponse
+from app.schemas.metrics import MetricSampleResponse
+from app.schemas.monitoring_upload import MonitoringUploadListResponse
+from app.utils.responses import dump_json
+
+try:
+    import orjson
+except ImportError:  # optional
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional
+    brotli = None
+
+settings = get_settings()
+NOW = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _rows(n, **fields):
+    return [SimpleNamespace(**{k: (v(i) if callable(v) else v) for k, v in fields.items()}) for i in range(n)]
+
+
+def _metrics(i):
+    return [
+        {"ip_address": f"10.0.{i % 250}.{j}", "key": key, "value": 12.5 + j, "unit": "%", "confidence": 0.9}
+        for j in range(8)
+        for key in ("cpu_util", "ram_util", "disk_util", "net_in", "net_out")
+    ]
+
+
+def payloads():
+    devices = _rows(
+        2000, id=lambda i: i, device_name=lambda i: f"Device {i}", hostname=lambda i: f"FSL-DC-PUN-SRV-{i:04d}",
+        ip_address=lambda i: f"10.0.{i // 250}.{i % 250}", serial_number=None, category="Server",
+        model="ProLiant DL380 Gen10", version="7.0", username="admin", password="secret", location_id=1,
+        equipment_id=None, metric_group_id=1, status="Active", created_at=NOW, updated_at=NOW,
+    )
+    alerts = _rows(
+        200, id=lambda i: i, device_item_id=lambda i: i, vm_id=None, rule_id=1, status="open",
+        severity="warning", detected_at=lambda i: NOW - timedelta(minutes=i), latest_value=91.0,
+        summary="cpu_util > 85 on FSL-DC-PUN-SRV-0001", evidence_upload_id=1,
+    )
+    samples = _rows(
+        500, id=lambda i: i, device_item_id=1, vm_id=None, captured_at=lambda i: NOW - timedelta(minutes=i),
+        metric_key="cpu_util", value=lambda i: float(i % 100), unit="%", source_upload_id=1, confidence=0.9,
+    )
+    uploads = {
+        "items": _rows(
+            100, id=lambda i: i, device_item_id=1, vm_id=None, location_id=1,
+            file_path=lambda i: f"uploads/monitoring/{i}.png", file_name=lambda i: f"dashboard-{i}.png",
+            mime_type="image/png", uploaded_by_user_id=1, capture_time=NOW, dashboard_label="Zabbix",
+            raw_text=lambda i: "CPU 12% RAM 40% Disk 63% " * 80, extracted_metrics=_metrics,
+            parse_status="parsed", parse_confidence=0.9, parse_error=None, created_at=NOW,
+        ),
+        "total": 100, "page": 1, "limit": 100,
+    }
+    return [
+        ("device items (2000)", List[DeviceItemResponse], devices),
+        ("alerts (200)", List[AlertResponse], alerts),
+        ("metric samples (500)", List[MetricSampleResponse], samples),
+        ("monitoring uploads (100)", MonitoringUploadListResponse, uploads),
+    ]
+
+
+def _classic(schema, data):
+    validated = TypeAdapter(schema).validate_python(data, from_attributes=True)
+    return json.dumps(jsonable_encoder(validated), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson(schema, data):
+    adapter = TypeAdapter(schema)
+    return orjson.dumps(adapter.dump_python(adapter.validate_python(data, from_attributes=True)))
+
+
+def _best_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    encoders = [("classic", _classic), ("pydantic-core", dump_json)]
+    if orjson is not None:
+        encoders.insert(1, ("orjson", _orjson))
+
+    for label, schema, data in payloads():
+        print(f"\n{label}")
+        body = b""
+        for name, encode in encoders:
+            ms, body = _best_ms(lambda: encode(schema, data), args.repeat)
+            print(f"  {name:<14} {ms:8.2f} ms")
+        gz_ms, gz = _best_ms(lambda: gzip.compress(body, compresslevel=settings.GZIP_COMPRESS_LEVEL), args.repeat)
+        print(f"  raw {len(body):>9,} B | gzip-{settings.GZIP_COMPRESS_LEVEL} {len(gz):>8,} B in {gz_ms:.2f} ms", end="")
+        if brotli is not None:
+            br_ms, br = _best_ms(lambda: brotli.compress(body, quality=4), args.repeat)
+            print(f" | brotli-4 {len(br):>8,} B in {br_ms:.2f} ms", end="")
+        print()
+
+
+if __name__ == "__main__":
+    main()
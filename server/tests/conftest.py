@@ -0,0 +1,43 @@
+"""Shared fixtures: the app runs against a throwaway SQLite database.
+
+Settings are read once at import, so the environment is set here before
+anything under ``app`` is imported.
+"""
+import os
+import tempfile
+
+_tmpdir = tempfile.mkdtemp(prefix="cims-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_tmpdir, 'test.sqlite')}"
+os.environ["UPLOAD_DIR"] = os.path.join(_tmpdir, "uploads")
+os.environ["SCHEDULER_ENABLED"] = "false"
+os.environ["CHAT_PROVIDER"] = "replay"
+os.environ["LLM_PROVIDER"] = "replay"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.config import get_settings  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+from app.main import app  # noqa: E402
+
+settings = get_settings()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Logged-in admin client; the app starts up (tables, seeds) once per run."""
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/auth/login", json={"email": settings.ADMIN_EMAIL, "password": settings.ADMIN_PASSWORD}
+        )
+        assert response.status_code == 200
+        yield client
+
+
+@pytest.fixture
+def db(client):
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,17 @@
+"""Rolling chat summaries are scoped to the user as well as the session."""
+from app.models.chat_session_summary import ChatSessionSummary
+from app.services.chat_memory import _save_summary
+
+
+def test_two_users_may_share_a_session_id(db):
+    assert _save_summary(None, 1, "shared-session", 0, 10, "first user's summary", "v1")
+    assert _save_summary(None, 2, "shared-session", 0, 12, "second user's summary", "v1")
+    rows = db.query(ChatSessionSummary).filter(ChatSessionSummary.session_id == "shared-session").all()
+    assert sorted(row.user_id for row in rows) == [1, 2]
+
+
+def test_a_second_first_fold_for_the_same_user_loses(db):
+    assert _save_summary(None, 1, "raced-session", 0, 10, "winner", "v1")
+    assert not _save_summary(None, 1, "raced-session", 0, 11, "loser", "v1")
+    row = db.query(ChatSessionSummary).filter(ChatSessionSummary.session_id == "raced-session").one()
+    assert row.summary == "winner"
@@ -0,0 +1,44 @@
+"""Half-open probe accounting in the provider circuit breaker."""
+from app.services import metrics_extraction_service as extraction
+from app.services.metrics_extraction_service import MetricsExtractionService, ProviderSlot
+from app.services.prompt_registry import extraction_prompt
+from app.utils.circuit_breaker import HALF_OPEN, get_breaker
+
+
+def _half_open(name):
+    breaker = get_breaker(name)
+    breaker.open_seconds = 0
+    breaker._trip()
+    return breaker
+
+
+def test_slot_selection_does_not_take_the_probe():
+    breaker = _half_open("test-breaker:peek")
+    service = MetricsExtractionService.__new__(MetricsExtractionService)
+    errors = []
+    slots = list(service._available_slots([ProviderSlot("test-breaker:peek", "replay", "")], errors))
+    assert len(slots) == 1 and not errors
+    # A hedge that was selected but cancelled before running leaves the probe free.
+    assert breaker.available()
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.available() and not breaker.allow()
+
+
+class _ExhaustedLimiter:
+    def acquire(self, timeout=None):
+        return False
+
+
+def test_rate_limit_timeout_hands_the_probe_back(monkeypatch):
+    breaker = _half_open("test-breaker:throttled")
+    monkeypatch.setattr(extraction, "get_limiter", lambda name: _ExhaustedLimiter())
+    service = MetricsExtractionService.__new__(MetricsExtractionService)
+    service.upload_id = None
+    result, error, latency_ms = service._call(
+        ProviderSlot("test-breaker:throttled", "replay", ""), "upload.png", extraction_prompt()
+    )
+    assert result is None and error == "rate limit wait exceeded"
+    assert latency_ms is None  # nothing for the hedge latency stats
+    assert breaker.state == HALF_OPEN and breaker.available()
+    assert breaker.allow()
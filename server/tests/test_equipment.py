@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.database import engine
+from app.models.attachment import Attachment
+from app.models.equipment import Equipment
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def _add_equipment(db, count, tag):
+    for index in range(count):
+        equipment = Equipment(name=f"{tag} {index}", area="Network", type="Switch", vendor="Acme", model="X1")
+        db.add(equipment)
+        db.flush()
+        db.add_all([
+            Attachment(equipment_id=equipment.id, name="guide.pdf", type="pdf", url="/tmp/guide.pdf"),
+            Attachment(equipment_id=equipment.id, name="demo", type="youtube", url="https://example.com/v"),
+            Attachment(equipment_id=equipment.id, name="draft.pdf", type="pdf", url="/tmp/d.pdf", is_published=False),
+        ])
+    db.commit()
+
+
+def _list(client):
+    # Each call follows a write, so the response cache misses and the loader runs
+    with count_queries() as statements:
+        response = client.get("/api/equipment/")
+    assert response.status_code == 200
+    return response.json(), len(statements)
+
+
+def test_equipment_list_query_count_is_constant(client, db):
+    _add_equipment(db, 3, "Small")
+    small, small_queries = _list(client)
+
+    _add_equipment(db, 40, "Large")
+    large, large_queries = _list(client)
+
+    assert len(large) == len(small) + 40
+    assert large_queries == small_queries
+
+    row = next(item for item in large if item["name"] == "Large 0")
+    assert (row["doc_count"], row["video_count"]) == (1, 1)
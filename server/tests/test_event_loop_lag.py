@@ -0,0 +1,86 @@
+"""Nothing on the request path blocks the event loop.
+
+The in-process version of benchmarks/event_loop_lag.py: chat streams and
+uploads run against the replay providers on one loop while a probe task
+records how late its short sleeps wake up. The budget is generous (the
+client shares the loop and the GIL with the app), and can be raised with
+LOOP_LAG_BUDGET_MS on a slow machine.
+"""
+import asyncio
+import io
+import os
+import time
+
+import httpx
+import pytest
+from PIL import Image
+
+from app.main import app
+from app.services import replay_service
+from app.services.replay_service import ReplayService
+
+LOOP_LAG_BUDGET_MS = float(os.environ.get("LOOP_LAG_BUDGET_MS", "150"))
+PROBE_INTERVAL = 0.005
+
+
+@pytest.fixture
+def replay_latency(monkeypatch):
+    monkeypatch.setattr(replay_service.settings, "LLM_REPLAY_LATENCY_MEDIAN_MS", 100)
+    monkeypatch.setattr(replay_service.settings, "LLM_REPLAY_TOKEN_MS", 5)
+
+
+def _screenshot(index):
+    buffer = io.BytesIO()
+    Image.new("RGB", (640, 200), (24, 27, 31 + index)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+async def _worst_lag_ms(cookies, chats=10, uploads=2):
+    lags = []
+    stop = asyncio.Event()
+
+    async def probe():
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(PROBE_INTERVAL)
+            lags.append((time.perf_counter() - started - PROBE_INTERVAL) * 1000)
+
+    async def chat(client, index):
+        async with client.stream("POST", "/api/chat/stream", json={"message": f"status of rack {index}?"}) as response:
+            assert response.status_code == 200
+            async for _ in response.aiter_text():
+                pass
+
+    async def upload(client, index):
+        response = await client.post(
+            "/api/monitoring-uploads/", files={"file": (f"lag-{index}.png", _screenshot(index), "image/png")}
+        )
+        assert response.status_code < 300
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver", cookies=cookies) as client:
+        # Warm-up: provider modules and image plugins import on first use
+        await asyncio.gather(chat(client, 0), upload(client, 0))
+        probe_task = asyncio.create_task(probe())
+        await asyncio.gather(
+            *(chat(client, index) for index in range(chats)),
+            *(upload(client, index) for index in range(1, uploads + 1)),
+        )
+        stop.set()
+        await probe_task
+    return max(lags)
+
+
+def test_chat_and_uploads_do_not_block_the_loop(client, replay_latency):
+    worst = asyncio.run(_worst_lag_ms(dict(client.cookies)))
+    assert worst < LOOP_LAG_BUDGET_MS, f"event loop blocked for {worst:.0f} ms"
+
+
+def test_probe_catches_a_blocking_provider(client, replay_latency, monkeypatch):
+    async def blocking_chat_stream(self, message, prompt, history, tools=None):
+        time.sleep(LOOP_LAG_BUDGET_MS * 2 / 1000)
+        yield "blocking answer"
+
+    monkeypatch.setattr(ReplayService, "chat_stream", blocking_chat_stream)
+    worst = asyncio.run(_worst_lag_ms(dict(client.cookies), chats=2, uploads=0))
+    assert worst >= LOOP_LAG_BUDGET_MS
@@ -0,0 +1,55 @@
+"""Failover across the provider chain, with the provider calls faked out."""
+import pytest
+
+from app.services import metrics_extraction_service as extraction
+from app.services.metrics_extraction_service import MetricsExtractionService, ProviderSlot
+from app.services.prompt_registry import extraction_prompt
+
+LEAKY_KEY = "sk-ant-" + "x" * 24 + "LEAK"
+
+
+def _service(answers):
+    """A service over one slot per answer; each slot's call returns its answer."""
+    service = MetricsExtractionService.__new__(MetricsExtractionService)
+    service.upload_id = None
+    service.provider_name = "replay"
+    service.provider_error = None
+    service.fast_chain = []
+    service.chain = [ProviderSlot(f"test-failover:{name}", "replay", "") for name in answers]
+    calls = []
+
+    def fake_call(slot, file_path, prompt):
+        name = slot.breaker_name.split(":", 1)[1]
+        calls.append(name)
+        result = dict(answers[name], provider=name)
+        return result, result.pop("error", None), 1.0
+
+    service._call = fake_call
+    return service, calls
+
+
+UNPARSED = {"metrics": [], "raw_text": "no json here", "confidence": 0.0, "status": "error",
+            "warning": f"model said api_key={LEAKY_KEY}"}
+PARSED = {"metrics": [{"key": "cpu_util", "value": 12.0}], "raw_text": "", "confidence": 0.9, "status": "ok"}
+
+
+@pytest.fixture(params=[False, True], ids=["sequential", "hedged"])
+def hedging(request, monkeypatch):
+    monkeypatch.setattr(extraction.settings, "LLM_HEDGE_ENABLED", request.param)
+    return request.param
+
+
+def test_unparsed_answer_fails_over_to_next_provider(hedging):
+    service, calls = _service({"first": UNPARSED, "second": PARSED})
+    result = service._extract_single("upload.png", extraction_prompt())
+    assert result["status"] == "ok"
+    assert calls == ["first", "second"]
+    assert result["provider"] == "second"
+
+
+def test_unparsed_fallback_is_sanitized_when_nothing_parses(hedging):
+    service, _ = _service({"first": UNPARSED, "second": {"error": f"401 Incorrect API key provided: {LEAKY_KEY}"}})
+    result = service._extract_single("upload.png", extraction_prompt())
+    assert result["status"] == "error"
+    assert result["provider"] == "first"
+    assert LEAKY_KEY not in result["warning"]
@@ -0,0 +1,28 @@
+"""Number coercion in the shared extraction contract."""
+import pytest
+
+from app.services.extraction_schema import normalize_extraction, parse_number
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("87%", 87.0),
+    ("-3.5", -3.5),
+    ("1,234 Mbps", 1234.0),
+    ("1,234.5", 1234.5),
+    ("1,234,567.8 ops/s", 1234567.8),
+    ("1.234,5", 1234.5),
+    ("12,5 %", 12.5),
+    ("0,05", 0.05),
+    ("1.2e3", 1200.0),
+    ("2E-2", 0.02),
+    ("192.168.1.10", 192.168),
+    ("n/a", None),
+])
+def test_parse_number(text, expected):
+    assert parse_number(text) == expected
+
+
+def test_string_values_are_coerced():
+    result = normalize_extraction({"metrics": [{"key": "net_in", "value": "1,234 Mbps", "confidence": "0,9"}]})
+    assert result["metrics"][0]["value"] == 1234.0
+    assert result["metrics"][0]["confidence"] == 0.9
@@ -0,0 +1,17 @@
+"""Strip planning for tall dashboards."""
+import pytest
+
+from app.services.image_tiling import plan_strips
+
+
+def test_strips_cover_the_image_with_overlap():
+    strips = plan_strips(2500, [], tile_height=1000, overlap=120)
+    assert strips == [(0, 1000), (880, 1880), (1760, 2500)]
+
+
+@pytest.mark.parametrize("tile_height,overlap", [(1000, 1000), (1000, 5000), (0, 120), (-10, 0)])
+def test_bad_overlap_settings_still_terminate(tile_height, overlap):
+    strips = plan_strips(5000, [], tile_height=tile_height, overlap=overlap)
+    assert strips[0][0] == 0 and strips[-1][1] == 5000
+    assert all(top < bottom for top, bottom in strips)
+    assert all(later[0] > earlier[0] for earlier, later in zip(strips, strips[1:]))
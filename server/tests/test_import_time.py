@@ -0,0 +1,15 @@
+import os
+
+from benchmarks.import_time import LAZY_MODULES, profile_imports
+
+BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", 2500))
+
+
+def test_app_import_keeps_provider_sdks_lazy_and_within_budget():
+    rows = profile_imports("app.main")
+
+    eager = sorted({name for name, _, _ in rows for lazy in LAZY_MODULES if name == lazy or name.startswith(lazy + ".")})
+    assert eager == []
+
+    total_ms = next(cumulative for name, _, cumulative in rows if name == "app.main") / 1000
+    assert total_ms <= BUDGET_MS, f"import app.main took {total_ms:.0f} ms (budget {BUDGET_MS:.0f} ms)"
@@ -0,0 +1,50 @@
+import io
+import zipfile
+
+from app.models.device_item import DeviceItem
+
+HEADER = "device_name,hostname,ip_address,serial_number,category\n"
+
+
+def _import(client, content: bytes, filename="devices.csv"):
+    return client.post("/api/device-items/import", files={"file": (filename, content, "text/csv")})
+
+
+def _devices(db, hostname):
+    return sorted(
+        (d.device_name, d.ip_address, d.serial_number)
+        for d in db.query(DeviceItem).filter(DeviceItem.hostname == hostname)
+    )
+
+
+def test_shared_hostname_with_different_ip_is_a_new_device(client, db):
+    rows = "Node A,clu-h1,192.0.2.1,S1,Compute\nNode B,clu-h1,192.0.2.2,,Compute\n"
+    response = _import(client, (HEADER + rows).encode())
+    assert response.status_code == 200
+    assert response.json()["created"] == 2
+    assert _devices(db, "clu-h1") == [("Node A", "192.0.2.1", "S1"), ("Node B", "192.0.2.2", None)]
+
+
+def test_blank_cells_keep_stored_values(client, db):
+    _import(client, (HEADER + "Blank Test,blank-h1,192.0.2.10,SER-10,Compute\n").encode())
+
+    response = _import(client, (HEADER + "Blank Test,blank-h1,192.0.2.10,,Compute\n").encode())
+    assert response.status_code == 200
+    assert (response.json()["created"], response.json()["unchanged"]) == (0, 1)
+    assert _devices(db, "blank-h1") == [("Blank Test", "192.0.2.10", "SER-10")]
+
+
+def test_non_utf8_csv_is_rejected(client):
+    response = _import(client, (HEADER + "Café switch,latin-h1,192.0.2.20,,Network\n").encode("latin-1"))
+    assert response.status_code == 400
+
+
+def test_corrupt_xlsx_is_rejected(client):
+    response = _import(client, b"not a zip file", filename="devices.xlsx")
+    assert response.status_code == 400
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("hello.txt", "a zip, but not a workbook")
+    response = _import(client, buffer.getvalue(), filename="devices.xlsx")
+    assert response.status_code == 400
@@ -0,0 +1,71 @@
+"""Keyset pagination in utils/list_query.py."""
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.database import engine
+from app.models.device_item import DeviceItem
+from app.models.location import Location
+from app.utils.list_query import ListParams, ListQuery
+
+QUERY = ListQuery(
+    DeviceItem,
+    {
+        "id": DeviceItem.id,
+        "hostname": DeviceItem.hostname,
+        "location_name": Location.name,
+        "updated_at": DeviceItem.updated_at,
+    },
+    joins=[(Location, DeviceItem.location_id == Location.id)],
+)
+
+
+def _params(sort=None, limit=None, cursor=None):
+    return ListParams(sort=sort, limit=limit, cursor=cursor, fields=None, q=None)
+
+
+def _cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def test_pages_walk_the_whole_list_in_order(client, db):
+    ids, cursor = [], None
+    while True:
+        page = QUERY.fetch(db, _params(limit=7, cursor=cursor))
+        ids += [item["id"] for item in page.items]
+        cursor = page.next_cursor
+        if not cursor:
+            break
+    assert ids == sorted(i for (i,) in db.query(DeviceItem.id))
+
+
+def _plan(db, params):
+    """EXPLAIN QUERY PLAN of the page query ``fetch`` sends."""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        QUERY.fetch(db, params)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    statement, parameters = executed[-1]
+    return " / ".join(row[-1] for row in db.connection().exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters))
+
+
+def test_id_keyset_seeks_on_the_primary_key(client, db):
+    plan = _plan(db, _params(limit=5, cursor=_cursor([3])))
+    assert "SEARCH device_items USING INTEGER PRIMARY KEY" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("cursor", [_cursor(["not a date", 1]), _cursor([12, 1]), "%%%"])
+def test_tampered_cursor_is_a_bad_request(client, db, cursor):
+    with pytest.raises(HTTPException) as raised:
+        QUERY.fetch(db, _params(sort="updated_at", limit=5, cursor=cursor))
+    assert raised.value.status_code == 400
@@ -0,0 +1,43 @@
+"""AIMD behaviour of the per-key adaptive limiter."""
+from app.utils import rate_limiter
+from app.utils.rate_limiter import FAILED, OVERLOADED, SUCCESS, AdaptiveLimiter
+
+
+def test_one_decrease_per_pause():
+    limiter = AdaptiveLimiter("test-limiter", burst=8, initial_limit=8, default_backoff_seconds=30)
+    for _ in range(4):
+        assert limiter.acquire(timeout=0)
+    # Four calls that were in flight together all come back overloaded.
+    for _ in range(4):
+        limiter.release(OVERLOADED)
+    assert limiter.limit == 4
+    assert limiter.throttled == 4
+
+
+def test_overload_after_the_pause_decreases_again():
+    limiter = AdaptiveLimiter("test-limiter", burst=8, initial_limit=8)
+    assert limiter.acquire(timeout=0)
+    limiter.release(OVERLOADED, retry_after=0)
+    assert limiter.acquire(timeout=0)
+    limiter.release(OVERLOADED, retry_after=0)
+    assert limiter.limit == 2
+
+
+def test_only_successes_raise_the_limit():
+    limiter = AdaptiveLimiter("test-limiter", burst=8, initial_limit=4)
+    for _ in range(4):
+        assert limiter.acquire(timeout=0)
+        limiter.release(FAILED)
+    assert limiter.limit == 4
+    assert limiter.acquire(timeout=0)
+    limiter.release(SUCCESS)
+    assert limiter.limit == 4.25
+
+
+def test_rate_is_split_between_workers(monkeypatch):
+    monkeypatch.setattr(rate_limiter.settings, "LLM_RATE_LIMIT_WORKERS", 4)
+    monkeypatch.setattr(rate_limiter.settings, "LLM_RATE_LIMIT_RPM", 120)
+    monkeypatch.setattr(rate_limiter.settings, "LLM_RATE_LIMIT_BURST", 10)
+    limiter = rate_limiter.get_limiter("test-limiter:split")
+    assert limiter.rate_per_second == 0.5
+    assert limiter.burst == 2
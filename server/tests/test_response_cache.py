@@ -0,0 +1,37 @@
+"""ETag revalidation of cached list responses (utils/response_cache.py)."""
+from sqlalchemy import update
+
+from app.models.location import Location
+
+
+def _get(client, etag=None):
+    headers = {"If-None-Match": etag} if etag else {}
+    return client.get("/api/locations/", headers=headers)
+
+
+def test_etag_revalidation_and_invalidation(client, db):
+    first = _get(client)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    repeat = _get(client, etag)
+    assert repeat.status_code == 304
+    assert repeat.headers["ETag"] == etag and not repeat.content
+
+    # An ORM flush on a tracked table changes the ETag ...
+    db.add(Location(name="Cache Test Site", code="CACHE-1", type="BR"))
+    db.commit()
+    after_flush = _get(client, etag)
+    assert after_flush.status_code == 200
+    assert after_flush.headers["ETag"] != etag
+    assert "CACHE-1" in [row["code"] for row in after_flush.json()]
+
+    # ... and so does a bulk UPDATE that never goes through the flush.
+    etag = after_flush.headers["ETag"]
+    db.execute(update(Location).where(Location.code == "CACHE-1").values(name="Cache Test Site (renamed)"))
+    db.commit()
+    after_bulk = _get(client, etag)
+    assert after_bulk.status_code == 200
+    assert after_bulk.headers["ETag"] != etag
+    assert "Cache Test Site (renamed)" in [row["name"] for row in after_bulk.json()]
+    assert _get(client, after_bulk.headers["ETag"]).status_code == 304
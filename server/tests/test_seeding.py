@@ -0,0 +1,58 @@
+"""Seeding an already-populated database (utils/seeding.py)."""
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models.device_item import DeviceItem
+from app.models.location import Location
+from app.models.seed_version import SeedVersion
+from app.utils.seeding import run_seeds
+
+
+@pytest.fixture
+def fresh_db(tmp_path):
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_path, 'seed.sqlite')}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _reseed(db):
+    """Run the seeds again, as after a change to the seed data files."""
+    db.query(SeedVersion).delete()
+    db.commit()
+    assert run_seeds(db)
+
+
+def test_upgraded_database_gets_late_branches_without_duplicates(fresh_db):
+    db = fresh_db
+    assert run_seeds(db)
+    total = db.query(DeviceItem).count()
+
+    # An operator prunes and edits sample devices ...
+    deleted = db.query(DeviceItem).filter(DeviceItem.hostname == "FSL-DC-PUN-COR-RTR-01").one()
+    db.delete(deleted)
+    edited = db.query(DeviceItem).filter(DeviceItem.hostname == "FSL-DC-PUN-COR-RTR-02").one()
+    edited.hostname, edited.ip_address = "core-rtr-02", "192.0.2.2"
+    # ... and the database predates the Ratnagiri branch.
+    ratnagiri = db.query(Location).filter(Location.code == "RAT-BR").one()
+    db.query(DeviceItem).filter(DeviceItem.location_id == ratnagiri.id).delete()
+    db.delete(ratnagiri)
+    db.commit()
+    without_ratnagiri = db.query(DeviceItem).count()
+
+    _reseed(db)
+
+    ratnagiri = db.query(Location).filter(Location.code == "RAT-BR").one()
+    added = db.query(DeviceItem).filter(DeviceItem.location_id == ratnagiri.id).count()
+    assert added > 0
+    assert db.query(DeviceItem).count() == without_ratnagiri + added == total - 1
+    assert not db.query(DeviceItem).filter(DeviceItem.hostname.like("FSL-DC-PUN-COR-RTR-0%")).count()
+    assert not db.query(DeviceItem).filter(DeviceItem.location_id.is_(None)).count()
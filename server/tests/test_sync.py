@@ -0,0 +1,39 @@
+from datetime import datetime, timedelta
+
+from app.models.location import Location
+
+
+def _changes(client, since):
+    response = client.get("/api/sync/changes", params={"since": since, "resources": "locations"})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_cursor_is_current_when_nothing_changed(client):
+    snapshot = _changes(client, None)
+    assert snapshot["full"]
+    assert datetime.fromisoformat(snapshot["cursor"]) > datetime.utcnow() - timedelta(minutes=1)
+
+
+def test_late_commit_with_older_stamp_is_delivered(client, db):
+    cursor = _changes(client, None)["cursor"]
+    # Stamped at flush, a few seconds before the cursor, but committed after it was issued
+    stamped = datetime.fromisoformat(cursor) - timedelta(seconds=5)
+    location = Location(name="Late Commit Site", code="LATE-1", updated_at=stamped)
+    db.add(location)
+    db.commit()
+
+    ids = [row["id"] for row in _changes(client, cursor)["locations"]["upserted"]]
+    assert location.id in ids
+
+
+def test_timezone_aware_cursor(client):
+    since = (datetime.utcnow() - timedelta(minutes=5)).isoformat() + "Z"
+    changes = _changes(client, since)
+    assert not changes["full"]
+    assert "+" not in changes["cursor"]
+
+
+def test_invalid_cursor(client):
+    response = client.get("/api/sync/changes", params={"since": "yesterday"})
+    assert response.status_code == 400
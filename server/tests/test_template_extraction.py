@@ -0,0 +1,95 @@
+"""Template reads and template learning, with the OCR engine faked out."""
+import pytest
+from PIL import Image
+
+from app.models.dashboard_template import DashboardTemplate
+from app.services import template_extraction
+from app.services.template_extraction import TemplateLearningError, extract_with_template, learn_regions
+
+
+class FakeOcr:
+    """Stands in for pytesseract: canned text per crop, canned words per page."""
+
+    class Output:
+        DICT = "dict"
+
+    def __init__(self, texts=(), words=()):
+        self.texts = list(texts)
+        self.words = list(words)
+
+    def image_to_string(self, image, config=None):
+        return self.texts.pop(0)
+
+    def image_to_data(self, image, output_type=None):
+        return {
+            "text": [text for text, _ in self.words],
+            "left": [box[0] for _, box in self.words],
+            "top": [box[1] for _, box in self.words],
+            "width": [box[2] - box[0] for _, box in self.words],
+            "height": [box[3] - box[1] for _, box in self.words],
+        }
+
+
+@pytest.fixture
+def screenshot(tmp_path):
+    path = tmp_path / "dashboard.png"
+    Image.new("RGB", (1000, 500), (24, 27, 31)).save(path)
+    return str(path)
+
+
+def _template(width=1000, height=500):
+    return DashboardTemplate(
+        name="core routers", width=width, height=height,
+        regions=[
+            {"ip_address": "10.0.1.11", "key": "cpu_util", "unit": "%", "box": [0.1, 0.1, 0.2, 0.15]},
+            {"ip_address": "10.0.1.11", "key": "net_in", "unit": "Mbps", "box": [0.3, 0.1, 0.4, 0.15]},
+        ],
+    )
+
+
+def _use_ocr(monkeypatch, ocr):
+    monkeypatch.setattr(template_extraction, "_ocr", lambda: ocr)
+
+
+def test_template_read(monkeypatch, screenshot):
+    _use_ocr(monkeypatch, FakeOcr(texts=["42.5%", "1,234"]))
+    result = extract_with_template(_template(), screenshot)
+    assert result["status"] == "ok" and result["extractor"] == "template"
+    assert [(m["key"], m["value"]) for m in result["metrics"]] == [("cpu_util", 42.5), ("net_in", 1234.0)]
+
+
+def test_out_of_range_value_falls_back_to_the_llm(monkeypatch, screenshot):
+    _use_ocr(monkeypatch, FakeOcr(texts=["425", "1,234"]))  # a dropped decimal point: 425 %
+    assert extract_with_template(_template(), screenshot) is None
+
+
+def test_aspect_ratio_mismatch_falls_back_to_the_llm(monkeypatch, screenshot):
+    ocr = FakeOcr(texts=["42.5", "1,234"])
+    _use_ocr(monkeypatch, ocr)
+    assert extract_with_template(_template(width=1000, height=1000), screenshot) is None
+    assert len(ocr.texts) == 2  # nothing was read
+
+
+def test_learning_picks_the_duplicate_value_on_the_ip_line(monkeypatch, screenshot):
+    _use_ocr(monkeypatch, FakeOcr(words=[
+        ("10.0.1.11", (20, 100, 120, 120)), ("37", (400, 102, 430, 118)),
+        ("10.0.1.12", (20, 200, 120, 220)), ("37", (400, 202, 430, 218)),
+    ]))
+    learned = learn_regions(screenshot, [{"ip_address": "10.0.1.12", "key": "cpu_util", "value": 37, "unit": "%"}])
+    (region,) = learned["regions"]
+    assert (learned["width"], learned["height"]) == (1000, 500)
+    # The word box at y 202-218 (padded by a quarter of its size), not the one at y 102-118
+    assert region["box"][1] == pytest.approx(198 / 500) and region["box"][3] == pytest.approx(222 / 500)
+
+
+def test_learning_without_the_ip_cannot_choose(monkeypatch, screenshot):
+    _use_ocr(monkeypatch, FakeOcr(words=[("37", (400, 102, 430, 118)), ("37", (400, 202, 430, 218))]))
+    with pytest.raises(TemplateLearningError):
+        learn_regions(screenshot, [{"ip_address": None, "key": "cpu_util", "value": 37}])
+
+
+def test_ocr_engine_is_probed_once():
+    template_extraction._ocr.cache_clear()
+    template_extraction._ocr()
+    template_extraction._ocr()
+    assert template_extraction._ocr.cache_info().misses == 1